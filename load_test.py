@@ -0,0 +1,218 @@
+"""
+Load generator: many concurrent MCP sessions against run_server.py
+
+Starts N server processes over stdio (the server's only transport), each
+with its own client session, and replays a weighted mix of tool calls
+for a fixed duration. PokéAPI is replaced by stub_pokeapi.py with the
+given latency unless --pokeapi-url points elsewhere. Reports throughput,
+p50/p95/p99 latency and the error rate, overall and per tool.
+
+    python load_test.py --sessions 8 --concurrency 2 --duration 30 --mix get_pokemon=8,simulate_battle=2 --latency 0.05
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).parent
+sys.path.insert(0, str(ROOT))
+
+from stub_pokeapi import SPECIES, serve
+
+# Arguments of each tool the mix can call, drawn from the species pool
+CALLS: Dict[str, Callable[[random.Random, List[str]], Dict]] = {
+    "get_pokemon": lambda rng, pool: {"name_or_id": rng.choice(pool)},
+    "simulate_battle": lambda rng, pool: dict(zip(("pokemon1", "pokemon2"), rng.sample(pool, 2))),
+    "simulate_team_battle": lambda rng, pool: {"team1": rng.sample(pool, 3), "team2": rng.sample(pool, 3)},
+    "analyze_team": lambda rng, pool: {"team": rng.sample(pool, 3)},
+}
+
+@dataclass
+class Sample:
+    tool: str
+    seconds: float
+    ok: bool
+
+@dataclass
+class SessionStats:
+    samples: List[Sample] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)  # Session-level failures, e.g. the server did not start
+    finished: float = 0.0  # perf_counter() when the last call returned
+
+def parse_mix(text: str) -> List[Tuple[str, float]]:
+    mix = []
+    for part in text.split(","):
+        tool, _, weight = part.partition("=")
+        tool = tool.strip()
+        if tool not in CALLS:
+            raise SystemExit(f"Unknown tool in --mix: {tool} (choose from {', '.join(CALLS)})")
+        mix.append((tool, float(weight or 1)))
+    return mix
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(p / 100 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+def summarize(samples: List[Sample], seconds: float) -> Dict:
+    latencies = sorted(s.seconds for s in samples)
+    errors = sum(not s.ok for s in samples)
+    return {
+        "calls": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "throughput": round(len(samples) / seconds, 2) if seconds else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+    }
+
+async def run_session(index: int, args, env: Dict[str, str], mix: List[Tuple[str, float]], pool: List[str],
+                      ready: asyncio.Event, started: List[int], errlog) -> SessionStats:
+    """One server process and client session: wait for every session, then call tools until the deadline"""
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    stats = SessionStats()
+    rng = random.Random(args.seed + index)
+    tools, weights = zip(*mix)
+    params = StdioServerParameters(command=args.server[0], args=args.server[1:], env=env, cwd=str(ROOT))
+    try:
+        async with stdio_client(params, errlog=errlog) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await asyncio.wait_for(session.initialize(), args.startup_timeout)
+                started.append(index)
+                await ready.wait()
+                deadline = time.perf_counter() + args.duration
+
+                async def caller():
+                    while time.perf_counter() < deadline:
+                        tool = rng.choices(tools, weights)[0]
+                        start = time.perf_counter()
+                        try:
+                            result = await asyncio.wait_for(session.call_tool(tool, CALLS[tool](rng, pool)), args.call_timeout)
+                            ok = not result.isError and not any(
+                                getattr(c, "text", "").startswith("Error") for c in result.content)
+                        except Exception:
+                            ok = False
+                        stats.samples.append(Sample(tool, time.perf_counter() - start, ok))
+
+                await asyncio.gather(*(caller() for _ in range(args.concurrency)))
+                stats.finished = time.perf_counter()
+    except Exception as e:
+        stats.errors.append(f"session {index}: {type(e).__name__}: {e}")
+    return stats
+
+async def run(args) -> Dict:
+    mix = parse_mix(args.mix)
+    pool = args.pokemon or list(SPECIES)
+    stub = None
+    if args.pokeapi_url:
+        base_url, graphql_url = args.pokeapi_url, args.graphql_url
+    else:
+        stub = serve(port=0, latency=args.latency, jitter=args.jitter)
+        threading.Thread(target=stub.serve_forever, daemon=True).start()
+        root = f"http://127.0.0.1:{stub.server_address[1]}"
+        base_url, graphql_url = root + "/api/v2", root + "/graphql"
+
+    cache_dir = args.cache_dir or tempfile.mkdtemp(prefix="pokemon-load-")
+    env = dict(os.environ, POKEAPI_BASE_URL=base_url, CACHE_DIRECTORY=cache_dir,
+               BATTLE_STORE_PATH=os.path.join(cache_dir, "battles.sqlite3"))
+    if graphql_url:
+        env["GRAPHQL_URL"] = graphql_url
+    for pair in args.env:
+        key, _, value = pair.partition("=")
+        env[key] = value
+
+    ready = asyncio.Event()
+    started: List[int] = []
+    errlog = open(args.server_log, "a") if args.server_log else open(os.devnull, "w")
+    try:
+        tasks = [asyncio.ensure_future(run_session(i, args, env, mix, pool, ready, started, errlog))
+                 for i in range(args.sessions)]
+        # Start the clock once every session is up (or has failed)
+        while len(started) + sum(t.done() for t in tasks) < args.sessions:
+            await asyncio.sleep(0.05)
+        print(f"{len(started)}/{args.sessions} sessions up; running for {args.duration}s", file=sys.stderr)
+        ready.set()
+        start = time.perf_counter()
+        results = await asyncio.gather(*tasks)
+    finally:
+        errlog.close()
+        if stub is not None:
+            stub.shutdown()
+
+    samples = [s for stats in results for s in stats.samples]
+    # Throughput over the load window only, not the servers' shutdown
+    elapsed = max([stats.finished - start for stats in results if stats.finished] or [args.duration])
+    report = {
+        "sessions": args.sessions,
+        "sessions_started": len(started),
+        "concurrency_per_session": args.concurrency,
+        "duration_s": round(elapsed, 2),
+        "stub_latency_s": None if args.pokeapi_url else args.latency,
+        "overall": summarize(samples, elapsed),
+        "per_tool": {tool: summarize([s for s in samples if s.tool == tool], elapsed) for tool, _ in mix},
+        "session_errors": [e for stats in results for e in stats.errors],
+    }
+    return report
+
+def print_report(report: Dict):
+    print(f"{report['sessions_started']}/{report['sessions']} sessions x {report['concurrency_per_session']} "
+          f"in flight, {report['duration_s']}s")
+    header = f"{'tool':<22}{'calls':>8}{'errors':>8}{'calls/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    print(header)
+    print("-" * len(header))
+    rows = list(report["per_tool"].items()) + [("overall", report["overall"])]
+    for tool, s in rows:
+        print(f"{tool:<22}{s['calls']:>8}{s['errors']:>8}{s['throughput']:>10}{s['p50_ms']:>10}"
+              f"{s['p95_ms']:>10}{s['p99_ms']:>10}{s['max_ms']:>10}")
+    print(f"error rate: {report['overall']['error_rate']:.2%}")
+    for error in report["session_errors"]:
+        print(f"  {error}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent MCP session load generator")
+    parser.add_argument("--sessions", type=int, default=4, help="Server processes / client sessions")
+    parser.add_argument("--concurrency", type=int, default=1, help="Calls in flight per session")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load after all sessions are up")
+    parser.add_argument("--mix", default="get_pokemon=8,simulate_battle=2",
+                        help=f"Weighted tool mix, tool=weight,... ({', '.join(CALLS)})")
+    parser.add_argument("--pokemon", nargs="*", help="Species to draw from (default: every stub species)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub PokéAPI latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds around the stub latency")
+    parser.add_argument("--pokeapi-url", help="Use this PokéAPI instead of starting the stub")
+    parser.add_argument("--graphql-url", help="GraphQL endpoint to pair with --pokeapi-url")
+    parser.add_argument("--cache-dir", help="Server cache directory (default: a fresh temporary one)")
+    parser.add_argument("--env", nargs="*", default=[], help="Extra KEY=VALUE settings for the servers")
+    parser.add_argument("--server", nargs="+", default=[sys.executable, str(ROOT / "run_server.py")],
+                        help="Server command")
+    parser.add_argument("--server-log", help="Append server stderr to this file (default: discard)")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--call-timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    if not report["overall"]["calls"] or report["session_errors"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
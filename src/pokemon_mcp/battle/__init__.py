@@ -1,3 +1,23 @@
 # src/pokemon_mcp/battle/__init__.py
-from .engine import BattleEngine, BattleResult, BattleLog
-from .mechanics import get_type_effectiveness, calculate_damage
\ No newline at end of file
+import importlib
+
+# Public names are resolved lazily so importing the package stays cheap
+_EXPORTS = {
+    "BattleEngine": ".engine",
+    "BattleResult": ".engine",
+    "BattleLog": ".engine",
+    "TeamBattle": ".team",
+    "TeamBattleResult": ".team",
+    "get_type_effectiveness": ".mechanics",
+    "calculate_damage": ".mechanics",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
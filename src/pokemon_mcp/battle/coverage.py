@@ -0,0 +1,109 @@
+# src/pokemon_mcp/battle/coverage.py
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+from .mechanics import TYPE_EFFECTIVENESS, TYPE_NAMES, TYPE_IDS
+
+# Sets of types are ints with bit TYPE_IDS[name] set for each member
+ALL_TYPES = (1 << len(TYPE_NAMES)) - 1
+
+def _mask(multiplier: float, attacking: str) -> int:
+    chart = TYPE_EFFECTIVENESS[attacking]
+    return sum(1 << TYPE_IDS[d] for d, value in chart.items() if value == multiplier and d in TYPE_IDS)
+
+# Defending types each attacking type hits super effectively
+SUPER_EFFECTIVE = [_mask(2.0, a) for a in TYPE_NAMES]
+# Attacking types each single defending type is weak to, resists and is immune to
+WEAK_TO = [sum(1 << a for a in range(len(TYPE_NAMES)) if SUPER_EFFECTIVE[a] >> d & 1) for d in range(len(TYPE_NAMES))]
+RESISTS = [sum(1 << a for a, name in enumerate(TYPE_NAMES) if _mask(0.5, name) >> d & 1) for d in range(len(TYPE_NAMES))]
+IMMUNE_TO = [sum(1 << a for a, name in enumerate(TYPE_NAMES) if _mask(0.0, name) >> d & 1) for d in range(len(TYPE_NAMES))]
+
+def type_mask(types: Sequence[str]) -> int:
+    mask = 0
+    for name in types:
+        if name in TYPE_IDS:
+            mask |= 1 << TYPE_IDS[name]
+    return mask
+
+def type_names(mask: int) -> List[str]:
+    return [name for i, name in enumerate(TYPE_NAMES) if mask >> i & 1]
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+@dataclass(frozen=True)
+class Defense:
+    """Attacking types a type combination takes 4x, 2x, 1/2x, 1/4x and no damage from"""
+    double_weak: int
+    weak: int  # Includes double_weak
+    resist: int  # Includes double_resist
+    double_resist: int
+    immune: int
+
+_defenses: Dict[int, Defense] = {}
+
+def defense(types: Sequence[str]) -> Defense:
+    """Defensive profile of one or two types, from the per-type masks"""
+    ids = [TYPE_IDS[name] for name in types[:2] if name in TYPE_IDS]
+    key = type_mask(types[:2])
+    cached = _defenses.get(key)
+    if cached is not None:
+        return cached
+    if not ids:
+        result = Defense(0, 0, 0, 0, 0)
+    elif len(ids) == 1 or ids[0] == ids[1]:
+        d = ids[0]
+        result = Defense(0, WEAK_TO[d], RESISTS[d], 0, IMMUNE_TO[d])
+    else:
+        w1, w2 = WEAK_TO[ids[0]], WEAK_TO[ids[1]]
+        r1, r2 = RESISTS[ids[0]], RESISTS[ids[1]]
+        immune = IMMUNE_TO[ids[0]] | IMMUNE_TO[ids[1]]
+        # A weakness and a resistance cancel out to neutral; any immunity wins
+        result = Defense(
+            double_weak=w1 & w2 & ~immune,
+            weak=(w1 & ~r2 | w2 & ~r1) & ~immune,
+            resist=(r1 & ~w2 | r2 & ~w1) & ~immune,
+            double_resist=r1 & r2 & ~immune,
+            immune=immune
+        )
+    _defenses[key] = result
+    return result
+
+def analyze_team(members: List[Tuple[str, Sequence[str]]]) -> Dict:
+    """Type coverage of a team given as (name, types) pairs
+
+    Offense counts same-type attacks only: a hole is a defending type none
+    of the team's types hits super effectively. On defense each attacking
+    type scores +1 per member resisting it (+2 for 1/4x or immunity) and -1
+    per member weak to it (-2 for 4x); the resistance score is their total.
+    """
+    offense = 0
+    for _, types in members:
+        for name in types:
+            if name in TYPE_IDS:
+                offense |= SUPER_EFFECTIVE[TYPE_IDS[name]]
+
+    defenses = [defense(types) for _, types in members]
+    covered = 0  # Attacking types at least one member resists or is immune to
+    for d in defenses:
+        covered |= d.resist | d.immune
+    net = []
+    for a in range(len(TYPE_NAMES)):
+        net.append(sum((d.resist >> a & 1) + (d.double_resist >> a & 1) + 2 * (d.immune >> a & 1)
+                       - (d.weak >> a & 1) - (d.double_weak >> a & 1) for d in defenses))
+
+    weak_counts = {name: sum(d.weak >> a & 1 for d in defenses) for a, name in enumerate(TYPE_NAMES)}
+    return {
+        "members": [{
+            "name": name,
+            "types": list(types),
+            "weak_to": type_names(d.weak),
+            "resists": type_names(d.resist),
+            "immune_to": type_names(d.immune),
+        } for (name, types), d in zip(members, defenses)],
+        "super_effective_against": type_names(offense),
+        "coverage_holes": type_names(ALL_TYPES & ~offense),
+        "shared_weaknesses": {name: count for name, count in weak_counts.items() if count >= 2},
+        "unresisted": type_names(ALL_TYPES & ~covered),
+        "net_resistance": dict(zip(TYPE_NAMES, net)),
+        "resistance_score": sum(net),
+    }
@@ -1,12 +1,15 @@
 # src/pokemon_mcp/battle/engine.py
+import asyncio
 import random
 import math
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 from ..data.pokemon_client import Pokemon
-from .mechanics import get_type_effectiveness
-from .moves import Move, MoveCategory, get_pokemon_moves
-from .status import StatusCondition
+from .mechanics import get_type_effectiveness, resolve_move, roll_damage
+from .moves import Move, MoveCategory, STRUGGLE, get_pokemon_moves
+from .policy import MoveChoices, STRUGGLE_INDEX, expected_damage, get_policy
+from .status import (NO_STATUS, BURN, PARALYSIS, before_move, end_of_turn, inflict_chance, is_immune,
+                     residual_damage, roll_status, status_code)
 
 @dataclass
 class BattleLog:
@@ -20,6 +23,20 @@ class BattleResult:
     total_turns: int
     logs: List[BattleLog]
 
+@dataclass
+class BattleEvent:
+    """Log entries produced by one turn of a streamed battle"""
+    turn: int
+    logs: List[BattleLog]
+    hp: Tuple[int, int]
+    max_turns: int
+    winner: Optional[str] = None  # Set on the final event only
+    loser: Optional[str] = None
+    
+    @property
+    def is_final(self) -> bool:
+        return self.winner is not None
+
 @dataclass
 class BattleStats:
     attack: int
@@ -34,6 +51,9 @@ class BattlePokemon:
         self.current_hp = pokemon.stats.hp
         self.max_hp = pokemon.stats.hp
         self.moves = []  # Will be populated with Move objects
+        self.pp = []  # Remaining PP per move; Move objects are shared through the move cache
+        self.status = NO_STATUS  # Status code from battle.status
+        self.status_turns = 0  # Sleep turns left
         self.battle_stats = BattleStats(
             attack=pokemon.stats.attack,
             defense=pokemon.stats.defense,
@@ -51,26 +71,71 @@ class BattlePokemon:
         return self.pokemon.name
         
     async def initialize_moves(self):
-        """Initialize moves from API data"""
-        self.moves = await get_pokemon_moves(self.pokemon.moves)
+        """Pick the best moveset from the local move table, or fetch the first moves from the API"""
+        from ..data.move_table import loaded_move_table
+        table = loaded_move_table()
+        names = table.best_moveset(self.pokemon) if table is not None else []
+        if names:
+            self.moves = [table.move(name) for name in names]
+        else:
+            self.moves = await get_pokemon_moves(self.pokemon.moves)
+        self.pp = [move.pp for move in self.moves]
+    
+    def use_pp(self, move: Move):
+        """Spend one PP of the given move for this battle"""
+        for i, known in enumerate(self.moves):
+            if known is move:
+                if self.pp[i] > 0:
+                    self.pp[i] -= 1
+                return
     
     def get_stat(self, stat_name: str) -> int:
         """Get base stat value"""
         return getattr(self.battle_stats, stat_name)
+    
+    @property
+    def effective_speed(self) -> int:
+        """Speed used for turn order; paralysis halves it"""
+        speed = self.battle_stats.speed
+        return speed // 2 if self.status == PARALYSIS else speed
 
-class BattleEngine:
-    def __init__(self):
-        self.logs = []
+class BattleState:
+    """Mutable state of a single battle, so one engine can run many battles concurrently"""
+    
+    def __init__(self, p1: BattlePokemon, p2: BattlePokemon, max_turns: int):
+        self.p1 = p1
+        self.p2 = p2
+        self.max_turns = max_turns
         self.turn = 0
+        self.logs: List[BattleLog] = []
+        self.winner: Optional[str] = None
+        self.loser: Optional[str] = None
+        self.choices: Tuple[Optional[MoveChoices], Optional[MoveChoices]] = (None, None)  # p1 vs p2, p2 vs p1
+    
+    def log(self, message: str):
+        self.logs.append(BattleLog(turn=self.turn, message=message))
+    
+    def drain(self) -> BattleEvent:
+        """Hand over the log entries collected since the previous event"""
+        event = BattleEvent(turn=self.turn, logs=self.logs, hp=(self.p1.current_hp, self.p2.current_hp),
+                            max_turns=self.max_turns, winner=self.winner, loser=self.loser)
+        self.logs = []
+        return event
+
+class BattleEngine:
+    def __init__(self, max_turns: int = 50, policy: str = "heuristic", epsilon: float = 0.1):
+        self.max_turns = max_turns  # Reasonable limit to prevent infinite battles
+        self.policy_name = policy
+        self.policy = get_policy(policy, epsilon)  # See battle.policy
         
-    def calculate_damage(self, attacker: BattlePokemon, 
-                                defender: BattlePokemon, move: Move) -> Tuple[int, bool, float]:
-        """FIXED: Proper Pokemon damage calculation"""
+    def base_damage(self, attacker: BattlePokemon, 
+                    defender: BattlePokemon, move: Move) -> Tuple[float, float]:
+        """Deterministic part of the damage formula: (damage before crit and random roll, type multiplier)"""
         
         # Base power
         power = move.power
         if power == 0:  # Status move
-            return 0, False, 1.0
+            return 0.0, 1.0
             
         # Attack and Defense stats
         if move.category == MoveCategory.PHYSICAL:
@@ -85,96 +150,75 @@ class BattleEngine:
         
         # CORRECT Pokemon damage formula
         # Damage = ((((2 * Level / 5 + 2) * Attack * Power / Defense) / 50) + 2) * Modifiers
-        base_damage = (((2 * level / 5 + 2) * attack * power / defense) / 50) + 2
-        
-        # Apply modifiers
-        damage = base_damage
+        damage = (((2 * level / 5 + 2) * attack * power / defense) / 50) + 2
         
         # STAB (Same Type Attack Bonus) - 1.5x
-        stab_bonus = 1.0
         if move.type in attacker.pokemon.types:
             damage *= 1.5
-            stab_bonus = 1.5
         
         # Type effectiveness
         type_mult = get_type_effectiveness(move.type, defender.pokemon.types)
         damage *= type_mult
         
-        # Critical hit (6.25% chance) - 1.5x in modern games
-        critical = False
-        if random.random() < 0.0625:  # 1/16 chance
-            damage *= 1.5
-            critical = True
-        
-        # Random factor (85-100%) - this prevents exact damage predictions
-        damage *= random.uniform(0.85, 1.0)
-        
-        # Ensure minimum 1 damage, maximum reasonable damage
-        final_damage = max(1, min(int(damage), defender.max_hp))
+        return damage, type_mult
+    
+    def calculate_damage(self, attacker: BattlePokemon, 
+                                defender: BattlePokemon, move: Move) -> Tuple[int, bool, float]:
+        """FIXED: Proper Pokemon damage calculation"""
+        if move.power == 0:  # Status move
+            return 0, False, 1.0
         
+        damage, type_mult = self.base_damage(attacker, defender, move)
+        burned = attacker.status == BURN and move.category == MoveCategory.PHYSICAL
+        final_damage, critical = roll_damage(damage, burned, defender.max_hp)
         return final_damage, critical, type_mult
     
-    def check_accuracy(self, attacker: BattlePokemon, 
-                  defender: BattlePokemon, move: Move) -> bool:
-        """Check if move hits based on accuracy"""
-        return random.randint(1, 100) <= move.accuracy
+    def move_choices(self, pokemon: BattlePokemon, opponent: BattlePokemon) -> MoveChoices:
+        """Expected damage and effectiveness of each of pokemon's moves against opponent"""
+        expected, type_mults = [], []
+        for move in pokemon.moves:
+            damage, type_mult = self.base_damage(pokemon, opponent, move)
+            expected.append(expected_damage(damage, move.accuracy))
+            type_mults.append(type_mult)
+        return MoveChoices(expected, type_mults)
     
     def select_move(self, pokemon: BattlePokemon, 
-                   opponent: BattlePokemon) -> Move:
-        """AI move selection with basic strategy"""
-        available_moves = [m for m in pokemon.moves if m.pp > 0]
-        
-        if not available_moves:
-            # Struggle (last resort) - weak but always works
-            return Move("struggle", "normal", MoveCategory.PHYSICAL, 50, 100, 1)
-        
-        # Simple AI: prefer super effective moves, but not exclusively
-        best_moves = []
-        good_moves = []
-        
-        for move in available_moves:
-            effectiveness = get_type_effectiveness(move.type, opponent.pokemon.types)
-            
-            if effectiveness >= 2.0:  # Super effective
-                best_moves.append(move)
-            elif effectiveness >= 1.0:  # Normal or better
-                good_moves.append(move)
-        
-        # 70% chance to use super effective move if available
-        if best_moves and random.random() < 0.7:
-            return random.choice(best_moves)
-        elif good_moves:
-            return random.choice(good_moves)
-        else:
-            return random.choice(available_moves)
+                   opponent: BattlePokemon, choices: Optional[MoveChoices] = None) -> Move:
+        """AI move selection using the engine's policy"""
+        if choices is None:
+            choices = self.move_choices(pokemon, opponent)
+        m = self.policy(choices, pokemon.pp)
+        # Struggle (last resort) when no move has PP left
+        return STRUGGLE if m == STRUGGLE_INDEX else pokemon.moves[m]
     
-    async def simulate_battle(self, pokemon1: Pokemon, 
-                                     pokemon2: Pokemon) -> BattleResult:
-        """Simulate battle with proper damage calculations"""
-        self.logs = []
-        self.turn = 0
-        
-        # Create battle Pokemon
+    async def prepare(self, pokemon1: Pokemon, 
+                      pokemon2: Pokemon) -> Tuple[BattlePokemon, BattlePokemon]:
+        """Create both battlers and load their moves"""
         p1 = BattlePokemon(pokemon1)
         p2 = BattlePokemon(pokemon2)
         
         # Initialize moves properly with async
-        await p1.initialize_moves()
-        await p2.initialize_moves()
-        
-        self._log(f"Battle begins! {p1.pokemon.name} (HP: {p1.max_hp}) vs {p2.pokemon.name} (HP: {p2.max_hp})")
-        self._log(f"{p1.pokemon.name} types: {', '.join(p1.pokemon.types)}")
-        self._log(f"{p2.pokemon.name} types: {', '.join(p2.pokemon.types)}")
+        await asyncio.gather(p1.initialize_moves(), p2.initialize_moves())
+        return p1, p2
+    
+    def run_turns(self, state: BattleState) -> Iterator[BattleEvent]:
+        """Play a prepared battle, yielding the log of the intro, each turn and the conclusion"""
+        p1, p2 = state.p1, state.p2
+        state.log(f"Battle begins! {p1.pokemon.name} (HP: {p1.max_hp}) vs {p2.pokemon.name} (HP: {p2.max_hp})")
+        state.log(f"{p1.pokemon.name} types: {', '.join(p1.pokemon.types)}")
+        state.log(f"{p2.pokemon.name} types: {', '.join(p2.pokemon.types)}")
+        yield state.drain()
         
-        max_turns = 50  # Reasonable limit to prevent infinite battles
+        # Precompute move choices once per battle
+        state.choices = (self.move_choices(p1, p2), self.move_choices(p2, p1))
         
-        while not p1.is_fainted and not p2.is_fainted and self.turn < max_turns:
-            self.turn += 1
-            self._log(f"--- Turn {self.turn} ---")
+        while not p1.is_fainted and not p2.is_fainted and state.turn < state.max_turns:
+            state.turn += 1
+            state.log(f"--- Turn {state.turn} ---")
             
             # Determine turn order based on speed
-            p1_speed = p1.get_stat('speed')
-            p2_speed = p2.get_stat('speed')
+            p1_speed = p1.effective_speed
+            p2_speed = p2.effective_speed
             
             if p1_speed > p2_speed:
                 first, second = p1, p2
@@ -186,91 +230,120 @@ class BattleEngine:
             
             # Execute turns
             if not first.is_fainted:
-                self._execute_turn(first, second)
+                self._execute_turn(state, first, second)
             
             if not second.is_fainted and not first.is_fainted:
-                self._execute_turn(second, first)
+                self._execute_turn(state, second, first)
+            
+            self._status_phase(state)
+            yield state.drain()
         
         # Determine winner
         if p1.is_fainted and not p2.is_fainted:
             winner, loser = p2.pokemon.name, p1.pokemon.name
         elif p2.is_fainted and not p1.is_fainted:
             winner, loser = p1.pokemon.name, p2.pokemon.name
-        elif self.turn >= max_turns:
+        elif state.turn >= state.max_turns:
             # Battle timeout - winner by remaining HP
             if p1.current_hp > p2.current_hp:
                 winner, loser = p1.pokemon.name, p2.pokemon.name
-                self._log(f"Battle timeout! Winner determined by remaining HP: {winner}")
+                state.log(f"Battle timeout! Winner determined by remaining HP: {winner}")
             elif p2.current_hp > p1.current_hp:
                 winner, loser = p2.pokemon.name, p1.pokemon.name
-                self._log(f"Battle timeout! Winner determined by remaining HP: {winner}")
+                state.log(f"Battle timeout! Winner determined by remaining HP: {winner}")
             else:
                 winner, loser = "Draw", "Draw"
-                self._log("Battle ended in a draw!")
+                state.log("Battle ended in a draw!")
         else:
             winner, loser = "Draw", "Draw"
         
-        self._log(f"Battle concluded! Winner: {winner}")
+        state.log(f"Battle concluded! Winner: {winner}")
+        state.winner, state.loser = winner, loser
+        yield state.drain()
+    
+    async def stream_battle(self, pokemon1: Pokemon, pokemon2: Pokemon,
+                            max_turns: Optional[int] = None) -> AsyncIterator[BattleEvent]:
+        """Simulate a battle, yielding each turn's events as soon as it has been played"""
+        p1, p2 = await self.prepare(pokemon1, pokemon2)
+        state = BattleState(p1, p2, max_turns or self.max_turns)
+        for event in self.run_turns(state):
+            yield event
+            await asyncio.sleep(0)  # Let consumers flush the event before the next turn
+    
+    async def simulate_battle(self, pokemon1: Pokemon, 
+                                     pokemon2: Pokemon,
+                                     max_turns: Optional[int] = None) -> BattleResult:
+        """Simulate battle with proper damage calculations"""
+        p1, p2 = await self.prepare(pokemon1, pokemon2)
+        state = BattleState(p1, p2, max_turns or self.max_turns)
+        logs = []
+        for event in self.run_turns(state):
+            logs.extend(event.logs)
+            await asyncio.sleep(0)  # Other sessions get the loop between turns
         
+        # The outcome is read from the state, which run_turns completes before it returns
         return BattleResult(
-            winner=winner,
-            loser=loser,
-            total_turns=self.turn,
-            logs=self.logs
+            winner=state.winner,
+            loser=state.loser,
+            total_turns=state.turn,
+            logs=logs
         )
     
-    def _execute_turn(self, attacker: BattlePokemon, 
+    async def prepare_team(self, team1: List[Pokemon], team2: List[Pokemon]):
+        """Create a TeamBattle for two parties, loading every member's moves"""
+        from .team import TeamBattle
+        members = [BattlePokemon(pokemon) for pokemon in team1 + team2]
+        await asyncio.gather(*(member.initialize_moves() for member in members))
+        return TeamBattle(self, members[:len(team1)], members[len(team1):])
+    
+    async def simulate_team_battle(self, team1: List[Pokemon], team2: List[Pokemon],
+                                   max_turns: Optional[int] = None, log: bool = True):
+        """Simulate a 6v6 battle where fainted Pokemon are replaced by the next in line"""
+        battle = await self.prepare_team(team1, team2)
+        return battle.run(max_turns, log=log)
+    
+    def _status_phase(self, state: BattleState):
+        """End-of-turn burn and poison damage"""
+        for pokemon in (state.p1, state.p2):
+            pokemon.current_hp = end_of_turn(pokemon.name, pokemon.status, pokemon.current_hp,
+                                             residual_damage(pokemon.status, pokemon.max_hp), state.log)
+    
+    def _check_can_move(self, state: BattleState, pokemon: BattlePokemon) -> bool:
+        """Before-move status check: paralysis, sleep and freeze"""
+        if pokemon.status == NO_STATUS:
+            return True
+        can_move, pokemon.status, pokemon.status_turns = before_move(
+            pokemon.name, pokemon.status, pokemon.status_turns, state.log)
+        return can_move
+    
+    def _inflict_status(self, state: BattleState, defender: BattlePokemon, move: Move, hp: int) -> bool:
+        """Roll the move's status effect against the defender at hp; True if it took hold"""
+        code = status_code(move.status_effect)
+        inflicted = roll_status(defender.name, code, defender.status, hp,
+                                is_immune(code, defender.pokemon.types), inflict_chance(move), state.log)
+        if inflicted is None:
+            return False
+        defender.status, defender.status_turns = inflicted
+        return True
+    
+    def _execute_turn(self, state: BattleState, attacker: BattlePokemon, 
                            defender: BattlePokemon):
         """Execute a Pokemon's turn"""
+        if not self._check_can_move(state, attacker):
+            return
+        
         # Select and use move
-        move = self.select_move(attacker, defender)
-        self._use_move(attacker, defender, move)
+        choices = state.choices[0] if attacker is state.p1 else state.choices[1]
+        move = self.select_move(attacker, defender, choices)
+        self._use_move(state, attacker, defender, move)
     
-    def _use_move(self, attacker: BattlePokemon, 
+    def _use_move(self, state: BattleState, attacker: BattlePokemon, 
                        defender: BattlePokemon, move: Move):
         """Execute a move"""
-        self._log(f"{attacker.pokemon.name} uses {move.name}!")
-        
-        # Reduce PP
-        if move.pp > 0:
-            move.pp -= 1
-        
-        # Check accuracy
-        if not self.check_accuracy(attacker, defender, move):
-            self._log(f"{attacker.pokemon.name}'s attack missed!")
-            return
-        
-        # Calculate damage
-        damage, is_critical, type_mult = self.calculate_damage(attacker, defender, move)
-        
-        if damage > 0:
-            old_hp = defender.current_hp
-            defender.current_hp = max(0, defender.current_hp - damage)
-            actual_damage = old_hp - defender.current_hp
-            
-            # Build damage message
-            msg_parts = [f"Deals {actual_damage} damage!"]
-            
-            if is_critical:
-                msg_parts.append("Critical hit!")
-            
-            if type_mult > 1.0:
-                msg_parts.append("It's super effective!")
-            elif type_mult < 1.0 and type_mult > 0:
-                msg_parts.append("It's not very effective...")
-            elif type_mult == 0:
-                msg_parts.append("It has no effect!")
-            
-            self._log(" ".join(msg_parts))
-            
-            if defender.is_fainted:
-                self._log(f"{defender.pokemon.name} fainted!")
-            else:
-                hp_percentage = int((defender.current_hp / defender.max_hp) * 100)
-                self._log(f"{defender.pokemon.name}: {defender.current_hp}/{defender.max_hp} HP ({hp_percentage}% remaining)")
-        else:
-            self._log(f"{move.name} had no effect!")
-    
-    def _log(self, message: str):
-        """Add message to battle log"""
-        self.logs.append(BattleLog(turn=self.turn, message=message))
\ No newline at end of file
+        attacker.use_pp(move)
+        base, type_mult = self.base_damage(attacker, defender, move) if move.power else (None, 1.0)
+        defender.current_hp = resolve_move(
+            attacker.name, defender.name, move.name, move.accuracy, base, type_mult,
+            attacker.status == BURN and move.category == MoveCategory.PHYSICAL,
+            defender.current_hp, defender.max_hp,
+            lambda hp: self._inflict_status(state, defender, move, hp), state.log)
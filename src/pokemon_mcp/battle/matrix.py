@@ -0,0 +1,171 @@
+# src/pokemon_mcp/battle/matrix.py
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+import numpy as np
+from .mechanics import CRIT_CHANCE, CRIT_MULTIPLIER, TYPE_NAMES, TYPE_IDS, get_type_effectiveness
+from .moves import MoveCategory
+
+if TYPE_CHECKING:
+    from ..data.pokemon_client import Pokemon
+    from .engine import BattlePokemon
+
+LEVEL = 50  # Battle level assumed by BattleEngine.base_damage
+# The engine's continuous 85-100% random factor, as 16 equally likely rolls like the games use
+ROLLS = np.linspace(0.85, 1.0, 16)
+
+_chart: Optional[np.ndarray] = None
+
+def type_chart() -> np.ndarray:
+    """Effectiveness of each attacking type (rows) against each defending type (columns)
+
+    An extra last column of 1.0 stands for "no second type".
+    """
+    global _chart
+    if _chart is None:
+        chart = np.ones((len(TYPE_NAMES), len(TYPE_NAMES) + 1))
+        for a, attacking in enumerate(TYPE_NAMES):
+            for d, defending in enumerate(TYPE_NAMES):
+                chart[a, d] = get_type_effectiveness(attacking, [defending])
+        _chart = chart
+    return _chart
+
+def _type_ids(types: List[str]) -> List[int]:
+    """First and second type ids, unknown or missing types as the neutral column"""
+    none = len(TYPE_NAMES)
+    ids = [TYPE_IDS.get(t, none) for t in types[:2]]
+    return ids + [none] * (2 - len(ids))
+
+@dataclass
+class DamageArrays:
+    """Per (attacker move, defender) damage figures; move rows in attacker order"""
+    owner: np.ndarray  # (M,) attacker index of each move row
+    effectiveness: np.ndarray  # (M, D)
+    minimum: np.ndarray
+    maximum: np.ndarray
+    expected: np.ndarray
+    ohko: np.ndarray
+    two_hko: np.ndarray
+    hp: np.ndarray  # (D,)
+
+    def best_expected(self, attackers: int) -> np.ndarray:
+        """(attackers, D) expected damage of each attacker's strongest move"""
+        best = np.zeros((attackers, self.expected.shape[1]))
+        np.maximum.at(best, self.owner, self.expected)
+        return best
+
+def two_hit_chance(outcomes: np.ndarray, weights: np.ndarray, hp: np.ndarray) -> np.ndarray:
+    """(M, D) chance that two independent uses, each one of the outcomes, deal at least hp
+
+    outcomes is (M, D, K) damage with per-move weights (M, K). For each
+    first outcome the chance of a large enough second one is the weight of
+    the sorted outcomes from the first one reaching hp - first onwards, so
+    no (K, K) table of outcome pairs is built.
+    """
+    order = np.argsort(outcomes, axis=-1)
+    ordered = np.take_along_axis(outcomes, order, axis=-1)  # (M, D, K)
+    ordered_weights = np.take_along_axis(np.broadcast_to(weights[:, None, :], outcomes.shape), order, axis=-1)
+    # at_least[..., k]: weight of the k-th smallest outcome and all larger ones; 0 past the end
+    at_least = np.concatenate([np.cumsum(ordered_weights[..., ::-1], axis=-1)[..., ::-1],
+                               np.zeros(outcomes.shape[:2] + (1,))], axis=-1)
+
+    # One searchsorted over every row at once: offset each row past the previous one's values
+    rows = outcomes.shape[0] * outcomes.shape[1]
+    span = float(hp.max(initial=0.0)) + 1
+    offset = (np.arange(rows, dtype=np.float64) * span).reshape(outcomes.shape[:2] + (1,))
+    needed = np.clip(hp[None, :, None] - outcomes, 0, None)  # (M, D, K) second-use damage still needed
+    k = np.searchsorted((ordered + offset).ravel(), (needed + offset).ravel()).reshape(outcomes.shape)
+    k -= (np.arange(rows) * outcomes.shape[-1]).reshape(outcomes.shape[:2] + (1,))
+    return (weights[:, None, :] * np.take_along_axis(at_least, k, axis=-1)).sum(axis=-1)
+
+def damage_arrays(attackers: List["BattlePokemon"], defenders: List["Pokemon"]) -> DamageArrays:
+    """Damage of every attacker move against every defender, as whole-array operations
+
+    Follows BattleEngine.calculate_damage: the level-50 formula with STAB and
+    type effectiveness, a 1/16 chance of a 1.5x critical hit and a random
+    factor of 85-100%, floored, at least 1 and at most the defender's HP.
+    Expected damage and the knockout chances include the move's accuracy.
+    """
+    moves = [(i, move) for i, attacker in enumerate(attackers) for move in attacker.moves]
+    owner = np.array([i for i, _ in moves], dtype=np.intp)
+    power = np.array([move.power for _, move in moves], dtype=np.float64)
+    accuracy = np.clip(np.array([move.accuracy for _, move in moves], dtype=np.float64) / 100, 0.0, 1.0)
+    physical = np.array([move.category == MoveCategory.PHYSICAL for _, move in moves])
+    move_type = np.array([TYPE_IDS.get(move.type, TYPE_IDS["normal"]) for _, move in moves], dtype=np.intp)
+    stab = np.array([1.5 if move.type in attackers[i].pokemon.types else 1.0 for i, move in moves])
+
+    attack = np.array([[a.get_stat("attack"), a.get_stat("special_attack")] for a in attackers], dtype=np.float64)
+    attack = np.where(physical, attack[owner, 0], attack[owner, 1])[:, None]  # (M, 1)
+
+    defense = np.array([[d.stats.defense, d.stats.special_defense] for d in defenders], dtype=np.float64)
+    defense = np.where(physical[:, None], defense[None, :, 0], defense[None, :, 1])  # (M, D)
+    hp = np.array([d.stats.hp for d in defenders], dtype=np.float64)
+    types = np.array([_type_ids(d.types) for d in defenders], dtype=np.intp)
+    chart = type_chart()
+    effectiveness = chart[move_type[:, None], types[None, :, 0]] * chart[move_type[:, None], types[None, :, 1]]
+
+    base = (((2 * LEVEL / 5 + 2) * attack * power[:, None] / defense) / 50 + 2) * stab[:, None] * effectiveness
+    # Like the engine, any damaging move deals at least 1 HP, even against an immune type
+    damaging = np.broadcast_to((power > 0)[:, None], base.shape)  # (M, D)
+
+    # Every hit outcome: 16 rolls without and 16 with a critical hit
+    multipliers = np.concatenate([ROLLS, ROLLS * CRIT_MULTIPLIER])
+    weights = np.concatenate([np.full(len(ROLLS), (1 - CRIT_CHANCE) / len(ROLLS)),
+                              np.full(len(ROLLS), CRIT_CHANCE / len(ROLLS))])
+    hits = np.clip(np.floor(base[..., None] * multipliers), 1, hp[None, :, None])  # (M, D, 32)
+    hits = np.where(damaging[..., None], hits, 0.0)
+
+    hit_weights = accuracy[:, None] * weights  # (M, 32)
+    expected = (hits * hit_weights[:, None, :]).sum(axis=-1)
+    ohko = ((hits >= hp[None, :, None]) * hit_weights[:, None, :]).sum(axis=-1)
+
+    # Two uses: each one misses (0 damage) or lands one of the 32 hits
+    outcomes = np.concatenate([hits, np.zeros(hits.shape[:2] + (1,))], axis=-1)  # (M, D, 33)
+    outcome_weights = np.concatenate([hit_weights, 1 - accuracy[:, None]], axis=-1)  # (M, 33)
+    two_hko = two_hit_chance(outcomes, outcome_weights, hp)
+    return DamageArrays(owner=owner, effectiveness=effectiveness, minimum=hits[..., 0], maximum=hits[..., -1],
+                        expected=expected, ohko=ohko, two_hko=two_hko, hp=hp)
+
+def damage_matrix(attackers: List["BattlePokemon"], defenders: List["Pokemon"]) -> Dict:
+    """damage_arrays() as a JSON-ready report, with the best answer to each defender"""
+    arrays = damage_arrays(attackers, defenders)
+    effectiveness, expected, ohko, two_hko, hp = (arrays.effectiveness, arrays.expected, arrays.ohko,
+                                                  arrays.two_hko, arrays.hp)
+    minimum, maximum, owner = arrays.minimum, arrays.maximum, arrays.owner
+    moves = [move for attacker in attackers for move in attacker.moves]
+    result = {"attackers": [], "defenders": [d.name for d in defenders]}
+    m = 0
+    for attacker in attackers:
+        entry = {"name": attacker.name, "moves": []}
+        for move in attacker.moves:
+            entry["moves"].append({
+                "move": move.name,
+                "type": move.type,
+                "category": move.category.value,
+                "power": move.power,
+                "accuracy": move.accuracy,
+                "vs": [{
+                    "defender": defender.name,
+                    "effectiveness": float(effectiveness[m, d]),
+                    "min": int(minimum[m, d]),
+                    "max": int(maximum[m, d]),
+                    "expected": round(float(expected[m, d]), 1),
+                    "expected_percent": round(float(expected[m, d] / hp[d] * 100), 1),
+                    "ohko": round(float(ohko[m, d]), 4),
+                    "2hko": round(float(two_hko[m, d]), 4),
+                } for d, defender in enumerate(defenders)]
+            })
+            m += 1
+        result["attackers"].append(entry)
+
+    # Strongest answer to each defender across the whole team
+    if moves:
+        best = expected.argmax(axis=0)
+        result["best_answers"] = [{
+            "defender": defender.name,
+            "attacker": attackers[owner[best[d]]].name,
+            "move": moves[best[d]].name,
+            "expected": round(float(expected[best[d], d]), 1),
+            "ohko": round(float(ohko[best[d], d]), 4),
+            "2hko": round(float(two_hko[best[d], d]), 4),
+        } for d, defender in enumerate(defenders)]
+    return result
@@ -1,6 +1,6 @@
 # src/pokemon_mcp/battle/mechanics.py
 import random
-from typing import Dict
+from typing import Callable, Dict, Optional, Tuple
 
 # Type effectiveness chart (simplified for MVP)
 TYPE_EFFECTIVENESS = {
@@ -24,6 +24,10 @@ TYPE_EFFECTIVENESS = {
     "steel": {"ice": 2.0, "rock": 2.0, "fairy": 2.0, "fire": 0.5, "water": 0.5, "electric": 0.5, "steel": 0.5}
 }
 
+# Canonical type order, used to encode types as small integer IDs
+TYPE_NAMES = tuple(TYPE_EFFECTIVENESS)
+TYPE_IDS = {name: i for i, name in enumerate(TYPE_NAMES)}
+
 def get_type_effectiveness(attack_type: str, defend_types: list) -> float:
     """Calculate type effectiveness multiplier"""
     multiplier = 1.0
@@ -39,4 +43,62 @@ def calculate_damage(attacker_attack: int, defender_defense: int, move_power: in
     """Simplified damage calculation"""
     # Basic formula: ((Attack / Defense) * Move Power * Type Effectiveness) / 10
     base_damage = ((attacker_attack / defender_defense) * move_power * type_effectiveness) / 10
-    return max(1, int(base_damage))  # Minimum 1 damage
\ No newline at end of file
+    return max(1, int(base_damage))  # Minimum 1 damage
+
+# Move resolution shared by BattleEngine and TeamBattle, which keep their state in
+# different shapes; log is None when the battle is not being logged
+
+CRIT_CHANCE = 0.0625  # 1/16
+CRIT_MULTIPLIER = 1.5
+
+def roll_damage(base: float, burned: bool, max_hp: int) -> Tuple[int, bool]:
+    """One hit from its pre-roll damage: burn (physical moves only), crit and the 85-100% roll
+
+    Returns (damage, critical), the damage clamped to 1..max_hp.
+    """
+    if burned:
+        base *= 0.5
+    critical = random.random() < CRIT_CHANCE
+    if critical:
+        base *= CRIT_MULTIPLIER
+    return max(1, min(int(base * random.uniform(0.85, 1.0)), max_hp)), critical
+
+def resolve_move(attacker: str, defender: str, move_name: str, accuracy: int, base: Optional[float],
+                 type_mult: float, burned: bool, hp: int, max_hp: int, inflict: Callable[[int], bool],
+                 log: Optional[Callable[[str], None]] = None) -> int:
+    """Play one use of a move whose PP is already spent; returns the defender's HP afterwards
+
+    base is None for moves that deal no damage. inflict(hp) rolls the move's status
+    onto the defender, given its HP after the hit, and returns whether it took hold.
+    """
+    if log is not None:
+        log(f"{attacker} uses {move_name}!")
+    if random.randint(1, 100) > accuracy:
+        if log is not None:
+            log(f"{attacker}'s attack missed!")
+        return hp
+    if base is None:
+        if not inflict(hp) and log is not None:
+            log(f"{move_name} had no effect!")
+        return hp
+
+    damage, critical = roll_damage(base, burned, max_hp)
+    left = max(0, hp - damage)
+    if log is not None:
+        parts = [f"Deals {hp - left} damage!"]
+        if critical:
+            parts.append("Critical hit!")
+        if type_mult > 1.0:
+            parts.append("It's super effective!")
+        elif 0 < type_mult < 1.0:
+            parts.append("It's not very effective...")
+        elif type_mult == 0:
+            parts.append("It has no effect!")
+        log(" ".join(parts))
+        if left == 0:
+            log(f"{defender} fainted!")
+        else:
+            log(f"{defender}: {left}/{max_hp} HP ({int(left / max_hp * 100)}% remaining)")
+    if left and type_mult > 0:
+        inflict(left)
+    return left
@@ -1,9 +1,13 @@
 # src/pokemon_mcp/battle/moves.py
-import httpx
+import asyncio
 import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
+from ..config import ServerConfig
+from ..data.cache import CacheEntry, FetchResult, TTLCache
+from ..data.http import get_http_client
+from ..data.slim_json import MoveSlimmer, fetch_slim
 
 class StatusEffect(Enum):
     BURN = "burn"
@@ -30,51 +34,113 @@ class Move:
     priority: int = 0
     description: str = ""
 
+# Used when a Pokemon has no PP left - weak but always works
+STRUGGLE = Move("struggle", "normal", MoveCategory.PHYSICAL, 50, 100, 1)
+
+# Map common status-inducing moves
+STATUS_KEYWORDS = {
+    'burn': StatusEffect.BURN,
+    'poison': StatusEffect.POISON,
+    'paralyze': StatusEffect.PARALYSIS,
+    'sleep': StatusEffect.SLEEP,
+    'freeze': StatusEffect.FREEZE
+}
+
+def parse_status_effect(effect_text: str, effect_chance: Optional[int]) -> Tuple[Optional[StatusEffect], float]:
+    """Parse status effects from a move's effect text"""
+    effect_chance = effect_chance or 0
+    effect_text = (effect_text or "").lower()
+    
+    for keyword, status in STATUS_KEYWORDS.items():
+        if keyword in effect_text:
+            return status, effect_chance / 100.0 if effect_chance > 0 else 0.0
+    
+    return None, 0.0
+
+def move_from_slim(data: Dict) -> Move:
+    """Build a Move from a slimmed /move payload, with null checks"""
+    description = data['flavor_text']
+    move = Move(
+        name=data['name'],
+        type=data['type'],
+        category=MoveCategory(data['damage_class']),
+        power=data['power'] if data['power'] is not None else 0,  # Handle null power
+        accuracy=data['accuracy'] if data['accuracy'] is not None else 100,  # Handle null accuracy
+        pp=data['pp'] if data['pp'] is not None else 10,  # Handle null pp
+        priority=data['priority'] or 0,
+        description=description.replace('\n', ' ').replace('\f', ' ') if description else "No description available"
+    )
+    
+    # Check for status effects
+    status_effect, chance = parse_status_effect(data['effect'], data['effect_chance'])
+    if status_effect:
+        move.status_effect = status_effect
+        move.status_chance = chance
+    
+    return move
+
 class MoveClient:
-    def __init__(self):
-        self.base_url = "https://pokeapi.co/api/v2"
-        self.client = httpx.Client(timeout=10.0)
-        self._move_cache = {}
+    def __init__(self, config: Optional[ServerConfig] = None):
+        config = config or ServerConfig()
+        self.config = config
+        self.base_url = config.pokeapi_base_url.rstrip("/")
+        # Stale entries are served while being revalidated
+        self._move_cache = TTLCache(config.memory_cache_size, config.cache_duration)
+    
+    @property
+    def client(self):
+        """Shared HTTP client, created lazily on first use"""
+        return get_http_client(self.config)
     
     async def get_move(self, move_name: str) -> Move:
         """Fetch move data from PokéAPI"""
-        if move_name in self._move_cache:
-            return self._move_cache[move_name]
+        entry = self._move_cache.get_entry(move_name)
+        if entry is not None:
+            if self._move_cache.is_stale(entry):
+                self._move_cache.revalidate(move_name, lambda headers: self._fetch_move(move_name, headers))
+            return entry.value
         
         try:
-            url = f"{self.base_url}/move/{move_name.lower().replace(' ', '-')}"
-            response = self.client.get(url)
+            status, move, etag, last_modified = await self._fetch_move(move_name)
             
-            if response.status_code != 200:
+            if status != 200:
                 return self._create_default_move(move_name)
             
-            data = response.json()
-            
-            # Parse move data with null checks
-            move = Move(
-                name=data['name'],
-                type=data['type']['name'],
-                category=MoveCategory(data['damage_class']['name']),
-                power=data['power'] if data['power'] is not None else 0,  # Handle null power
-                accuracy=data['accuracy'] if data['accuracy'] is not None else 100,  # Handle null accuracy
-                pp=data['pp'] if data['pp'] is not None else 10,  # Handle null pp
-                priority=data.get('priority', 0),
-                description=self._get_move_description(data)
-            )
-            
-            # Check for status effects
-            status_effect, chance = self._parse_status_effects(data)
-            if status_effect:
-                move.status_effect = status_effect
-                move.status_chance = chance
-            
-            self._move_cache[move_name] = move
+            self._move_cache.set(move_name, move, etag, last_modified)
             return move
             
         except Exception as e:
             print(f"Error fetching move {move_name}: {e}", file=sys.stderr)
             return self._create_default_move(move_name)
     
+    async def get_move_entry(self, move_name: str) -> Optional[CacheEntry]:
+        """Cache entry of a move, or None for an unknown move (get_move would substitute a default)"""
+        await self.get_move(move_name)
+        return self._move_cache.peek(move_name)
+    
+    async def _fetch_move(self, move_name: str, headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        """Fetch one move, optionally as a conditional request"""
+        url = f"{self.base_url}/move/{move_name.lower().replace(' ', '-')}"
+        status, data, etag, last_modified = await fetch_slim(self.client, url, MoveSlimmer, headers)
+        return status, move_from_slim(data) if data else None, etag, last_modified
+    
+    def remember(self, move: Move):
+        """Cache a move that arrived with other data, unless a copy is already cached"""
+        if move.name not in self._move_cache:
+            self._move_cache.set(move.name, move)
+    
+    def cache_stats(self) -> Dict:
+        return self._move_cache.stats()
+    
+    def invalidate(self, names: Optional[List[str]] = None) -> int:
+        """Drop cached moves by name, or all of them"""
+        if names is None:
+            return self._move_cache.invalidate()
+        return self._move_cache.invalidate(str(name).lower().replace(" ", "-") for name in names)
+    
+    def evict_to(self, max_bytes: int) -> Dict:
+        return self._move_cache.evict_to(max_bytes)
+    
     def _create_default_move(self, move_name: str) -> Move:
         """Create a default tackle-like move"""
         return Move(
@@ -87,46 +153,28 @@ class MoveClient:
             description="A basic physical attack"
         )
     
-    def _get_move_description(self, data: dict) -> str:
-        """Extract move description from API data"""
-        for entry in data.get('flavor_text_entries', []):
-            if entry['language']['name'] == 'en':
-                return entry['flavor_text'].replace('\n', ' ').replace('\f', ' ')
-        return "No description available"
-    
-    def _parse_status_effects(self, data: dict) -> tuple[Optional[StatusEffect], float]:
-        """Parse status effects from move data"""
-        effect_chance = data.get('effect_chance', 0)
-        if effect_chance is None:
-            effect_chance = 0
-        
-        # Map common status-inducing moves
-        status_keywords = {
-            'burn': StatusEffect.BURN,
-            'poison': StatusEffect.POISON,
-            'paralyze': StatusEffect.PARALYSIS,
-            'sleep': StatusEffect.SLEEP,
-            'freeze': StatusEffect.FREEZE
-        }
-        
-        effect_entries = data.get('effect_entries', [])
-        effect_text = ""
-        if effect_entries:
-            effect_text = effect_entries[0].get('effect', '').lower()
-        
-        for keyword, status in status_keywords.items():
-            if keyword in effect_text:
-                return status, effect_chance / 100.0 if effect_chance > 0 else 0.0
-        
-        return None, 0.0
+    async def close(self):
+        """Clear the move cache; the shared HTTP client is closed by close_http_client()"""
+        self._move_cache.clear()
+
+# Shared client so every battle (and the startup warm-up) reuses one move cache
+_move_client: Optional[MoveClient] = None
+
+def get_move_client() -> MoveClient:
+    """Return the process-wide MoveClient, creating it on first use"""
+    global _move_client
+    if _move_client is None:
+        config = ServerConfig.from_env()
+        if config.data_backend == "graphql":
+            from ..data.graphql_client import GraphQLMoveClient
+            _move_client = GraphQLMoveClient(config)
+        else:
+            _move_client = MoveClient(config)
+    return _move_client
 
 async def get_pokemon_moves(pokemon_moves: List[str]) -> List[Move]:
     """Convert Pokemon move names to Move objects using API"""
-    client = MoveClient()
-    moves = []
-    
-    for move_name in pokemon_moves[:4]:  # Limit to 4 moves
-        move = await client.get_move(move_name)
-        moves.append(move)
+    client = get_move_client()
     
-    return moves
\ No newline at end of file
+    # Limit to 4 moves and fetch them concurrently
+    return list(await asyncio.gather(*(client.get_move(name) for name in pokemon_moves[:4])))
\ No newline at end of file
@@ -0,0 +1,132 @@
+# src/pokemon_mcp/battle/optimizer.py
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Set, Tuple
+import numpy as np
+from .matrix import damage_arrays
+from .team import TEAM_SIZE
+
+if TYPE_CHECKING:
+    from .engine import BattlePokemon
+
+BACKUP_WEIGHT = 0.25  # Share of an opponent's score that comes from the second-best counter
+
+def matchup_matrix(candidates: List["BattlePokemon"], opponents: List["BattlePokemon"]) -> np.ndarray:
+    """(candidates, opponents) score in [0, 1] of each one-on-one matchup
+
+    Both sides attack with their strongest move by expected damage. The
+    score is the candidate's share of the race to a knockout: the number of
+    hits the opponent needs over the total of both, with the faster side
+    landing its first hit half a turn earlier.
+    """
+    ours = damage_arrays(candidates, [o.pokemon for o in opponents]).best_expected(len(candidates))
+    theirs = damage_arrays(opponents, [c.pokemon for c in candidates]).best_expected(len(opponents)).T
+    our_hp = np.array([c.max_hp for c in candidates], dtype=np.float64)[:, None]
+    their_hp = np.array([o.max_hp for o in opponents], dtype=np.float64)[None, :]
+    with np.errstate(divide="ignore"):
+        our_turns = np.where(ours > 0, their_hp / ours, np.inf)
+        their_turns = np.where(theirs > 0, our_hp / theirs, np.inf)
+    our_speed = np.array([c.get_stat("speed") for c in candidates])[:, None]
+    their_speed = np.array([o.get_stat("speed") for o in opponents])[None, :]
+    our_turns = our_turns - 0.5 * (our_speed > their_speed)
+    their_turns = their_turns - 0.5 * (their_speed > our_speed)
+    total = our_turns + their_turns
+    with np.errstate(invalid="ignore"):
+        scores = np.where(np.isfinite(total), their_turns / total, 0.5)  # Neither side can do damage: a draw
+    scores = np.where(np.isinf(our_turns) & np.isfinite(their_turns), 0.0, scores)
+    return np.where(np.isinf(their_turns) & np.isfinite(our_turns), 1.0, scores)
+
+@dataclass
+class _Team:
+    members: FrozenSet[int]
+    best: np.ndarray  # (opponents,) best member score against each opponent
+    second: np.ndarray  # Second-best member score
+    score: float
+
+class TeamOptimizer:
+    """Beam search for the candidate team that best counters a set of opponents
+
+    A team's score is, averaged over the opponents, its best counter's
+    matchup score plus BACKUP_WEIGHT of the second-best one. Every search
+    step extends each team in the beam by every remaining candidate at once
+    as array operations over the precomputed matchup matrix; teams reached
+    from several parents are scored once. The search runs on one thread: a
+    step is a few small array operations, too little work to split across
+    processes. Teams hold at most TEAM_SIZE members, like a TeamBattle party.
+    """
+
+    def __init__(self, scores: np.ndarray, team_size: int = 6, beam_width: int = 16):
+        self.scores = scores
+        self.team_size = max(1, min(team_size, TEAM_SIZE, scores.shape[0]))
+        self.beam_width = max(1, beam_width)
+        self._seen: Set[FrozenSet[int]] = set()
+        self.evaluated = 0
+
+    def _total(self, best: np.ndarray, second: np.ndarray) -> np.ndarray:
+        return ((1 - BACKUP_WEIGHT) * best + BACKUP_WEIGHT * second).mean(axis=-1)
+
+    def _expand(self, team: _Team) -> List[_Team]:
+        best = np.maximum(team.best, self.scores)  # (candidates, opponents)
+        second = np.maximum(team.second, np.minimum(team.best, self.scores))
+        totals = self._total(best, second)
+        children = []
+        for c in np.argsort(-totals):
+            c = int(c)
+            if c in team.members:
+                continue
+            members = team.members | {c}
+            if members in self._seen:
+                continue
+            self._seen.add(members)
+            children.append(_Team(members, best[c], second[c], float(totals[c])))
+            if len(children) >= self.beam_width:
+                break
+        self.evaluated += len(children)
+        return children
+
+    def search(self, time_budget: float) -> Tuple[List[Tuple[List[int], float]], bool]:
+        """Best teams found as ([candidate indices], score), best first, and whether the search finished in time
+
+        The best team of each step is always extended, so even out of time
+        the search completes a greedy fill up to team_size.
+        """
+        deadline = time.monotonic() + time_budget
+        opponents = self.scores.shape[1]
+        beam = [_Team(frozenset(), np.zeros(opponents), np.zeros(opponents), 0.0)]
+        finished = True
+        for _ in range(self.team_size):
+            children: List[_Team] = []
+            for i, team in enumerate(beam):
+                if i and time.monotonic() > deadline:
+                    finished = False
+                    break
+                children.extend(self._expand(team))
+            if not children:
+                break
+            beam = sorted(children, key=lambda team: -team.score)[:self.beam_width]
+        return [(sorted(team.members), team.score) for team in beam], finished
+
+def optimize_team(candidates: List["BattlePokemon"], opponents: List["BattlePokemon"], team_size: int = 6,
+                  beam_width: int = 16, time_budget: float = 5.0, top: int = 3) -> Dict:
+    """Search the candidates for the teams of up to team_size that best counter the opponents"""
+    start = time.perf_counter()
+    scores = matchup_matrix(candidates, opponents)
+    optimizer = TeamOptimizer(scores, team_size, beam_width)
+    teams, finished = optimizer.search(max(0.0, time_budget - (time.perf_counter() - start)))
+
+    results = []
+    for members, score in teams[:max(1, top)]:
+        counters = scores[members].argmax(axis=0)
+        results.append({
+            "team": [candidates[i].name for i in members],
+            "score": round(score, 4),
+            "counters": {opponent.name: {"by": candidates[members[counters[o]]].name,
+                                         "score": round(float(scores[members[counters[o]], o]), 3)}
+                         for o, opponent in enumerate(opponents)},
+        })
+    return {
+        "teams": results,
+        "finished": finished,
+        "teams_evaluated": optimizer.evaluated,
+        "search_seconds": round(time.perf_counter() - start, 3),
+    }
@@ -0,0 +1,78 @@
+# src/pokemon_mcp/battle/policy.py
+import random
+from typing import Callable, Dict, Sequence
+
+STRUGGLE_INDEX = -1  # Returned when no move has PP left
+
+# Mean of the uniform 0.85-1.0 damage roll, and of a 1/16 chance of a 1.5x crit
+EXPECTED_ROLL = 0.925
+EXPECTED_CRIT = 1 + 0.0625 * 0.5
+
+def expected_damage(base_damage: float, accuracy: int) -> float:
+    """Average damage per use, given the deterministic part of the damage formula"""
+    return base_damage * accuracy / 100 * EXPECTED_ROLL * EXPECTED_CRIT
+
+class MoveChoices:
+    """Everything move selection needs for one attacker against one defender
+
+    Built once per battle, so choosing a move is a lookup rather than a
+    rescan of types and stats on every turn.
+    """
+
+    __slots__ = ("count", "expected", "ranked", "best", "good")
+
+    def __init__(self, expected: Sequence[float], type_mults: Sequence[float]):
+        count = len(expected)
+        self.count = count
+        self.expected = tuple(expected)
+        self.ranked = tuple(sorted(range(count), key=lambda m: -expected[m]))  # Best first
+        self.best = tuple(m for m in range(count) if type_mults[m] >= 2.0)  # Super effective
+        self.good = tuple(m for m in range(count) if 1.0 <= type_mults[m] < 2.0)  # Normal
+
+def _random_available(candidates: Sequence[int], pp: Sequence[int], offset: int) -> int:
+    """Uniform pick among candidates that still have PP"""
+    m = random.choice(candidates)
+    if pp[offset + m]:
+        return m
+    available = [m for m in candidates if pp[offset + m]]  # Only once PP starts running out
+    return random.choice(available) if available else STRUGGLE_INDEX
+
+def greedy(choices: MoveChoices, pp: Sequence[int], offset: int = 0) -> int:
+    """Highest expected damage among moves with PP left"""
+    for m in choices.ranked:
+        if pp[offset + m]:
+            return m
+    return STRUGGLE_INDEX
+
+def heuristic(choices: MoveChoices, pp: Sequence[int], offset: int = 0) -> int:
+    """Random move, preferring super effective (70%) then neutral ones"""
+    if choices.best and random.random() < 0.7:
+        m = _random_available(choices.best, pp, offset)
+        if m != STRUGGLE_INDEX:
+            return m
+    if choices.good:
+        m = _random_available(choices.good, pp, offset)
+        if m != STRUGGLE_INDEX:
+            return m
+    return _random_available(range(choices.count), pp, offset) if choices.count else STRUGGLE_INDEX
+
+def epsilon_greedy(epsilon: float = 0.1) -> Callable[[MoveChoices, Sequence[int], int], int]:
+    """Greedy, except for a random move with probability epsilon"""
+    def choose(choices: MoveChoices, pp: Sequence[int], offset: int = 0) -> int:
+        if choices.count and random.random() < epsilon:
+            return _random_available(range(choices.count), pp, offset)
+        return greedy(choices, pp, offset)
+    return choose
+
+POLICIES: Dict[str, Callable] = {
+    "greedy": lambda epsilon: greedy,
+    "epsilon_greedy": epsilon_greedy,
+    "heuristic": lambda epsilon: heuristic,
+}
+
+def get_policy(name: str, epsilon: float = 0.1) -> Callable[[MoveChoices, Sequence[int], int], int]:
+    """Move selection policy by name"""
+    factory = POLICIES.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown move policy '{name}'. Valid policies: {', '.join(POLICIES)}")
+    return factory(epsilon)
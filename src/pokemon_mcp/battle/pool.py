@@ -0,0 +1,203 @@
+# src/pokemon_mcp/battle/pool.py
+import asyncio
+import multiprocessing
+import os
+import random
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from ..data.pokemon_client import Pokemon, PokemonStats
+from .engine import BattleEngine, BattlePokemon
+from .moves import Move
+from .team import TEAM_SIZE, TeamBattle
+
+# One result row per battle: winner, turns, knockouts per team, then HP left in each of the 12 slots
+ROW_SIZE = 4 + 2 * TEAM_SIZE
+WINNER_CODES = {"team1": 0, "team2": 1, "Draw": 2}
+WINNER_NAMES = ("team1", "team2", "Draw")
+
+# Entry describing one party member: (species, move names, (types, stats), move records)
+Entry = Tuple
+
+@dataclass
+class SeriesResult:
+    """Outcome of n battles of one matchup, as compact rows"""
+    rows: array  # 'i', ROW_SIZE values per battle
+    battles: int
+
+    def row(self, i: int) -> Sequence[int]:
+        return self.rows[i * ROW_SIZE:(i + 1) * ROW_SIZE]
+
+    def outcomes(self, size1: int, size2: int) -> List[Tuple[int, int, Tuple[int, ...]]]:
+        """(winner code, turns, HP left per member) for each battle, team1's members first"""
+        result = []
+        for i in range(self.battles):
+            row = self.row(i)
+            hp = tuple(row[4:4 + size1]) + tuple(row[4 + TEAM_SIZE:4 + TEAM_SIZE + size2])
+            result.append((row[0], row[1], hp))
+        return result
+
+    def summary(self) -> Dict:
+        wins = [0, 0, 0]
+        turns = 0
+        for i in range(self.battles):
+            wins[self.rows[i * ROW_SIZE]] += 1
+            turns += self.rows[i * ROW_SIZE + 1]
+        n = max(1, self.battles)
+        return {
+            "battles": self.battles,
+            "wins": {name: wins[code] for code, name in enumerate(WINNER_NAMES)},
+            "win_rate": {"team1": round(wins[0] / n, 4), "team2": round(wins[1] / n, 4)},
+            "average_turns": round(turns / n, 2),
+        }
+
+# Worker-side state: species and moves seen so far, kept for the life of the worker
+_species: Dict[str, Pokemon] = {}
+_moves: Dict[str, Move] = {}
+_engine: Optional[BattleEngine] = None
+_battles: "OrderedDict[Tuple, TeamBattle]" = OrderedDict()
+_BATTLE_CACHE_SIZE = 64
+
+def _pokemon(name: str, types: Sequence[str], stats: Sequence[int]) -> Pokemon:
+    return Pokemon(id=0, name=name, types=list(types), stats=PokemonStats(*stats), abilities=[], moves=[])
+
+def _init_worker(engine_settings: Dict):
+    """Process initializer: one engine per worker"""
+    global _engine
+    _engine = BattleEngine(**engine_settings)
+
+def _member(entry: Entry) -> BattlePokemon:
+    name, move_names, species, move_records = entry
+    if name not in _species:
+        _species[name] = _pokemon(name, *species)
+    missing = [record for record in move_records if record[0] not in _moves]
+    if missing:
+        from ..data.move_table import MoveTable
+        table = MoveTable(missing)
+        for record in missing:
+            _moves[record[0]] = table.move(record[0])
+    member = BattlePokemon(_species[name])
+    member.moves = [_moves[move] for move in move_names]
+    member.pp = [move.pp for move in member.moves]
+    return member
+
+def _battle(team1: Sequence[Entry], team2: Sequence[Entry]) -> TeamBattle:
+    key = (tuple((e[0], tuple(e[1])) for e in team1), tuple((e[0], tuple(e[1])) for e in team2))
+    battle = _battles.get(key)
+    if battle is None:
+        battle = TeamBattle(_engine, [_member(e) for e in team1], [_member(e) for e in team2])
+        _battles[key] = battle
+        while len(_battles) > _BATTLE_CACHE_SIZE:
+            _battles.popitem(last=False)
+    else:
+        _battles.move_to_end(key)
+    return battle
+
+def _run_series(team1: Sequence[Entry], team2: Sequence[Entry], n: int, seed: int,
+                max_turns: Optional[int]) -> array:
+    """Worker task: play n battles of one matchup from a seed, returning ROW_SIZE ints per battle"""
+    random.seed(seed)
+    battle = _battle(team1, team2)
+    rows = array('i')
+    for _ in range(n):
+        rows.append(WINNER_CODES[battle.play(max_turns, log=False)])
+        rows.append(battle.turn)
+        rows.extend(battle.knockouts)
+        rows.extend(battle.hp)
+    return rows
+
+def _ping() -> int:
+    return os.getpid()
+
+class SimulationPool:
+    """Warm process pool for CPU-bound battle simulation
+
+    Workers are started once, from a forkserver (or spawned) rather than
+    forked from the threaded server process. A task carries each member's
+    stats and move records, a few hundred bytes, since any worker may pick
+    it up; workers keep what they have seen and only build new species and
+    moves, and cache prepared battles per matchup. Results come back as an
+    array of rows.
+    """
+
+    def __init__(self, workers: int = 0, chunk_size: int = 250, **engine_settings):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.engine_settings = engine_settings
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        if self._executor is not None:
+            return
+        # Forking a process that runs threads can leave a child stuck on a lock held by another thread
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(method),
+                                             initializer=_init_worker, initargs=(self.engine_settings,))
+        # Spawn every worker now rather than on the first request
+        for _ in range(self.workers):
+            self._executor.submit(_ping)
+
+    def entry(self, member: BattlePokemon) -> Entry:
+        """Descriptor for a prepared battler"""
+        from ..data.move_table import move_record
+        pokemon = member.pokemon
+        move_names = tuple(move.name for move in member.moves)
+        s = pokemon.stats
+        species = (pokemon.types, (s.hp, s.attack, s.defense, s.special_attack, s.special_defense, s.speed))
+        return (pokemon.name, move_names, species, [move_record(move) for move in member.moves])
+
+    async def run_series(self, team1: List[BattlePokemon], team2: List[BattlePokemon], n: int = 1,
+                         seed: Optional[int] = None, max_turns: Optional[int] = None) -> SeriesResult:
+        """Play n battles of one matchup, split into chunks across the workers"""
+        if self._executor is None:
+            self.start()
+        seed = random.randrange(2 ** 31) if seed is None else seed
+        entries1 = [self.entry(member) for member in team1]
+        entries2 = [self.entry(member) for member in team2]
+        loop = asyncio.get_running_loop()
+        chunks = [min(self.chunk_size, n - start) for start in range(0, n, self.chunk_size)]
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, _run_series, entries1, entries2, size, seed + i, max_turns)
+            for i, size in enumerate(chunks)))
+        rows = array('i')
+        for part in parts:
+            rows.extend(part)
+        return SeriesResult(rows=rows, battles=n)
+
+    async def tournament(self, teams: Dict[str, List[BattlePokemon]], n: int = 10,
+                         seed: Optional[int] = None, max_turns: Optional[int] = None,
+                         on_series: Optional[Callable[[str, str, SeriesResult], None]] = None) -> Dict:
+        """Round robin: every team plays every other team n times; on_series sees each pairing's rows"""
+        names = list(teams)
+        seed = random.randrange(2 ** 31) if seed is None else seed
+        pairings = [(a, b) for i, a in enumerate(names) for b in names[i + 1:]]
+        results = await asyncio.gather(*(
+            self.run_series(teams[a], teams[b], n, seed + 7919 * k, max_turns)
+            for k, (a, b) in enumerate(pairings)))
+
+        standings = {name: {"wins": 0, "losses": 0, "draws": 0} for name in names}
+        matches = []
+        for (a, b), result in zip(pairings, results):
+            if on_series is not None:
+                on_series(a, b, result)
+            summary = result.summary()
+            wins = summary["wins"]
+            standings[a]["wins"] += wins["team1"]
+            standings[a]["losses"] += wins["team2"]
+            standings[b]["wins"] += wins["team2"]
+            standings[b]["losses"] += wins["team1"]
+            standings[a]["draws"] += wins["Draw"]
+            standings[b]["draws"] += wins["Draw"]
+            matches.append({"team1": a, "team2": b, **summary})
+        for record in standings.values():
+            played = record["wins"] + record["losses"] + record["draws"]
+            record["win_rate"] = round(record["wins"] / played, 4) if played else 0.0
+        ranking = sorted(names, key=lambda name: -standings[name]["win_rate"])
+        return {"ranking": [{"team": name, **standings[name]} for name in ranking], "matches": matches}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -1,125 +1,101 @@
 # src/pokemon_mcp/battle/status.py
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 import random
-from .moves import StatusEffect
+from .moves import Move, MoveCategory, StatusEffect
 
-@dataclass
-class StatusCondition:
-    effect: StatusEffect
-    duration: int
-    damage_per_turn: int = 0
+# Compact status codes used by the battle engines; index into the tables below
+NO_STATUS, BURN, POISON, PARALYSIS, SLEEP, FREEZE = range(6)
+
+STATUS_CODES = {
+    StatusEffect.BURN: BURN,
+    StatusEffect.POISON: POISON,
+    StatusEffect.PARALYSIS: PARALYSIS,
+    StatusEffect.SLEEP: SLEEP,
+    StatusEffect.FREEZE: FREEZE,
+}
+STATUS_NAMES = ("", "burn", "poison", "paralysis", "sleep", "freeze")
+INFLICTED = ("", "was burned", "was poisoned", "is paralyzed", "fell asleep", "was frozen solid")
+CANT_MOVE = {PARALYSIS: "is paralyzed and can't move!", SLEEP: "is fast asleep!", FREEZE: "is frozen solid!"}
+RECOVERED = {SLEEP: "woke up!", FREEZE: "thawed out!"}
+RESIDUAL_DIVISORS = (0, 16, 8, 0, 0, 0)  # End-of-turn damage as a fraction of max HP
+
+# Types that can never receive a status
+STATUS_IMMUNE_TYPES = {
+    BURN: ("fire",),
+    POISON: ("poison", "steel"),
+    PARALYSIS: ("electric",),
+    SLEEP: (),
+    FREEZE: ("ice",),
+}
+
+def status_code(effect: Optional[StatusEffect]) -> int:
+    return STATUS_CODES.get(effect, NO_STATUS)
+
+def inflict_chance(move: Move) -> float:
+    """Chance that a hit from move inflicts its status; pure status moves always do"""
+    if move.status_effect is None:
+        return 0.0
+    if move.status_chance:
+        return move.status_chance
+    return 1.0 if move.category == MoveCategory.STATUS or move.power == 0 else 0.0
+
+def is_immune(code: int, types: List[str]) -> bool:
+    return any(t in STATUS_IMMUNE_TYPES.get(code, ()) for t in types)
+
+def sleep_turns() -> int:
+    return random.randint(1, 3)
+
+def check_can_move(code: int, turns: int) -> Tuple[bool, int, int]:
+    """Roll the before-move check for a status code: (can move, new code, new sleep turns)"""
+    if code == PARALYSIS:
+        return random.random() >= 0.25, code, turns  # 25% chance to be fully paralyzed
+    if code == SLEEP:
+        if turns > 0:
+            return False, code, turns - 1
+        return True, NO_STATUS, 0  # Woke up
+    if code == FREEZE:
+        if random.random() < 0.2:  # 20% chance to thaw
+            return True, NO_STATUS, 0
+        return False, code, turns
+    return True, code, turns
+
+def residual_damage(code: int, max_hp: int) -> int:
+    """End-of-turn damage for a status code"""
+    divisor = RESIDUAL_DIVISORS[code]
+    return max(1, max_hp // divisor) if divisor else 0
+
+# Battle steps shared by BattleEngine and TeamBattle, which keep their state in
+# different shapes; log is None when the battle is not being logged
+
+Log = Optional[Callable[[str], None]]
+
+def before_move(name: str, code: int, turns: int, log: Log = None) -> Tuple[bool, int, int]:
+    """Before-move check with its log line: (can move, new code, new sleep turns)"""
+    can_move, new_code, turns = check_can_move(code, turns)
+    if log is not None:
+        if not can_move:
+            log(f"{name} {CANT_MOVE[code]}")
+        elif new_code != code:
+            log(f"{name} {RECOVERED[code]}")
+    return can_move, new_code, turns
+
+def roll_status(name: str, code: int, target_status: int, target_hp: int, immune: bool,
+                chance: float, log: Log = None) -> Optional[Tuple[int, int]]:
+    """Roll a move's status onto its target: (code, sleep turns) if it took hold, else None"""
+    if not code or target_status or target_hp <= 0 or immune or random.random() >= chance:
+        return None
+    if log is not None:
+        log(f"{name} {INFLICTED[code]}!")
+    return code, sleep_turns() if code == SLEEP else 0
+
+def end_of_turn(name: str, code: int, hp: int, damage: int, log: Log = None) -> int:
+    """HP left after burn or poison damage at the end of a turn"""
+    if not damage or hp <= 0:
+        return hp
+    hp = max(0, hp - damage)
+    if log is not None:
+        log(f"{name} is hurt by {STATUS_NAMES[code]}! ({damage} damage)")
+        if not hp:
+            log(f"{name} fainted!")
+    return hp
 
-class StatusManager:
-    """Manages status effects for Pokemon in battle"""
-    
-    @staticmethod
-    def apply_status_damage(pokemon_name: str, current_hp: int, max_hp: int, status: Optional[StatusCondition]) -> Tuple[int, str]:
-        """Apply status effect damage and return new HP and message"""
-        if not status:
-            return current_hp, ""
-        
-        message = ""
-        if status.effect == StatusEffect.BURN:
-            damage = max(1, max_hp // 16)  # 1/16 of max HP
-            current_hp = max(0, current_hp - damage)
-            message = f"{pokemon_name} is hurt by burn! ({damage} damage)"
-            
-        elif status.effect == StatusEffect.POISON:
-            damage = max(1, max_hp // 8)   # 1/8 of max HP
-            current_hp = max(0, current_hp - damage)
-            message = f"{pokemon_name} is hurt by poison! ({damage} damage)"
-            
-        return current_hp, message
-    
-    @staticmethod
-    def can_attack(pokemon_name: str, status: Optional[StatusCondition]) -> Tuple[bool, str]:
-        """Check if Pokemon can attack based on status"""
-        if not status:
-            return True, ""
-            
-        if status.effect == StatusEffect.PARALYSIS:
-            if random.random() < 0.25:  # 25% chance to be fully paralyzed
-                return False, f"{pokemon_name} is paralyzed and can't move!"
-                
-        elif status.effect == StatusEffect.SLEEP:
-            if status.duration > 0:
-                return False, f"{pokemon_name} is fast asleep!"
-                
-        elif status.effect == StatusEffect.FREEZE:
-            if random.random() < 0.8:  # 80% chance to stay frozen
-                return False, f"{pokemon_name} is frozen solid!"
-        
-        return True, ""
-    
-    @staticmethod
-    def modify_damage(attacker_status: Optional[StatusCondition], damage: int) -> Tuple[int, str]:
-        """Modify damage based on attacker's status"""
-        if not attacker_status:
-            return damage, ""
-            
-        modifier_message = ""
-        
-        if attacker_status.effect == StatusEffect.BURN:
-            # Burn halves physical attack damage
-            damage = damage // 2
-            modifier_message = "Attack was weakened by burn!"
-            
-        elif attacker_status.effect == StatusEffect.PARALYSIS:
-            # Paralysis reduces speed and may reduce damage slightly
-            if random.random() < 0.1:  # 10% chance for reduced power
-                damage = int(damage * 0.75)
-                modifier_message = "Attack was weakened by paralysis!"
-        
-        return damage, modifier_message
-    
-    @staticmethod
-    def tick_status(status: Optional[StatusCondition]) -> Optional[StatusCondition]:
-        """Reduce status duration and return updated status"""
-        if not status:
-            return None
-            
-        if status.duration > 0:
-            status.duration -= 1
-            if status.duration <= 0:
-                return None  # Status effect ended
-                
-        return status
-    
-    @staticmethod
-    def get_status_message(pokemon_name: str, old_status: Optional[StatusCondition], new_status: Optional[StatusCondition]) -> str:
-        """Get message about status changes"""
-        if old_status and not new_status:
-            effect_name = old_status.effect.value
-            return f"{pokemon_name} recovered from {effect_name}!"
-            
-        if new_status and not old_status:
-            effect_name = new_status.effect.value
-            return f"{pokemon_name} was {effect_name}ed!"
-            
-        return ""
-    
-    @staticmethod
-    def create_status(effect: StatusEffect) -> StatusCondition:
-        """Create a new status condition with appropriate duration"""
-        duration_map = {
-            StatusEffect.BURN: -1,      # Lasts until healed
-            StatusEffect.POISON: -1,    # Lasts until healed
-            StatusEffect.PARALYSIS: -1, # Lasts until healed
-            StatusEffect.SLEEP: random.randint(1, 3),  # 1-3 turns
-            StatusEffect.FREEZE: -1,    # Lasts until healed or fire attack
-        }
-        
-        damage_map = {
-            StatusEffect.BURN: 1,
-            StatusEffect.POISON: 1,
-            StatusEffect.PARALYSIS: 0,
-            StatusEffect.SLEEP: 0,
-            StatusEffect.FREEZE: 0,
-        }
-        
-        return StatusCondition(
-            effect=effect,
-            duration=duration_map[effect],
-            damage_per_turn=damage_map[effect]
-        )
\ No newline at end of file
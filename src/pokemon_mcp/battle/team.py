@@ -0,0 +1,261 @@
+# src/pokemon_mcp/battle/team.py
+import random
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from .engine import BattleEngine, BattleLog, BattlePokemon
+from .mechanics import resolve_move
+from .moves import STRUGGLE, MoveCategory
+from .policy import MoveChoices, STRUGGLE_INDEX, expected_damage
+from .status import (NO_STATUS, BURN, PARALYSIS, STATUS_NAMES, before_move, end_of_turn, inflict_chance,
+                     is_immune, residual_damage, roll_status, status_code)
+
+TEAM_SIZE = 6
+SLOTS = 2 * TEAM_SIZE  # side * TEAM_SIZE + slot
+MOVES = 5  # Up to four known moves, then Struggle
+CODES = len(STATUS_NAMES)
+SIDES = ("team1", "team2")
+
+@dataclass
+class TeamBattleResult:
+    winner: str  # "team1", "team2" or "Draw"
+    loser: str
+    total_turns: int
+    knockouts: Dict[str, int]  # Opposing Pokemon each team knocked out
+    remaining: Dict[str, List[Dict]]
+    logs: List[BattleLog]
+
+class TeamBattle:
+    """Reusable 6v6 battle between two parties of prepared BattlePokemon
+
+    Species and move data stay shared and untouched. Everything the battle
+    mutates (HP, PP, active slots) lives in flat arrays that run() resets, and
+    every damage figure that does not depend on the random roll is computed
+    once up front, so a turn only rolls accuracy, crits and the damage range.
+    """
+
+    def __init__(self, engine: BattleEngine, team1: List[BattlePokemon], team2: List[BattlePokemon]):
+        for team in (team1, team2):
+            if not 1 <= len(team) <= TEAM_SIZE:
+                raise ValueError(f"Teams must have between 1 and {TEAM_SIZE} Pokemon")
+        self.engine = engine
+        self.sizes = (len(team1), len(team2))
+        self.members: List[Optional[BattlePokemon]] = [None] * SLOTS
+        for side, team in enumerate((team1, team2)):
+            for slot, pokemon in enumerate(team):
+                self.members[side * TEAM_SIZE + slot] = pokemon
+
+        self.max_hp = array('i', [0] * SLOTS)
+        self.speed = array('i', [0] * SLOTS)
+        self.move_count = array('B', [0] * SLOTS)
+        self.accuracy = array('B', [0] * (SLOTS * MOVES))
+        self.damaging = array('B', [0] * (SLOTS * MOVES))
+        self.start_pp = array('H', [0] * (SLOTS * MOVES))
+        self.physical = array('B', [0] * (SLOTS * MOVES))
+        self.effect = array('B', [0] * (SLOTS * MOVES))  # Status code each move may inflict
+        self.effect_chance = array('d', [0.0] * (SLOTS * MOVES))
+        # Indexed by slot * CODES + status code
+        self.residual = array('H', [0] * (SLOTS * CODES))
+        self.immune = array('B', [0] * (SLOTS * CODES))
+        # Indexed by (attacker * SLOTS + defender) * MOVES + move
+        self.base = array('d', [0.0] * (SLOTS * SLOTS * MOVES))
+        self.type_mult = array('d', [1.0] * (SLOTS * SLOTS * MOVES))
+        # Move selection data per attacker * SLOTS + defender
+        self.choices: List[Optional[MoveChoices]] = [None] * (SLOTS * SLOTS)
+
+        for a, attacker in enumerate(self.members):
+            if attacker is None:
+                continue
+            moves = attacker.moves[:MOVES - 1]
+            self.max_hp[a] = attacker.max_hp
+            self.speed[a] = attacker.get_stat('speed')
+            self.move_count[a] = len(moves)
+            for code in range(CODES):
+                self.residual[a * CODES + code] = residual_damage(code, attacker.max_hp)
+                self.immune[a * CODES + code] = is_immune(code, attacker.pokemon.types)
+            for m, move in enumerate(moves + [STRUGGLE]):
+                if move is STRUGGLE:
+                    m = MOVES - 1
+                self.accuracy[a * MOVES + m] = move.accuracy
+                self.damaging[a * MOVES + m] = move.power > 0
+                self.start_pp[a * MOVES + m] = move.pp
+                self.physical[a * MOVES + m] = move.category == MoveCategory.PHYSICAL
+                self.effect[a * MOVES + m] = status_code(move.status_effect)
+                self.effect_chance[a * MOVES + m] = inflict_chance(move)
+                for d, defender in enumerate(self.members):
+                    if defender is None or d // TEAM_SIZE == a // TEAM_SIZE:
+                        continue
+                    i = (a * SLOTS + d) * MOVES + m
+                    self.base[i], self.type_mult[i] = engine.base_damage(attacker, defender, move)
+            for d in range(SLOTS):
+                if self.members[d] is not None and d // TEAM_SIZE != a // TEAM_SIZE:
+                    i = (a * SLOTS + d) * MOVES
+                    self.choices[a * SLOTS + d] = MoveChoices(
+                        [expected_damage(self.base[i + m], self.accuracy[a * MOVES + m]) for m in range(len(moves))],
+                        self.type_mult[i:i + len(moves)])
+
+        self.hp = array('i', self.max_hp)
+        self.pp = array('H', self.start_pp)
+        self.status = array('B', [NO_STATUS] * SLOTS)
+        self.status_turns = array('B', [0] * SLOTS)
+        self.active = [0, TEAM_SIZE]
+        self.knockouts = [0, 0]
+        self.turn = 0
+        self.logs: Optional[List[BattleLog]] = None
+
+    def reset(self):
+        self.hp[:] = self.max_hp
+        self.pp[:] = self.start_pp
+        for u in range(SLOTS):
+            self.status[u] = self.status_turns[u] = 0
+        self.active[0], self.active[1] = 0, TEAM_SIZE
+        self.knockouts[0] = self.knockouts[1] = 0
+        self.turn = 0
+
+    def _log(self, message: str):
+        self.logs.append(BattleLog(turn=self.turn, message=message))
+
+    def _logger(self):
+        return self._log if self.logs is not None else None
+
+    def _move_name(self, a: int, m: int) -> str:
+        return STRUGGLE.name if m == MOVES - 1 else self.members[a].moves[m].name
+
+    def select_move(self, a: int, d: int) -> int:
+        """Move index chosen by the engine's policy; Struggle once no PP is left"""
+        m = self.engine.policy(self.choices[a * SLOTS + d], self.pp, a * MOVES)
+        return MOVES - 1 if m == STRUGGLE_INDEX else m
+
+    def _can_move(self, u: int) -> bool:
+        """Before-move status check: paralysis, sleep and freeze"""
+        if self.status[u] == NO_STATUS:
+            return True
+        can_move, self.status[u], self.status_turns[u] = before_move(
+            self.members[u].name, self.status[u], self.status_turns[u], self._logger())
+        return can_move
+
+    def _inflict(self, a: int, d: int, m: int, hp: int) -> bool:
+        """Roll the move's status effect against d at hp; True if it took hold"""
+        k = a * MOVES + m
+        code = self.effect[k]
+        inflicted = roll_status(self.members[d].name, code, self.status[d], hp,
+                                self.immune[d * CODES + code], self.effect_chance[k], self._logger())
+        if inflicted is None:
+            return False
+        self.status[d], self.status_turns[d] = inflicted
+        return True
+
+    def _status_phase(self):
+        """End-of-turn burn and poison damage for both active Pokemon"""
+        for side in (0, 1):
+            u = self.active[side]
+            hp = self.hp[u]
+            self.hp[u] = end_of_turn(self.members[u].name, self.status[u], hp,
+                                     self.residual[u * CODES + self.status[u]], self._logger())
+            if hp and not self.hp[u]:
+                self.knockouts[1 - side] += 1
+
+    def _use_move(self, a: int, d: int, m: int):
+        k = a * MOVES + m
+        if m != MOVES - 1 and self.pp[k]:
+            self.pp[k] -= 1
+        i = (a * SLOTS + d) * MOVES + m
+        hp = resolve_move(self.members[a].name, self.members[d].name, self._move_name(a, m), self.accuracy[k],
+                          self.base[i] if self.damaging[k] else None, self.type_mult[i],
+                          self.status[a] == BURN and self.physical[k], self.hp[d], self.max_hp[d],
+                          lambda hp: self._inflict(a, d, m, hp), self._logger())
+        if hp == 0 and self.hp[d]:
+            self.knockouts[a // TEAM_SIZE] += 1
+        self.hp[d] = hp
+
+    def _next_alive(self, side: int) -> int:
+        """First slot on side that can still battle, or -1"""
+        start = side * TEAM_SIZE
+        for u in range(start, start + self.sizes[side]):
+            if self.hp[u] > 0:
+                return u
+        return -1
+
+    def _hp_fraction(self, side: int) -> float:
+        start = side * TEAM_SIZE
+        end = start + self.sizes[side]
+        return sum(self.hp[start:end]) / sum(self.max_hp[start:end])
+
+    def run(self, max_turns: Optional[int] = None, log: bool = True) -> TeamBattleResult:
+        """Play one battle from full health; may be called repeatedly"""
+        winner = self.play(max_turns, log)
+        loser = "Draw" if winner == "Draw" else SIDES[1 - SIDES.index(winner)]
+        return TeamBattleResult(
+            winner=winner,
+            loser=loser,
+            total_turns=self.turn,
+            knockouts={SIDES[0]: self.knockouts[0], SIDES[1]: self.knockouts[1]},
+            remaining={SIDES[side]: self._remaining(side) for side in (0, 1)},
+            logs=self.logs or []
+        )
+
+    def play(self, max_turns: Optional[int] = None, log: bool = True) -> str:
+        """Play one battle and return the winner; the final state stays in the arrays"""
+        # Every knockout takes a few turns, so allow several 1v1 battles' worth by default
+        max_turns = max_turns or self.engine.max_turns * TEAM_SIZE
+        self.reset()
+        self.logs = [] if log else None
+        hp, speed, status, active = self.hp, self.speed, self.status, self.active
+
+        if log:
+            for side in (0, 1):
+                start = side * TEAM_SIZE
+                party = ", ".join(self.members[u].name for u in range(start, start + self.sizes[side]))
+                self._log(f"{SIDES[side]}: {party}")
+            self._log(f"Battle begins! {self.members[active[0]].name} vs {self.members[active[1]].name}")
+
+        while active[0] >= 0 and active[1] >= 0 and self.turn < max_turns:
+            self.turn += 1
+            a, b = active
+            if log:
+                self._log(f"--- Turn {self.turn} ---")
+
+            # Paralysis halves speed
+            speed_a = speed[a] // 2 if status[a] == PARALYSIS else speed[a]
+            speed_b = speed[b] // 2 if status[b] == PARALYSIS else speed[b]
+            if speed_a > speed_b or (speed_a == speed_b and random.random() < 0.5):
+                first, second = a, b
+            else:
+                first, second = b, a
+
+            if self._can_move(first):
+                self._use_move(first, second, self.select_move(first, second))
+            if hp[second] > 0 and self._can_move(second):
+                self._use_move(second, first, self.select_move(second, first))
+            self._status_phase()
+
+            # Fainted Pokemon are replaced at the end of the turn
+            for side in (0, 1):
+                if hp[active[side]] == 0:
+                    active[side] = self._next_alive(side)
+                    if log and active[side] >= 0:
+                        self._log(f"{SIDES[side]} sends out {self.members[active[side]].name}!")
+
+        if active[0] < 0 and active[1] >= 0:
+            winner = SIDES[1]
+        elif active[1] < 0 and active[0] >= 0:
+            winner = SIDES[0]
+        elif active[0] >= 0 and active[1] >= 0:
+            # Battle timeout - winner by remaining HP share
+            first_share, second_share = self._hp_fraction(0), self._hp_fraction(1)
+            if first_share != second_share:
+                winner = SIDES[0] if first_share > second_share else SIDES[1]
+                if log:
+                    self._log(f"Battle timeout! Winner determined by remaining HP: {winner}")
+            else:
+                winner = "Draw"
+        else:
+            winner = "Draw"
+        if log:
+            self._log(f"Battle concluded! Winner: {winner}")
+        return winner
+
+    def _remaining(self, side: int) -> List[Dict]:
+        start = side * TEAM_SIZE
+        return [{"name": self.members[u].name, "hp": self.hp[u], "max_hp": self.max_hp[u]}
+                for u in range(start, start + self.sizes[side])]
@@ -1,23 +1,71 @@
 # src/pokemon_mcp/config.py
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
+
+def _split_list(value: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma separated environment value into a list"""
+    if not value:
+        return None
+    return [item.strip().lower() for item in value.split(',') if item.strip()]
 
 @dataclass
 class ServerConfig:
     # API Configuration
     pokeapi_base_url: str = "https://pokeapi.co/api/v2"
     request_timeout: int = 10
+    data_backend: str = "rest"  # rest, or graphql to fetch a Pokemon with its species, chain and moves at once
+    graphql_url: str = "https://beta.pokeapi.co/graphql/v1beta"
+    graphql_batch_window: float = 0.01  # Seconds to collect concurrent lookups into one query
+    graphql_batch_size: int = 50  # Lookups per query at most
     max_retries: int = 3
+    http2: bool = True  # Needs the h2 package (httpx[http2]); falls back to HTTP/1.1 without it
+    http_max_connections: int = 20
+    http_max_keepalive: int = 10  # Idle connections kept open for reuse
+    http_keepalive_expiry: float = 30.0
+    http_prewarm_connections: int = 4  # Connections opened at startup (one suffices with HTTP/2)
     
     # Cache Configuration
     cache_duration: int = 3600  # 1 hour
     cache_directory: str = "cache"
     memory_cache_size: int = 1000
+    sprite_mode: str = "url"  # url, or image to attach sprite thumbnails to get_pokemon
+    sprite_size: int = 96  # Thumbnail edge in pixels (needs Pillow; otherwise sprites are sent as fetched)
+    sprite_memory_bytes: int = 8 * 1024 * 1024  # Encoded thumbnails kept in memory
+    
+    # Bulk data (Pokedex index, evolution graph) Configuration
+    bulk_load_concurrency: int = 16
     
     # Battle Configuration
     max_battle_turns: int = 200
     battle_timeout: int = 30
+    battle_policy: str = "heuristic"  # heuristic, greedy or epsilon_greedy
+    policy_epsilon: float = 0.1
+    battle_concurrency: int = 4  # Battles simulated at once; more are queued
+    
+    # Tool scheduling Configuration
+    tool_concurrency: int = 16
+    tool_queue_size: int = 64  # Calls waiting per tool before new ones are rejected
+    tool_timeout: float = 30.0  # Non-battle tools; battles use battle_timeout
+    cpu_workers: int = 2  # Threads running battle simulations off the event loop
+    simulation_workers: int = 2  # Processes for batch simulations, per server session; 0 uses every core
+    simulation_chunk_size: int = 250  # Battles per task sent to a worker
+    battle_store_enabled: bool = True  # Record every simulated battle
+    battle_store_path: Optional[str] = None  # Defaults to battles.sqlite3 in cache_directory
+    
+    # Profiling Configuration
+    profiling_enabled: bool = False
+    profile_sample_rate: float = 0.05  # Fraction of tool calls and battles profiled
+    profile_mode: str = "cprofile"  # cprofile (.pstats) or sample (collapsed stacks, .folded)
+    profile_interval: float = 0.005  # Seconds between stack samples in sample mode
+    profile_directory: Optional[str] = None  # Defaults to profiles/ in cache_directory
+    
+    # Warm-up Configuration
+    prewarm_enabled: bool = True
+    prewarm_top_n: int = 25
+    prewarm_species: Optional[List[str]] = None  # None uses the built-in popularity list
+    prewarm_concurrency: int = 8
+    prewarm_timeout: float = 15.0
     
     # Rate Limiting
     rate_limit_per_minute: int = 60
@@ -38,12 +86,46 @@ class ServerConfig:
         return cls(
             pokeapi_base_url=os.getenv('POKEAPI_BASE_URL', cls.pokeapi_base_url),
             request_timeout=int(os.getenv('REQUEST_TIMEOUT', cls.request_timeout)),
+            data_backend=os.getenv('DATA_BACKEND', cls.data_backend).lower(),
+            graphql_url=os.getenv('GRAPHQL_URL', cls.graphql_url),
+            graphql_batch_window=float(os.getenv('GRAPHQL_BATCH_WINDOW', cls.graphql_batch_window)),
+            graphql_batch_size=int(os.getenv('GRAPHQL_BATCH_SIZE', cls.graphql_batch_size)),
             max_retries=int(os.getenv('MAX_RETRIES', cls.max_retries)),
+            http2=os.getenv('HTTP2', str(cls.http2)).lower() in ('1', 'true', 'yes'),
+            http_max_connections=int(os.getenv('HTTP_MAX_CONNECTIONS', cls.http_max_connections)),
+            http_max_keepalive=int(os.getenv('HTTP_MAX_KEEPALIVE', cls.http_max_keepalive)),
+            http_keepalive_expiry=float(os.getenv('HTTP_KEEPALIVE_EXPIRY', cls.http_keepalive_expiry)),
+            http_prewarm_connections=int(os.getenv('HTTP_PREWARM_CONNECTIONS', cls.http_prewarm_connections)),
             cache_duration=int(os.getenv('CACHE_DURATION', cls.cache_duration)),
             cache_directory=os.getenv('CACHE_DIRECTORY', cls.cache_directory),
             memory_cache_size=int(os.getenv('MEMORY_CACHE_SIZE', cls.memory_cache_size)),
+            sprite_mode=os.getenv('SPRITE_MODE', cls.sprite_mode).lower(),
+            sprite_size=int(os.getenv('SPRITE_SIZE', cls.sprite_size)),
+            sprite_memory_bytes=int(os.getenv('SPRITE_MEMORY_BYTES', cls.sprite_memory_bytes)),
+            bulk_load_concurrency=int(os.getenv('BULK_LOAD_CONCURRENCY', cls.bulk_load_concurrency)),
             max_battle_turns=int(os.getenv('MAX_BATTLE_TURNS', cls.max_battle_turns)),
             battle_timeout=int(os.getenv('BATTLE_TIMEOUT', cls.battle_timeout)),
+            battle_policy=os.getenv('BATTLE_POLICY', cls.battle_policy),
+            policy_epsilon=float(os.getenv('POLICY_EPSILON', cls.policy_epsilon)),
+            battle_concurrency=int(os.getenv('BATTLE_CONCURRENCY', cls.battle_concurrency)),
+            tool_concurrency=int(os.getenv('TOOL_CONCURRENCY', cls.tool_concurrency)),
+            tool_queue_size=int(os.getenv('TOOL_QUEUE_SIZE', cls.tool_queue_size)),
+            tool_timeout=float(os.getenv('TOOL_TIMEOUT', cls.tool_timeout)),
+            cpu_workers=int(os.getenv('CPU_WORKERS', cls.cpu_workers)),
+            simulation_workers=int(os.getenv('SIMULATION_WORKERS', cls.simulation_workers)),
+            simulation_chunk_size=int(os.getenv('SIMULATION_CHUNK_SIZE', cls.simulation_chunk_size)),
+            battle_store_enabled=os.getenv('BATTLE_STORE_ENABLED', str(cls.battle_store_enabled)).lower() in ('1', 'true', 'yes'),
+            battle_store_path=os.getenv('BATTLE_STORE_PATH'),
+            profiling_enabled=os.getenv('PROFILING_ENABLED', str(cls.profiling_enabled)).lower() in ('1', 'true', 'yes'),
+            profile_sample_rate=float(os.getenv('PROFILE_SAMPLE_RATE', cls.profile_sample_rate)),
+            profile_mode=os.getenv('PROFILE_MODE', cls.profile_mode),
+            profile_interval=float(os.getenv('PROFILE_INTERVAL', cls.profile_interval)),
+            profile_directory=os.getenv('PROFILE_DIRECTORY'),
+            prewarm_enabled=os.getenv('PREWARM_ENABLED', str(cls.prewarm_enabled)).lower() in ('1', 'true', 'yes'),
+            prewarm_top_n=int(os.getenv('PREWARM_TOP_N', cls.prewarm_top_n)),
+            prewarm_species=_split_list(os.getenv('PREWARM_SPECIES')),
+            prewarm_concurrency=int(os.getenv('PREWARM_CONCURRENCY', cls.prewarm_concurrency)),
+            prewarm_timeout=float(os.getenv('PREWARM_TIMEOUT', cls.prewarm_timeout)),
             rate_limit_per_minute=int(os.getenv('RATE_LIMIT_PER_MINUTE', cls.rate_limit_per_minute)),
             rate_limit_burst=int(os.getenv('RATE_LIMIT_BURST', cls.rate_limit_burst)),
             log_level=os.getenv('LOG_LEVEL', cls.log_level),
@@ -1,2 +1,22 @@
 # src/pokemon_mcp/data/__init__.py
-from .pokemon_client import PokemonClient, Pokemon, PokemonStats
\ No newline at end of file
+import importlib
+
+# Public names are resolved lazily so importing the package stays cheap
+_EXPORTS = {
+    "PokemonClient": ".pokemon_client",
+    "Pokemon": ".pokemon_client",
+    "PokemonStats": ".pokemon_client",
+    "GraphQLPokemonClient": ".graphql_client",
+    "Learnset": ".learnset",
+    "MoveTable": ".move_table",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
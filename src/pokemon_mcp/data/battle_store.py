@@ -0,0 +1,226 @@
+# src/pokemon_mcp/data/battle_store.py
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# (species, types, max HP) for one party member
+Member = Tuple[str, Sequence[str], int]
+
+WINNER_CODES = {"team1": 0, "team2": 1, "Draw": 2}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS battles (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    kind TEXT NOT NULL,
+    policy TEXT NOT NULL,
+    matchup TEXT NOT NULL,
+    seed INTEGER,
+    winner INTEGER NOT NULL,
+    turns INTEGER NOT NULL,
+    hp_left1 INTEGER NOT NULL,
+    hp_left2 INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS battles_matchup ON battles (matchup);
+CREATE TABLE IF NOT EXISTS battle_members (
+    battle_id INTEGER NOT NULL,
+    side INTEGER NOT NULL,
+    species TEXT NOT NULL,
+    type1 TEXT NOT NULL,
+    type2 TEXT,
+    won INTEGER NOT NULL,
+    hp_left INTEGER NOT NULL,
+    max_hp INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS battle_members_species ON battle_members (species);
+CREATE INDEX IF NOT EXISTS battle_members_type1 ON battle_members (type1);
+CREATE INDEX IF NOT EXISTS battle_members_type2 ON battle_members (type2);
+"""
+
+def matchup_key(policy: str, team1: Sequence[str], team2: Sequence[str]) -> str:
+    """Identity of a matchup: the move policy and both parties in order"""
+    return f"{policy}|{'+'.join(team1)}|{'+'.join(team2)}".lower()
+
+class BattleStore:
+    """Append-only SQLite history of simulated battles
+
+    record() and record_series() only put the result on a queue. A writer
+    thread creates the schema, owns the write connection and inserts queued
+    results in batched transactions, so recording never adds latency to a
+    tool call. Queries open their own connection and are meant to run in an
+    executor.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0, batch_size: int = 5000):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._ready = threading.Event()  # Set once the writer has created the schema
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def start(self):
+        if self._writer is not None:
+            return
+        self._writer = threading.Thread(target=self._write_loop, name="battle-store", daemon=True)
+        self._writer.start()
+
+    def _query(self) -> sqlite3.Connection:
+        """Read connection, once the writer has set up the database"""
+        self.start()
+        self._ready.wait(30)
+        return self._connect()
+
+    def record(self, kind: str, policy: str, team1: Sequence[Member], team2: Sequence[Member],
+               winner: str, turns: int, hp_left: Sequence[int], seed: Optional[int] = None):
+        """Queue one battle; hp_left lists team1's members then team2's"""
+        self.start()
+        self._queue.put((kind, policy, tuple(team1), tuple(team2), seed,
+                         [(WINNER_CODES[winner], turns, tuple(hp_left))]))
+
+    def record_series(self, kind: str, policy: str, team1: Sequence[Member], team2: Sequence[Member],
+                      outcomes: List[Tuple[int, int, Sequence[int]]], seed: Optional[int] = None):
+        """Queue many battles of one matchup as (winner code, turns, hp_left) tuples"""
+        self.start()
+        self._queue.put((kind, policy, tuple(team1), tuple(team2), seed, outcomes))
+
+    def _write_loop(self):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = self._connect()
+            connection.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Battle store unavailable: {e}", file=sys.stderr)
+            return
+        finally:
+            self._ready.set()
+        try:
+            while not self._stopped.is_set() or not self._queue.empty():
+                pending, size = [], 0
+                deadline = time.monotonic() + self.flush_interval
+                flushed = []
+                while size < self.batch_size:
+                    try:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    if isinstance(item, threading.Event):  # flush() marker
+                        flushed.append(item)
+                        break
+                    pending.append(item)
+                    size += len(item[5])
+                if pending:
+                    try:
+                        self._insert(connection, pending)
+                    except sqlite3.Error as e:
+                        print(f"Battle store write failed: {e}", file=sys.stderr)
+                for event in flushed:
+                    event.set()
+        finally:
+            connection.close()
+
+    def _insert(self, connection: sqlite3.Connection, pending: List):
+        now = time.time()
+        cursor = connection.cursor()
+        # Take the write lock before reading the next id; other server processes may share the file
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            next_id = (cursor.execute("SELECT COALESCE(MAX(id), 0) FROM battles").fetchone()[0]) + 1
+            battles, members = [], []
+            for kind, policy, team1, team2, seed, outcomes in pending:
+                key = matchup_key(policy, [m[0] for m in team1], [m[0] for m in team2])
+                split = len(team1)
+                for winner, turns, hp_left in outcomes:
+                    battles.append((next_id, now, kind, policy, key, seed, winner, turns,
+                                    sum(hp_left[:split]), sum(hp_left[split:])))
+                    for i, (species, types, max_hp) in enumerate(team1 + team2):
+                        side = 0 if i < split else 1
+                        members.append((next_id, side, species, types[0], types[1] if len(types) > 1 else None,
+                                        int(winner == side), hp_left[i], max_hp))
+                    next_id += 1
+            cursor.executemany("INSERT INTO battles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", battles)
+            cursor.executemany("INSERT INTO battle_members VALUES (?, ?, ?, ?, ?, ?, ?, ?)", members)
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until everything queued so far has been written"""
+        if self._writer is None:
+            return True
+        if not self._writer.is_alive():
+            return False
+        event = threading.Event()
+        self._queue.put(event)
+        return event.wait(timeout)
+
+    def close(self):
+        self._stopped.set()
+        if self._writer is not None:
+            self._writer.join(timeout=10)
+            self._writer = None
+
+    def matchup_summary(self, policy: str, team1: Sequence[str], team2: Sequence[str]) -> Dict:
+        """Aggregated history of one matchup, in the shape of a simulation summary"""
+        with closing(self._query()) as connection:
+            battles, wins1, wins2, draws, turns = connection.execute(
+                "SELECT COUNT(*), SUM(winner = 0), SUM(winner = 1), SUM(winner = 2), AVG(turns) "
+                "FROM battles WHERE matchup = ?", (matchup_key(policy, team1, team2),)).fetchone()
+        n = max(1, battles)
+        return {
+            "battles": battles,
+            "wins": {"team1": wins1 or 0, "team2": wins2 or 0, "Draw": draws or 0},
+            "win_rate": {"team1": round((wins1 or 0) / n, 4), "team2": round((wins2 or 0) / n, 4)},
+            "average_turns": round(turns or 0.0, 2),
+        }
+
+    def member_stats(self, species: Optional[str] = None, type_name: Optional[str] = None,
+                     group_by: Optional[str] = None, min_battles: int = 1, limit: int = 20) -> Dict:
+        """Win rate and HP left of party members, filtered by species or type, optionally per species"""
+        where, params = [], []
+        if species:
+            where.append("species = ?")
+            params.append(species.lower())
+        if type_name:
+            where.append("(type1 = ? OR type2 = ?)")
+            params += [type_name.lower()] * 2
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        columns = ("COUNT(*), SUM(won), AVG(CAST(hp_left AS REAL) / max_hp), "
+                   "SUM(hp_left = 0)")
+
+        with closing(self._query()) as connection:
+            if group_by == "species":
+                rows = connection.execute(
+                    f"SELECT species, {columns} FROM battle_members {clause} GROUP BY species "
+                    f"HAVING COUNT(*) >= ? ORDER BY SUM(won) * 1.0 / COUNT(*) DESC, COUNT(*) DESC LIMIT ?",
+                    params + [min_battles, limit]).fetchall()
+                return {"groups": [{"species": row[0], **_member_summary(*row[1:])} for row in rows]}
+            if group_by is not None:
+                raise ValueError("group_by must be 'species' or omitted")
+            row = connection.execute(f"SELECT {columns} FROM battle_members {clause}", params).fetchone()
+            return {"all": _member_summary(*row)}
+
+def _member_summary(appearances: int, wins: Optional[int], hp_share: Optional[float],
+                    fainted: Optional[int]) -> Dict:
+    return {
+        "appearances": appearances,
+        "wins": wins or 0,
+        "win_rate": round((wins or 0) / appearances, 4) if appearances else None,
+        "average_hp_left": round(hp_share or 0.0, 4),
+        "fainted": fainted or 0,
+    }
@@ -0,0 +1,205 @@
+# src/pokemon_mcp/data/cache.py
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+# (status, value, etag, last_modified) as returned by a conditional fetch
+FetchResult = Tuple[int, Any, Optional[str], Optional[str]]
+
+@dataclass
+class CacheEntry:
+    value: Any
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    version: int = 1  # Bumped whenever revalidation brings back changed content
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+# Upper bounds in seconds of the age buckets reported by TTLCache.stats()
+AGE_BUCKETS = ((60, "<1m"), (600, "<10m"), (3600, "<1h"), (86400, "<1d"))
+
+def estimate_size(value: Any, seen: Optional[Set[int]] = None) -> int:
+    """Approximate bytes held by a value and everything it references
+
+    Objects already in `seen` are not counted again, so data shared between
+    entries (such as a Move referenced by many learnsets) counts once.
+    """
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return size
+    if isinstance(value, dict):
+        return size + sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, seen) for item in value)
+    if is_dataclass(value):
+        return size + sum(estimate_size(getattr(value, f.name), seen) for f in fields(value))
+    if hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), seen)
+    for cls in type(value).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(value, name):
+                size += estimate_size(getattr(value, name), seen)
+    return size
+
+class TTLCache:
+    """Bounded LRU cache whose entries go stale after ttl seconds
+
+    Stale entries are kept (with their validators) so they can still be
+    served while a conditional request revalidates them in the background.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float = 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._revalidating: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def peek(self, key: str) -> Optional[CacheEntry]:
+        """Entry without touching its LRU position or the hit counters"""
+        return self._entries.get(key)
+
+    def keys(self):
+        return self._entries.keys()
+
+    def get(self, key: str, default=None):
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else default
+
+    def is_stale(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.fetched_at >= self.ttl
+
+    def set(self, key: str, value: Any, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> CacheEntry:
+        previous = self._entries.get(key)
+        # The version only moves when the content does, not on every refetch
+        version = 1 if previous is None else previous.version + (previous.value != value)
+        entry = CacheEntry(value, time.time(), etag, last_modified, version=version)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def pop(self, key: str) -> Optional[CacheEntry]:
+        return self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def invalidate(self, keys: Optional[Iterable[str]] = None) -> int:
+        """Drop the given entries, or all of them; returns how many were removed"""
+        if keys is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        return sum(self._entries.pop(key, None) is not None for key in keys)
+
+    def entry_sizes(self) -> Dict[str, int]:
+        """Estimated bytes per key, least recently used first; shared data counts toward its first user"""
+        seen: Set[int] = set()
+        return {key: estimate_size(entry.value, seen) for key, entry in self._entries.items()}
+
+    def evict_to(self, max_bytes: int) -> Dict:
+        """Drop least recently used entries until the estimated size is at most max_bytes"""
+        sizes = self.entry_sizes()
+        before = total = sum(sizes.values())
+        evicted = 0
+        for key, size in sizes.items():
+            if total <= max_bytes:
+                break
+            del self._entries[key]
+            total -= size
+            evicted += 1
+        self.evictions += evicted
+        return {"evicted": evicted, "bytes_before": before, "bytes_after": total}
+
+    def stats(self) -> Dict:
+        """Entry count, estimated size, hit ratio and age distribution"""
+        now = time.time()
+        ages = sorted(now - entry.fetched_at for entry in self._entries.values())
+        buckets = {label: 0 for _, label in AGE_BUCKETS}
+        buckets["older"] = 0
+        for age in ages:
+            label = next((label for limit, label in AGE_BUCKETS if age < limit), "older")
+            buckets[label] += 1
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_size": self.max_size,
+            "estimated_bytes": sum(self.entry_sizes().values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "stale": sum(age >= self.ttl for age in ages),
+            "ttl_seconds": self.ttl,
+            "age_seconds": {
+                "min": round(ages[0], 1) if ages else None,
+                "median": round(ages[len(ages) // 2], 1) if ages else None,
+                "max": round(ages[-1], 1) if ages else None,
+                "buckets": buckets,
+            },
+        }
+
+    def revalidate(self, key: str, fetch: Callable[[Dict[str, str]], Awaitable[FetchResult]]):
+        """Refresh a stale entry in the background using its ETag / Last-Modified validators
+
+        A 304 only renews the entry's timestamp, and so does a 200 carrying
+        the same content (GraphQL never answers 304); a changed 200 replaces
+        the entry with a new version. At most one revalidation per key is in
+        flight, and failures keep serving the stale value.
+        """
+        entry = self._entries.get(key)
+        if entry is None or key in self._revalidating:
+            return
+
+        async def run():
+            try:
+                status, value, etag, last_modified = await fetch(entry.conditional_headers())
+                if status == 304:
+                    entry.fetched_at = time.time()
+                elif status == 200 and value is not None and value == entry.value:
+                    entry.fetched_at = time.time()
+                    entry.etag = etag or entry.etag
+                    entry.last_modified = last_modified or entry.last_modified
+                elif status == 200 and value is not None:
+                    self.set(key, value, etag or entry.etag, last_modified or entry.last_modified)
+            except Exception as e:
+                print(f"Revalidation of {key} failed: {e}", file=sys.stderr)
+            finally:
+                self._revalidating.pop(key, None)
+
+        self._revalidating[key] = asyncio.ensure_future(run())
@@ -0,0 +1,262 @@
+# src/pokemon_mcp/data/evolution.py
+import asyncio
+import json
+import os
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .pokemon_client import PokemonClient
+
+SNAPSHOT_VERSION = 2
+
+@dataclass(frozen=True)
+class EvolutionStage:
+    name: str
+    evolves_from: Optional[str] = None
+    trigger: Optional[str] = None
+    min_level: Optional[int] = None
+    item: Optional[str] = None
+    held_item: Optional[str] = None
+    is_baby: bool = False
+    species_id: int = 0
+
+    def to_record(self) -> List:
+        return [self.name, self.evolves_from, self.trigger, self.min_level, self.item, self.held_item,
+                self.is_baby, self.species_id]
+
+class EvolutionChain:
+    """Complete (possibly branching) evolution tree, shared by every member species"""
+
+    def __init__(self, chain_id: int, stages: List[EvolutionStage]):
+        self.chain_id = chain_id
+        self.stages: Dict[str, EvolutionStage] = {stage.name: stage for stage in stages}
+        self.children: Dict[str, List[str]] = {stage.name: [] for stage in stages}
+        for stage in stages:
+            if stage.evolves_from in self.children:
+                self.children[stage.evolves_from].append(stage.name)
+        self.root = next(stage.name for stage in stages if stage.evolves_from not in self.stages)
+        self._tree: Optional[Dict] = None
+
+    @property
+    def is_branching(self) -> bool:
+        return any(len(children) > 1 for children in self.children.values())
+
+    def ordered(self) -> List[EvolutionStage]:
+        """Stages in breadth-first order from the base form"""
+        order, queue = [], [self.root]
+        while queue:
+            name = queue.pop(0)
+            order.append(self.stages[name])
+            queue.extend(self.children[name])
+        return order
+
+    def depth(self) -> int:
+        """Number of stages along the longest evolution path"""
+        def walk(name: str) -> int:
+            return 1 + max((walk(child) for child in self.children[name]), default=0)
+        return walk(self.root)
+
+    def ancestors(self, name: str) -> List[str]:
+        """Species that evolve into name, nearest first"""
+        path = []
+        parent = self.stages[name].evolves_from
+        while parent in self.stages:
+            path.append(parent)
+            parent = self.stages[parent].evolves_from
+        return path
+
+    def tree(self) -> Dict:
+        """Nested tree of the chain; built once and reused"""
+        if self._tree is None:
+            def node(name: str) -> Dict:
+                stage = self.stages[name]
+                entry = {"name": name}
+                if stage.evolves_from:
+                    entry.update(trigger=stage.trigger, min_level=stage.min_level,
+                                 item=stage.item, held_item=stage.held_item)
+                entry["evolves_to"] = [node(child) for child in self.children[name]]
+                return entry
+            self._tree = node(self.root)
+        return self._tree
+
+    def to_record(self) -> List:
+        return [self.chain_id, [stage.to_record() for stage in self.ordered()]]
+
+def _name_of(field: Optional[Dict]) -> Optional[str]:
+    return field.get("name") if field else None
+
+def species_id_from_url(url: str) -> int:
+    """Trailing ID of a pokemon-species URL, or 0"""
+    tail = url.rstrip("/").rsplit("/", 1)[-1]
+    return int(tail) if tail.isdigit() else 0
+
+def stages_from_api(chain_json: Dict) -> List[EvolutionStage]:
+    """Flatten a PokeAPI evolution-chain payload, keeping every branch"""
+    stages = []
+    pending = [(chain_json["chain"], None)]
+    while pending:
+        node, parent = pending.pop(0)
+        details = (node.get("evolution_details") or [{}])[0]
+        stages.append(EvolutionStage(
+            name=node["species"]["name"],
+            evolves_from=parent,
+            trigger=_name_of(details.get("trigger")) if parent else None,
+            min_level=details.get("min_level") if parent else None,
+            item=_name_of(details.get("item")) if parent else None,
+            held_item=_name_of(details.get("held_item")) if parent else None,
+            is_baby=node.get("is_baby", False),
+            species_id=species_id_from_url(node["species"].get("url", ""))
+        ))
+        pending.extend((child, node["species"]["name"]) for child in node.get("evolves_to", []))
+    return stages
+
+def stages_from_graphql(chain: Dict) -> List[EvolutionStage]:
+    """Stages of a GraphQL evolution chain, whose species reference their parent by id"""
+    species = chain["pokemon_v2_pokemonspecies"]
+    names = {row["id"]: row["name"] for row in species}
+    stages = []
+    for row in species:
+        parent = names.get(row.get("evolves_from_species_id"))
+        details = (row.get("pokemon_v2_pokemonevolutions") or [{}])[0]
+        stages.append(EvolutionStage(
+            name=row["name"],
+            evolves_from=parent,
+            trigger=_name_of(details.get("pokemon_v2_evolutiontrigger")) if parent else None,
+            min_level=details.get("min_level") if parent else None,
+            item=_name_of(details.get("pokemon_v2_item")) if parent else None,
+            held_item=_name_of(details.get("pokemonV2ItemByHeldItemId")) if parent else None,
+            is_baby=row.get("is_baby", False),
+            species_id=row["id"]
+        ))
+    return stages
+
+class EvolutionGraph:
+    """Every known evolution chain, indexed by member species"""
+
+    def __init__(self):
+        self._by_species: Dict[str, EvolutionChain] = {}
+        self._names: Dict[int, str] = {}  # species ID -> name
+
+    def __len__(self) -> int:
+        return len(self._by_species)
+
+    def __contains__(self, species: str) -> bool:
+        return species in self._by_species
+
+    def add(self, chain: EvolutionChain) -> EvolutionChain:
+        """Register a chain under each of its member species"""
+        existing = self._by_species.get(chain.root)
+        if existing is not None and existing.stages.keys() == chain.stages.keys():
+            return existing
+        for name, stage in chain.stages.items():
+            self._by_species[name] = chain
+            if stage.species_id:
+                self._names[stage.species_id] = name
+        return chain
+
+    def add_api_chain(self, chain_json: Dict) -> EvolutionChain:
+        return self.add(EvolutionChain(chain_json.get("id", 0), stages_from_api(chain_json)))
+
+    def get(self, species: str) -> Optional[EvolutionChain]:
+        return self._by_species.get(species.lower())
+
+    def species_name(self, species_id: int) -> Optional[str]:
+        """Name of a member species by its ID"""
+        return self._names.get(species_id)
+
+    def evolves_from(self, species: str) -> Optional[str]:
+        """Direct pre-evolution of species, if any"""
+        chain = self.get(species)
+        return chain.stages[species.lower()].evolves_from if chain else None
+
+    def evolves_into(self, species: str) -> List[str]:
+        """Species that species evolves into directly"""
+        chain = self.get(species)
+        return list(chain.children[species.lower()]) if chain else []
+
+    def describe(self, species: str) -> Optional[Dict]:
+        """Evolution data for one member, in the shape served by get_pokemon"""
+        chain = self.get(species)
+        if chain is None:
+            return None
+        name = species.lower()
+        evolution_chain = []
+        for stage in chain.ordered():
+            entry = {"name": stage.name, "is_baby": stage.is_baby}
+            if stage.evolves_from:
+                entry.update(evolves_from=stage.evolves_from, trigger=stage.trigger or "unknown",
+                             min_level=stage.min_level, item=stage.item, held_item=stage.held_item)
+            evolution_chain.append(entry)
+        return {
+            "evolution_chain": evolution_chain,
+            "total_stages": chain.depth(),
+            "is_branching": chain.is_branching,
+            "evolves_from": chain.stages[name].evolves_from,
+            "pre_evolutions": chain.ancestors(name),
+            "evolves_into": list(chain.children[name]),
+            "evolution_tree": chain.tree(),
+        }
+
+    def chains(self) -> List[EvolutionChain]:
+        unique = {id(chain): chain for chain in self._by_species.values()}
+        return list(unique.values())
+
+def _snapshot_path(cache_directory: str) -> str:
+    return os.path.join(cache_directory, "evolution.json")
+
+def load_snapshot(graph: EvolutionGraph, cache_directory: str) -> bool:
+    """Fill graph from a previously saved snapshot; False when there is none"""
+    try:
+        with open(_snapshot_path(cache_directory), encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != SNAPSHOT_VERSION:
+            return False
+        for chain_id, stages in data["chains"]:
+            graph.add(EvolutionChain(chain_id, [EvolutionStage(*stage) for stage in stages]))
+        return True
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        print(f"Ignoring unreadable evolution snapshot: {e}", file=sys.stderr)
+        return False
+
+def save_snapshot(graph: EvolutionGraph, cache_directory: str):
+    os.makedirs(cache_directory, exist_ok=True)
+    path = _snapshot_path(cache_directory)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"version": SNAPSHOT_VERSION, "chains": [chain.to_record() for chain in graph.chains()]},
+                  f, separators=(",", ":"))
+    os.replace(path + ".tmp", path)
+
+async def load_evolution_graph(client: "PokemonClient", cache_directory: str,
+                               concurrency: int = 16) -> EvolutionGraph:
+    """Fill the client's evolution graph in bulk, from the snapshot or from the API once"""
+    graph = client.evolution_graph
+    if load_snapshot(graph, cache_directory):
+        return graph
+
+    print("Building evolution graph from the API...", file=sys.stderr, flush=True)
+    response = await client.client.get(f"{client.base_url}/evolution-chain", params={"limit": 100000})
+    response.raise_for_status()
+    urls = [entry["url"] for entry in response.json()["results"]]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    failed = []
+
+    async def fetch(url: str):
+        # One bad chain must not sink the whole build; it is fetched on first lookup instead
+        try:
+            async with semaphore:
+                chain_response = await client.client.get(url)
+            chain_response.raise_for_status()
+            graph.add_api_chain(chain_response.json())
+        except Exception as e:
+            failed.append(f"{url}: {e}")
+
+    await asyncio.gather(*(fetch(url) for url in urls))
+    if failed:
+        print(f"Skipped {len(failed)} of {len(urls)} evolution chains (first: {failed[0]})", file=sys.stderr)
+    if len(graph):
+        save_snapshot(graph, cache_directory)
+    return graph
@@ -0,0 +1,284 @@
+# src/pokemon_mcp/data/graphql_client.py
+import asyncio
+import json
+import sys
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+from ..battle.moves import Move, MoveClient, move_from_slim
+from ..config import ServerConfig
+from .cache import FetchResult
+from .evolution import EvolutionChain, stages_from_graphql
+from .pokemon_client import PokemonClient, pokemon_from_slim
+
+# language_id 9 is English
+_MOVE_FIELDS = """
+    name power accuracy pp priority move_effect_chance
+    pokemon_v2_type { name }
+    pokemon_v2_movedamageclass { name }
+    pokemon_v2_moveeffect {
+        pokemon_v2_moveeffecteffecttexts(where: {language_id: {_eq: 9}}, limit: 1) { effect }
+    }
+    pokemon_v2_moveflavortexts(where: {language_id: {_eq: 9}}, order_by: {version_group_id: desc}, limit: 1) {
+        flavor_text
+    }
+"""
+
+_SPECIES_FIELDS = """
+    id name
+    pokemon_v2_pokemonspeciesgeneras(where: {language_id: {_eq: 9}}, limit: 1) { genus }
+    pokemon_v2_pokemonhabitat { name }
+    pokemon_v2_evolutionchain {
+        id
+        pokemon_v2_pokemonspecies(order_by: {order: asc}) {
+            name is_baby evolves_from_species_id id
+            pokemon_v2_pokemonevolutions(limit: 1) {
+                min_level
+                pokemon_v2_evolutiontrigger { name }
+                pokemon_v2_item { name }
+                pokemonV2ItemByHeldItemId { name }
+            }
+        }
+    }
+"""
+
+# A Pokemon with its species, full evolution chain and every learnable move, in one round trip.
+# distinct_on keeps one learnset row per move, from the latest version group.
+POKEMON_QUERY = """
+query Pokemon($names: [String!], $ids: [Int!]) {
+  pokemon: pokemon_v2_pokemon(where: {_or: [{name: {_in: $names}}, {id: {_in: $ids}}]}) {
+    id name height weight base_experience
+    pokemon_v2_pokemontypes(order_by: {slot: asc}) { pokemon_v2_type { name } }
+    pokemon_v2_pokemonstats { base_stat pokemon_v2_stat { name } }
+    pokemon_v2_pokemonabilities(order_by: {slot: asc}) { pokemon_v2_ability { name } }
+    pokemon_v2_pokemonsprites { sprites }
+    pokemon_v2_pokemonmoves(distinct_on: move_id, order_by: [{move_id: asc}, {version_group_id: desc}]) {
+      level
+      pokemon_v2_movelearnmethod { name }
+      pokemon_v2_move { %s }
+    }
+    pokemon_v2_pokemonspecy { %s }
+  }
+}
+""" % (_MOVE_FIELDS, _SPECIES_FIELDS)
+
+SPECIES_QUERY = """
+query Species($ids: [Int!]) {
+  species: pokemon_v2_pokemonspecies(where: {id: {_in: $ids}}) { %s }
+}
+""" % _SPECIES_FIELDS
+
+MOVE_QUERY = """
+query Moves($names: [String!]) {
+  moves: pokemon_v2_move(where: {name: {_in: $names}}) { %s }
+}
+""" % _MOVE_FIELDS
+
+SPRITE_BASE = "https://raw.githubusercontent.com/PokeAPI/sprites/master/"
+
+class Batcher:
+    """Combines lookups made within a short window into one request
+
+    load() returns the value for a key once a batch containing it has been
+    fetched. A batch is sent when the window closes or max_size keys are
+    waiting, and concurrent lookups of the same key share one slot.
+    """
+
+    def __init__(self, fetch: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+                 window: float = 0.01, max_size: int = 50):
+        self.fetch = fetch
+        self.window = window
+        self.max_size = max(1, max_size)
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def load(self, key: str) -> Any:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if len(self._pending) >= self.max_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+        # A cancelled caller must not cancel the lookup for the others sharing it
+        return await asyncio.shield(future)
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: Dict[str, asyncio.Future]):
+        try:
+            results = await self.fetch(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+class _GraphQL:
+    """POSTs queries to PokeAPI's GraphQL endpoint over a client's HTTP connection"""
+
+    def __init__(self, owner, url: str):
+        self.owner = owner
+        self.url = url
+
+    async def query(self, query: str, variables: Dict) -> Dict:
+        response = await self.owner.client.post(self.url, json={"query": query, "variables": variables})
+        response.raise_for_status()
+        body = response.json()
+        if body.get("errors"):
+            raise RuntimeError(f"GraphQL error: {body['errors'][0].get('message')}")
+        return body["data"]
+
+def _first(rows: Optional[Sequence[Dict]], *path: str):
+    value: Any = rows[0] if rows else None
+    for key in path:
+        value = value.get(key) if value else None
+    return value
+
+def move_slim_from_graphql(data: Dict) -> Dict:
+    """The slimmed /move shape built from a GraphQL move"""
+    effect = data.get("pokemon_v2_moveeffect") or {}
+    return {
+        "name": data["name"],
+        "type": _first([data], "pokemon_v2_type", "name") or "normal",
+        "damage_class": _first([data], "pokemon_v2_movedamageclass", "name") or "status",
+        "power": data.get("power"),
+        "accuracy": data.get("accuracy"),
+        "pp": data.get("pp"),
+        "priority": data.get("priority") or 0,
+        "effect_chance": data.get("move_effect_chance"),
+        "effect": _first(effect.get("pokemon_v2_moveeffecteffecttexts"), "effect") or "",
+        "flavor_text": _first(data.get("pokemon_v2_moveflavortexts"), "flavor_text"),
+    }
+
+def _sprite_url(rows: Optional[Sequence[Dict]]) -> str:
+    sprites = _first(rows, "sprites")
+    if isinstance(sprites, str):  # Served as a JSON string by some versions of the schema
+        sprites = json.loads(sprites)
+    url = (sprites or {}).get("front_default") or ""
+    if url.startswith("/media/"):
+        url = SPRITE_BASE + url[len("/media/"):]
+    return url
+
+def pokemon_slim_from_graphql(data: Dict, base_url: str) -> Dict:
+    """The slimmed /pokemon shape built from a GraphQL Pokemon"""
+    rows = data.get("pokemon_v2_pokemonmoves") or []
+    species = data.get("pokemon_v2_pokemonspecy") or {}
+    return {
+        "id": data["id"],
+        "name": data["name"],
+        "types": [row["pokemon_v2_type"]["name"] for row in data.get("pokemon_v2_pokemontypes") or []],
+        "stats": {row["pokemon_v2_stat"]["name"]: row["base_stat"] for row in data.get("pokemon_v2_pokemonstats") or []},
+        "abilities": [row["pokemon_v2_ability"]["name"] for row in data.get("pokemon_v2_pokemonabilities") or []],
+        "moves": [row["pokemon_v2_move"]["name"] for row in rows],
+        "learn_details": [[_first([row], "pokemon_v2_movelearnmethod", "name"), row.get("level") or 0] for row in rows],
+        "height": data.get("height") or 0,
+        "weight": data.get("weight") or 0,
+        "base_experience": data.get("base_experience") or 0,
+        "sprite_url": _sprite_url(data.get("pokemon_v2_pokemonsprites")),
+        # Same URL the REST backend reports, so evolution lookups share one cache key
+        "species_url": f"{base_url}/pokemon-species/{species['id']}/" if species.get("id") else "",
+    }
+
+class GraphQLMoveClient(MoveClient):
+    """MoveClient that fetches moves through GraphQL, many per request"""
+
+    def __init__(self, config: Optional[ServerConfig] = None):
+        config = config or ServerConfig()
+        super().__init__(config)
+        self._graphql = _GraphQL(self, config.graphql_url)
+        self._moves = Batcher(self._fetch_moves, config.graphql_batch_window, config.graphql_batch_size)
+
+    async def _fetch_moves(self, names: List[str]) -> Dict[str, Move]:
+        data = await self._graphql.query(MOVE_QUERY, {"names": names})
+        return {row["name"]: move_from_slim(move_slim_from_graphql(row)) for row in data["moves"]}
+
+    async def _fetch_move(self, move_name: str, headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        # GraphQL has no validators; a revalidation simply fetches the move again
+        move = await self._moves.load(move_name.lower().replace(' ', '-'))
+        return (200 if move else 404), move, None, None
+
+class GraphQLPokemonClient(PokemonClient):
+    """PokemonClient that fetches a Pokemon, its species, evolution chain and moves in one GraphQL query
+
+    Lookups made within GRAPHQL_BATCH_WINDOW seconds of each other share a
+    request. The moves and the evolution chain that come with a Pokemon
+    prime the move client and the evolution cache, so building a battle or
+    answering get_pokemon needs no further round trips.
+    """
+
+    def __init__(self, config: Optional[ServerConfig] = None, move_client: Optional[MoveClient] = None):
+        config = config or ServerConfig()
+        super().__init__(config)
+        self._graphql = _GraphQL(self, config.graphql_url)
+        self._move_client = move_client
+        self._pokemon = Batcher(self._fetch_batch, config.graphql_batch_window, config.graphql_batch_size)
+        self._species = Batcher(self._fetch_species, config.graphql_batch_window, config.graphql_batch_size)
+
+    @property
+    def move_client(self) -> MoveClient:
+        if self._move_client is None:
+            from ..battle.moves import get_move_client
+            self._move_client = get_move_client()
+        return self._move_client
+
+    async def _fetch_pokemon(self, name_or_id: str, headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        pokemon = await self._pokemon.load(str(name_or_id).lower())
+        return (200 if pokemon else 404), pokemon, None, None
+
+    async def _fetch_batch(self, keys: List[str]) -> Dict[str, Any]:
+        ids = [int(key) for key in keys if key.isdigit()]
+        names = [key for key in keys if not key.isdigit()]
+        data = await self._graphql.query(POKEMON_QUERY, {"names": names, "ids": ids})
+        found = {}
+        for row in data["pokemon"]:
+            pokemon = pokemon_from_slim(pokemon_slim_from_graphql(row, self.base_url))
+            found[pokemon.name] = found[str(pokemon.id)] = pokemon
+            for move_row in row.get("pokemon_v2_pokemonmoves") or []:
+                self.move_client.remember(move_from_slim(move_slim_from_graphql(move_row["pokemon_v2_move"])))
+            species = row.get("pokemon_v2_pokemonspecy")
+            if species and pokemon.species_url:
+                self._evolution_cache[pokemon.species_url] = self._describe_species(species)
+        return found
+
+    async def _fetch_species(self, keys: List[str]) -> Dict[str, Any]:
+        data = await self._graphql.query(SPECIES_QUERY, {"ids": [int(key) for key in keys]})
+        return {str(row["id"]): row for row in data["species"]}
+
+    def _describe_species(self, species: Dict) -> Dict:
+        chain = species.get("pokemon_v2_evolutionchain")
+        if chain and species["name"] not in self.evolution_graph:
+            self.evolution_graph.add(EvolutionChain(chain["id"], stages_from_graphql(chain)))
+        result = self.evolution_graph.describe(species["name"]) or {"evolution_chain": [], "total_stages": 0}
+        result.update({
+            "species_name": species["name"],
+            "genus": _first(species.get("pokemon_v2_pokemonspeciesgeneras"), "genus") or "Unknown Pokemon",
+            "habitat": _first([species], "pokemon_v2_pokemonhabitat", "name")
+        })
+        return result
+
+    async def get_evolution_chain(self, species_url: str) -> Dict:
+        """Evolution chain of a species, usually already cached by the Pokemon query"""
+        if species_url in self._evolution_cache:
+            return self._evolution_cache[species_url]
+        try:
+            species_id = species_url.rstrip("/").rsplit("/", 1)[-1]
+            species = await self._species.load(species_id) if species_id.isdigit() else None
+            if species is None:
+                return {"error": "Species data not found"}
+            result = self._evolution_cache[species_url] = self._describe_species(species)
+            return result
+        except Exception as e:
+            print(f"Error fetching evolution chain: {e}", file=sys.stderr)
+            return {"error": f"Failed to fetch evolution data: {str(e)}"}
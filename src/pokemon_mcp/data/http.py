@@ -0,0 +1,79 @@
+# src/pokemon_mcp/data/http.py
+import asyncio
+import sys
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from ..config import ServerConfig
+
+# One connection pool for every outbound request, created on first use
+_client = None
+_http2: Optional[bool] = None
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (pip install httpx[http2])"""
+    global _http2
+    if _http2 is None:
+        try:
+            import h2  # noqa: F401
+            _http2 = True
+        except ImportError:
+            _http2 = False
+    return _http2
+
+def get_http_client(config: Optional[ServerConfig] = None):
+    """Return the shared httpx client used by every data client
+
+    With HTTP/2 concurrent requests to one host are multiplexed over a
+    single connection; on HTTP/1.1 they reuse up to HTTP_MAX_KEEPALIVE idle
+    connections. Either way a fan-out of lookups no longer opens a new TCP
+    and TLS connection per request.
+    """
+    global _client
+    if _client is None:
+        import httpx
+        config = config or ServerConfig.from_env()
+        http2 = config.http2 and http2_available()
+        if config.http2 and not http2:
+            print("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1", file=sys.stderr)
+        _client = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(config.request_timeout),
+            limits=httpx.Limits(
+                max_connections=config.http_max_connections,
+                max_keepalive_connections=config.http_max_keepalive,
+                keepalive_expiry=config.http_keepalive_expiry
+            )
+        )
+    return _client
+
+async def prewarm_connections(config: ServerConfig, urls: Optional[list] = None) -> Dict:
+    """Open connections to the API hosts ahead of the first real request
+
+    A small request per host completes the TCP and TLS handshakes. Over
+    HTTP/1.1, HTTP_PREWARM_CONNECTIONS requests are sent at once per host so
+    that many connections are idle in the pool; HTTP/2 needs only one.
+    """
+    client = get_http_client(config)
+    urls = list(urls or [config.pokeapi_base_url.rstrip("/") + "/"])
+    if config.data_backend == "graphql":
+        urls.append(config.graphql_url)
+    count = 1 if http2_available() and config.http2 else max(1, config.http_prewarm_connections)
+
+    async def touch(url: str):
+        try:
+            await client.get(url)
+        except Exception as e:
+            print(f"Connection warm-up to {urlsplit(url).netloc} failed: {e}", file=sys.stderr)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(touch(url) for url in urls for _ in range(count)))
+    return {"hosts": len(urls), "connections": len(urls) * count,
+            "seconds": round(time.perf_counter() - start, 3)}
+
+async def close_http_client():
+    """Close the shared client; the next get_http_client() call opens a new one"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
@@ -0,0 +1,59 @@
+# src/pokemon_mcp/data/learnset.py
+import sys
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+LEARN_METHODS = ("level-up", "machine", "tutor", "egg", "other")
+_METHOD_CODES = {name: code for code, name in enumerate(LEARN_METHODS)}
+LEVEL_UP = _METHOD_CODES["level-up"]
+
+class Learnset:
+    """Every move a species can learn, with its learn method and level
+
+    Move names are interned so species that share moves share the strings,
+    and methods and levels are stored as one byte each.
+    """
+
+    __slots__ = ("moves", "methods", "levels")
+
+    def __init__(self, moves: Sequence[str], details: Sequence[Sequence]):
+        # details: [method name, level learned at] per move, from the latest version group
+        self.moves = tuple(sys.intern(name) for name in moves)
+        self.methods = array('B', (_METHOD_CODES.get(method, _METHOD_CODES["other"]) for method, _ in details))
+        self.levels = array('B', (min(level or 0, 255) for _, level in details))
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Learnset):
+            return NotImplemented
+        return self.moves == other.moves and self.methods == other.methods and self.levels == other.levels
+
+    def learnable(self, level: int = 50) -> List[str]:
+        """Moves known at level: level-up moves up to level plus every other method"""
+        methods, levels = self.methods, self.levels
+        return [name for i, name in enumerate(self.moves)
+                if methods[i] != LEVEL_UP or levels[i] <= level]
+
+    def by_method(self) -> Dict[str, int]:
+        counts = {}
+        for code in self.methods:
+            counts[LEARN_METHODS[code]] = counts.get(LEARN_METHODS[code], 0) + 1
+        return counts
+
+    def details(self) -> List[Dict]:
+        """Every move with its learn method and level"""
+        return [{"name": name, "method": LEARN_METHODS[self.methods[i]], "level": self.levels[i]}
+                for i, name in enumerate(self.moves)]
+
+    def level_up(self) -> List[Dict]:
+        """Level-up moves in level order"""
+        moves = [(self.levels[i], name) for i, name in enumerate(self.moves) if self.methods[i] == LEVEL_UP]
+        return [{"name": name, "level": level} for level, name in sorted(moves)]
+
+def learnset_from_slim(data: Dict) -> Optional[Learnset]:
+    details = data.get("learn_details")
+    if details is None or len(details) != len(data["moves"]):
+        return None
+    return Learnset(data["moves"], details)
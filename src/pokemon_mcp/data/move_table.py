@@ -0,0 +1,199 @@
+# src/pokemon_mcp/data/move_table.py
+import asyncio
+import json
+import os
+import sys
+from array import array
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+from ..battle.mechanics import TYPE_NAMES, TYPE_IDS, get_type_effectiveness
+from ..battle.moves import Move, MoveCategory, StatusEffect
+
+if TYPE_CHECKING:
+    from ..battle.moves import MoveClient
+    from .pokemon_client import Pokemon
+
+SNAPSHOT_VERSION = 1
+CATEGORIES = tuple(MoveCategory)
+STATUS_EFFECTS = (None,) + tuple(StatusEffect)
+BATTLE_LEVEL = 50
+MOVESET_SIZE = 4
+
+# Effectiveness of each attacking type against each single defending type
+_CHART = [[get_type_effectiveness(attacking, [defending]) for defending in TYPE_NAMES] for attacking in TYPE_NAMES]
+
+class MoveTable:
+    """Battle data of every move, stored as compact parallel arrays
+
+    Move objects are built on first use and shared, and the best moveset of
+    each species is remembered, so battles need no move lookups over HTTP.
+    """
+
+    def __init__(self, records: Sequence[Sequence]):
+        # records: (name, type, category, power, accuracy, pp, priority, status effect, status chance)
+        self.names: List[str] = [r[0] for r in records]
+        self.types = array('B', (TYPE_IDS.get(r[1], TYPE_IDS["normal"]) for r in records))
+        self.categories = array('B', (CATEGORIES.index(MoveCategory(r[2])) for r in records))
+        self.power = array('H', (r[3] for r in records))
+        self.accuracy = array('B', (r[4] for r in records))
+        self.pp = array('B', (r[5] for r in records))
+        self.priority = array('b', (r[6] for r in records))
+        self.effects = array('B', (STATUS_EFFECTS.index(StatusEffect(r[7]) if r[7] else None) for r in records))
+        self.effect_chances = array('f', (r[8] for r in records))
+
+        self._position = {name: i for i, name in enumerate(self.names)}
+        self._moves: Dict[str, Move] = {}
+        self._movesets: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._position
+
+    def move(self, name: str) -> Optional[Move]:
+        """Shared Move object for name"""
+        move = self._moves.get(name)
+        if move is None:
+            i = self._position.get(name)
+            if i is None:
+                return None
+            move = Move(
+                name=name,
+                type=TYPE_NAMES[self.types[i]],
+                category=CATEGORIES[self.categories[i]],
+                power=self.power[i],
+                accuracy=self.accuracy[i],
+                pp=self.pp[i],
+                status_effect=STATUS_EFFECTS[self.effects[i]],
+                status_chance=round(self.effect_chances[i], 4),
+                priority=self.priority[i]
+            )
+            self._moves[name] = move
+        return move
+
+    def best_moveset(self, pokemon: "Pokemon", size: int = MOVESET_SIZE,
+                     level: int = BATTLE_LEVEL) -> List[str]:
+        """Strongest set of moves from the species' learnset, favouring type coverage
+
+        Each damaging move is scored by power, accuracy, STAB and the matching
+        attack stat. Moves are then added greedily by how much they raise the
+        best score against each of the 18 defending types, so a second move of
+        an already covered type loses to one that hits new weaknesses. Status
+        moves that inflict a condition fill any remaining slots.
+        """
+        moveset = self._movesets.get(pokemon.name)
+        if moveset is not None:
+            return moveset
+        if pokemon.learnset is None:
+            return []
+
+        positions = {self._position[name] for name in pokemon.learnset.learnable(level) if name in self._position}
+        stats = pokemon.stats
+        attack_for = (stats.attack, stats.special_attack)
+        damaging, status_moves = [], []
+        for i in positions:
+            category = CATEGORIES[self.categories[i]]
+            if category == MoveCategory.STATUS or not self.power[i]:
+                if self.effects[i]:
+                    status_moves.append(i)
+                continue
+            score = self.power[i] * self.accuracy[i] / 100 * attack_for[category != MoveCategory.PHYSICAL]
+            if TYPE_NAMES[self.types[i]] in pokemon.types:
+                score *= 1.5
+            damaging.append((i, score))
+
+        chosen, best = [], [0.0] * len(TYPE_NAMES)
+        while damaging and len(chosen) < size:
+            def gain(candidate):
+                i, score = candidate
+                row = _CHART[self.types[i]]
+                return sum(max(0.0, score * row[t] - best[t]) for t in range(len(best)))
+            pick = max(damaging, key=lambda c: (gain(c), c[1], self.names[c[0]]))
+            if gain(pick) <= 0 and chosen:
+                break
+            damaging.remove(pick)
+            chosen.append(pick[0])
+            row = _CHART[self.types[pick[0]]]
+            best = [max(b, pick[1] * row[t]) for t, b in enumerate(best)]
+
+        status_moves.sort(key=lambda i: (-self.accuracy[i], self.names[i]))
+        chosen.extend(status_moves[:size - len(chosen)])
+        # Fill up with the remaining damaging moves if coverage stopped improving
+        damaging.sort(key=lambda c: (-c[1], self.names[c[0]]))
+        chosen.extend(i for i, _ in damaging[:size - len(chosen)])
+
+        moveset = [self.names[i] for i in chosen]
+        self._movesets[pokemon.name] = moveset
+        return moveset
+
+    def to_records(self) -> List[List]:
+        return [[self.names[i], TYPE_NAMES[self.types[i]], CATEGORIES[self.categories[i]].value,
+                 self.power[i], self.accuracy[i], self.pp[i], self.priority[i],
+                 STATUS_EFFECTS[self.effects[i]].value if self.effects[i] else None,
+                 round(self.effect_chances[i], 4)] for i in range(len(self.names))]
+
+def move_record(move: Move) -> List:
+    return [move.name, move.type, move.category.value, move.power, min(move.accuracy, 255), min(move.pp, 255),
+            move.priority, move.status_effect.value if move.status_effect else None, move.status_chance]
+
+def _snapshot_path(cache_directory: str) -> str:
+    return os.path.join(cache_directory, "moves.json")
+
+def load_snapshot(cache_directory: str) -> Optional[List[List]]:
+    """Read move records saved by a previous build, if any"""
+    try:
+        with open(_snapshot_path(cache_directory), encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == SNAPSHOT_VERSION:
+            return data["records"]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Ignoring unreadable move snapshot: {e}", file=sys.stderr)
+    return None
+
+def save_snapshot(cache_directory: str, records: List[List]):
+    os.makedirs(cache_directory, exist_ok=True)
+    path = _snapshot_path(cache_directory)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"version": SNAPSHOT_VERSION, "records": records}, f, separators=(",", ":"))
+    os.replace(path + ".tmp", path)
+
+async def fetch_records(move_client: "MoveClient", concurrency: int = 16) -> List[List]:
+    """Fetch every move listed by the API"""
+    response = await move_client.client.get(f"{move_client.base_url}/move", params={"limit": 100000})
+    response.raise_for_status()
+    names = [entry["name"] for entry in response.json()["results"]]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(name: str):
+        try:
+            async with semaphore:
+                status, move, _, _ = await move_client._fetch_move(name)
+        except Exception as e:
+            print(f"Error fetching move {name}: {e}", file=sys.stderr)
+            return None
+        return move_record(move) if status == 200 and move else None
+
+    records = await asyncio.gather(*(fetch(name) for name in names))
+    return [r for r in records if r]
+
+# Loaded once per process; battles fall back to fetching moves until it is ready
+_move_table: Optional[MoveTable] = None
+
+def loaded_move_table() -> Optional[MoveTable]:
+    return _move_table
+
+async def load_move_table(move_client: "MoveClient", cache_directory: str, concurrency: int = 16) -> MoveTable:
+    """Load the move table from the on-disk snapshot, building it from the API the first time"""
+    global _move_table
+    if _move_table is not None:
+        return _move_table
+    records = load_snapshot(cache_directory)
+    if records is None:
+        print("Building move table from the API...", file=sys.stderr, flush=True)
+        records = await fetch_records(move_client, concurrency)
+        if records:
+            save_snapshot(cache_directory, records)
+    _move_table = MoveTable(records)
+    return _move_table
@@ -0,0 +1,218 @@
+# src/pokemon_mcp/data/pokedex.py
+import asyncio
+import bisect
+import difflib
+import json
+import os
+import re
+import sys
+from array import array
+from dataclasses import fields
+from typing import Dict, List, Optional, Sequence
+from .pokemon_client import PokemonClient, PokemonStats
+from ..battle.mechanics import TYPE_NAMES, TYPE_IDS
+
+SNAPSHOT_VERSION = 1
+STAT_NAMES = tuple(f.name for f in fields(PokemonStats))
+NO_TYPE = 255
+
+# Filter fields that map onto the per-entry arrays, plus a few common spellings
+FIELD_ALIASES = {
+    "hp": "hp", "attack": "attack", "atk": "attack", "defense": "defense", "def": "defense",
+    "special_attack": "special_attack", "spa": "special_attack", "sp_atk": "special_attack",
+    "special_defense": "special_defense", "spd": "special_defense", "sp_def": "special_defense",
+    "speed": "speed", "spe": "speed", "total": "total", "bst": "total",
+    "height": "height", "weight": "weight", "id": "id",
+}
+
+_FILTER_PATTERN = re.compile(r"^\s*([a-z_\-\s]+?)\s*(>=|<=|==|!=|>|<|=)\s*(\d+(?:\.\d+)?)\s*$")
+
+_COMPARATORS = {
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    "=": lambda a, b: a == b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+}
+
+def parse_filter(expression: str):
+    """Parse an attribute filter such as 'speed > 100' into (field, op, value)"""
+    match = _FILTER_PATTERN.match(expression.lower())
+    if not match:
+        raise ValueError(f"Invalid filter '{expression}'. Use the form 'speed > 100'")
+    raw_field, op, value = match.groups()
+    field = FIELD_ALIASES.get(re.sub(r"[\s\-]+", "_", raw_field.strip()))
+    if field is None:
+        raise ValueError(f"Unknown filter field '{raw_field.strip()}'. Valid fields: {', '.join(sorted(set(FIELD_ALIASES.values())))}")
+    return field, op, float(value)
+
+class PokedexIndex:
+    """In-memory index of every species and form, stored as compact parallel arrays"""
+
+    def __init__(self, records: Sequence[Sequence]):
+        # records: (id, name, types, [hp, atk, def, spa, spd, spe], height, weight)
+        records = sorted(records, key=lambda r: r[0])
+        self.names: List[str] = [r[1] for r in records]
+        self.ids = array('I', (r[0] for r in records))
+        self.type1 = array('B', (TYPE_IDS.get(r[2][0], NO_TYPE) if r[2] else NO_TYPE for r in records))
+        self.type2 = array('B', (TYPE_IDS.get(r[2][1], NO_TYPE) if len(r[2]) > 1 else NO_TYPE for r in records))
+        self.stats = array('H', (value for r in records for value in r[3]))
+        self.totals = array('H', (sum(r[3]) for r in records))
+        self.heights = array('I', (r[4] for r in records))
+        self.weights = array('I', (r[5] for r in records))
+
+        self._position = {name: i for i, name in enumerate(self.names)}
+        self._id_position = {pid: i for i, pid in enumerate(self.ids)}
+        self._sorted_names = sorted(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def position(self, name_or_id: str) -> Optional[int]:
+        """Row of a species by exact name or numeric ID"""
+        key = str(name_or_id).strip().lower()
+        if key.isdigit():
+            return self._id_position.get(int(key))
+        return self._position.get(key)
+
+    def types_of(self, i: int) -> List[str]:
+        return [TYPE_NAMES[t] for t in (self.type1[i], self.type2[i]) if t != NO_TYPE]
+
+    def value(self, i: int, field: str) -> int:
+        """Read one numeric field of a row"""
+        if field == "total":
+            return self.totals[i]
+        if field == "height":
+            return self.heights[i]
+        if field == "weight":
+            return self.weights[i]
+        if field == "id":
+            return self.ids[i]
+        return self.stats[i * 6 + STAT_NAMES.index(field)]
+
+    def entry(self, i: int) -> Dict:
+        """Full record for a row, in the same shape as get_pokemon stats"""
+        base = i * 6
+        return {
+            "id": self.ids[i],
+            "name": self.names[i],
+            "types": self.types_of(i),
+            "stats": {stat: self.stats[base + k] for k, stat in enumerate(STAT_NAMES)},
+            "total": self.totals[i],
+            "height": self.heights[i],
+            "weight": self.weights[i],
+        }
+
+    def prefix_matches(self, prefix: str) -> List[int]:
+        """Rows whose name starts with prefix, in alphabetical order"""
+        prefix = prefix.strip().lower()
+        start = bisect.bisect_left(self._sorted_names, prefix)
+        rows = []
+        for name in self._sorted_names[start:]:
+            if not name.startswith(prefix):
+                break
+            rows.append(self._position[name])
+        return rows
+
+    def fuzzy_matches(self, query: str, limit: int = 10, cutoff: float = 0.6) -> List[int]:
+        """Rows whose name is close to query, best match first"""
+        matches = difflib.get_close_matches(query.strip().lower(), self.names, n=limit, cutoff=cutoff)
+        return [self._position[name] for name in matches]
+
+    def search(self, query: Optional[str] = None, mode: str = "auto",
+               types: Optional[List[str]] = None, filters: Optional[List[str]] = None,
+               limit: int = 20) -> List[Dict]:
+        """Search by name prefix or fuzzy match, optionally narrowed by types and attribute filters"""
+        parsed = [parse_filter(f) for f in (filters or [])]
+        type_ids = []
+        for type_name in types or []:
+            if type_name.lower() not in TYPE_IDS:
+                raise ValueError(f"Unknown type '{type_name}'")
+            type_ids.append(TYPE_IDS[type_name.lower()])
+
+        if query:
+            if mode == "prefix":
+                rows = self.prefix_matches(query)
+            elif mode == "fuzzy":
+                rows = self.fuzzy_matches(query, limit=max(limit, 10) * 5)
+            else:
+                rows = self.prefix_matches(query) or self.fuzzy_matches(query, limit=max(limit, 10) * 5)
+        else:
+            rows = range(len(self.names))
+
+        results = []
+        for i in rows:
+            if any(t != self.type1[i] and t != self.type2[i] for t in type_ids):
+                continue
+            if any(not _COMPARATORS[op](self.value(i, field), value) for field, op, value in parsed):
+                continue
+            results.append(self.entry(i))
+            if len(results) >= limit:
+                break
+        return results
+
+    def to_records(self) -> List[List]:
+        return [[self.ids[i], self.names[i], self.types_of(i), list(self.stats[i * 6:i * 6 + 6]),
+                 self.heights[i], self.weights[i]] for i in range(len(self.names))]
+
+def _snapshot_path(cache_directory: str) -> str:
+    return os.path.join(cache_directory, "pokedex.json")
+
+def load_snapshot(cache_directory: str) -> Optional[List[List]]:
+    """Read species records saved by a previous build, if any"""
+    try:
+        with open(_snapshot_path(cache_directory), encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == SNAPSHOT_VERSION:
+            return data["records"]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Ignoring unreadable Pokedex snapshot: {e}", file=sys.stderr)
+    return None
+
+def save_snapshot(cache_directory: str, records: List[List]):
+    """Persist species records so later processes skip the bulk fetch"""
+    os.makedirs(cache_directory, exist_ok=True)
+    path = _snapshot_path(cache_directory)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"version": SNAPSHOT_VERSION, "records": records}, f, separators=(",", ":"))
+    os.replace(path + ".tmp", path)
+
+async def fetch_records(client: PokemonClient, concurrency: int = 16) -> List[List]:
+    """Fetch every species and form listed by the API"""
+    response = await client.client.get(f"{client.base_url}/pokemon", params={"limit": 100000})
+    response.raise_for_status()
+    names = [entry["name"] for entry in response.json()["results"]]
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(name: str):
+        # Straight from the API: a thousand-odd species through the LRU would evict the warm ones
+        try:
+            async with semaphore:
+                status, pokemon, _, _ = await client._fetch_pokemon(name)
+        except Exception as e:
+            print(f"Error fetching Pokemon {name}: {e}", file=sys.stderr)
+            return None
+        if status != 200 or not pokemon:
+            return None
+        s = pokemon.stats
+        return [pokemon.id, pokemon.name, pokemon.types,
+                [s.hp, s.attack, s.defense, s.special_attack, s.special_defense, s.speed],
+                pokemon.height, pokemon.weight]
+
+    records = await asyncio.gather(*(fetch(name) for name in names))
+    return [r for r in records if r]
+
+async def load_pokedex(client: PokemonClient, cache_directory: str, concurrency: int = 16) -> PokedexIndex:
+    """Load the index from the on-disk snapshot, building it from the API the first time"""
+    records = load_snapshot(cache_directory)
+    if records is None:
+        print("Building Pokedex index from the API...", file=sys.stderr, flush=True)
+        records = await fetch_records(client, concurrency)
+        if records:
+            save_snapshot(cache_directory, records)
+    return PokedexIndex(records)
@@ -1,9 +1,14 @@
 # src/pokemon_mcp/data/pokemon_client.py
-import httpx
 import json
 import sys
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+from ..config import ServerConfig
+from .cache import CacheEntry, FetchResult, TTLCache
+from .evolution import EvolutionGraph, species_id_from_url
+from .http import get_http_client
+from .learnset import Learnset, learnset_from_slim
+from .slim_json import PokemonSlimmer, fetch_slim
 
 @dataclass
 class PokemonStats:
@@ -27,80 +32,103 @@ class Pokemon:
     base_experience: int = 0
     sprite_url: str = ""
     species_url: str = ""
+    learnset: Optional[Learnset] = None  # Full move list with learn methods
+
+def pokemon_from_slim(data: Dict) -> Pokemon:
+    """Build a Pokemon from a slimmed /pokemon payload"""
+    stats_data = data['stats']
+    stats = PokemonStats(
+        hp=stats_data['hp'],
+        attack=stats_data['attack'],
+        defense=stats_data['defense'],
+        special_attack=stats_data['special-attack'],
+        special_defense=stats_data['special-defense'],
+        speed=stats_data['speed']
+    )
+    
+    return Pokemon(
+        id=data['id'],
+        name=data['name'],
+        types=data['types'],
+        stats=stats,
+        abilities=[name.replace('-', ' ').title() for name in data['abilities']],
+        moves=data['moves'][:50],  # Limit to 50 for better performance
+        height=data['height'],
+        weight=data['weight'],
+        base_experience=data['base_experience'],
+        sprite_url=data['sprite_url'],
+        species_url=data['species_url'],
+        learnset=learnset_from_slim(data)
+    )
 
 class PokemonClient:
-    def __init__(self):
-        self.base_url = "https://pokeapi.co/api/v2"
-        self.client = httpx.AsyncClient(timeout=30.0)
-        self._pokemon_cache = {}  # Cache for Pokemon data
+    def __init__(self, config: Optional[ServerConfig] = None):
+        config = config or ServerConfig()
+        self.config = config
+        self.base_url = config.pokeapi_base_url.rstrip("/")
+        # Cache for Pokemon data; stale entries are served while being revalidated
+        self._pokemon_cache = TTLCache(config.memory_cache_size, config.cache_duration)
         self._evolution_cache = {}  # Cache for evolution data
+        self.evolution_graph = EvolutionGraph()  # Full chains, shared by every member species
         
+    @property
+    def client(self):
+        """Shared HTTP client, created lazily on first use"""
+        return get_http_client(self.config)
+    
     async def get_pokemon(self, name_or_id: str) -> Optional[Pokemon]:
         """Fetch Pokemon data from PokéAPI with caching"""
         cache_key = str(name_or_id).lower()
-        if cache_key in self._pokemon_cache:
-            return self._pokemon_cache[cache_key]
+        entry = self._pokemon_cache.get_entry(cache_key)
+        if entry is not None:
+            if self._pokemon_cache.is_stale(entry):
+                # Serve the stale copy while a conditional request checks for changes
+                self._pokemon_cache.revalidate(cache_key, lambda headers: self._fetch_pokemon(cache_key, headers))
+            return entry.value
             
         try:
-            url = f"{self.base_url}/pokemon/{name_or_id.lower()}"
-            response = await self.client.get(url)
+            status, pokemon, etag, last_modified = await self._fetch_pokemon(cache_key)
             
-            if response.status_code != 200:
-                print(f"API Error: {response.status_code} for {name_or_id}", file=sys.stderr)
+            if status != 200:
+                print(f"API Error: {status} for {name_or_id}", file=sys.stderr)
                 return None
-                
-            data = response.json()
-            
-            # Extract stats
-            stats_data = {stat['stat']['name']: stat['base_stat'] for stat in data['stats']}
-            stats = PokemonStats(
-                hp=stats_data['hp'],
-                attack=stats_data['attack'],
-                defense=stats_data['defense'],
-                special_attack=stats_data['special-attack'],
-                special_defense=stats_data['special-defense'],
-                speed=stats_data['speed']
-            )
-            
-            # Extract types
-            types = [t['type']['name'] for t in data['types']]
-            
-            # Extract abilities  
-            abilities = [a['ability']['name'].replace('-', ' ').title() for a in data['abilities']]
-            
-            # Extract moves (limit to 50 for better performance)
-            moves = [m['move']['name'] for m in data['moves'][:50]]
             
-            # Get sprite URL
-            sprite_url = data['sprites']['front_default'] or ""
-            
-            pokemon = Pokemon(
-                id=data['id'],
-                name=data['name'],
-                types=types,
-                stats=stats,
-                abilities=abilities,
-                moves=moves,
-                height=data['height'],
-                weight=data['weight'],
-                base_experience=data.get('base_experience', 0),
-                sprite_url=sprite_url,
-                species_url=data['species']['url']
-            )
-            
-            # Cache the result
-            self._pokemon_cache[cache_key] = pokemon
+            # Cache the result along with its validators
+            self._pokemon_cache.set(cache_key, pokemon, etag, last_modified)
             return pokemon
             
         except Exception as e:
             print(f"Error fetching Pokemon {name_or_id}: {e}", file=sys.stderr)
             return None
     
+    async def get_pokemon_entry(self, name_or_id: str) -> Optional[CacheEntry]:
+        """Cache entry of a Pokemon, fetching it first if needed; its version changes with the data"""
+        if await self.get_pokemon(name_or_id) is None:
+            return None
+        return self._pokemon_cache.peek(str(name_or_id).lower())
+    
+    async def _fetch_pokemon(self, name_or_id: str, headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        """Fetch one Pokemon, optionally as a conditional request"""
+        url = f"{self.base_url}/pokemon/{name_or_id}"
+        
+        # Parse the payload incrementally, keeping only the fields we use
+        status, data, etag, last_modified = await fetch_slim(self.client, url, PokemonSlimmer, headers)
+        return status, pokemon_from_slim(data) if data else None, etag, last_modified
+    
     async def get_evolution_chain(self, species_url: str) -> Dict:
         """Fetch evolution chain information with caching"""
         # Use species URL as cache key
         if species_url in self._evolution_cache:
             return self._evolution_cache[species_url]
+        
+        # With the graph bulk-loaded the chain is already known by species ID; the
+        # species request is only needed for genus and habitat, so skip it
+        species_name = self.evolution_graph.species_name(species_id_from_url(species_url))
+        if species_name is not None:
+            result = self.evolution_graph.describe(species_name)
+            result.update({"species_name": species_name, "genus": None, "habitat": None})
+            self._evolution_cache[species_url] = result
+            return result
             
         try:
             # Get species data first
@@ -109,45 +137,22 @@ class PokemonClient:
                 return {"error": "Species data not found"}
                 
             species_data = species_response.json()
-            evolution_chain_url = species_data['evolution_chain']['url']
-            
-            # Get evolution chain data
-            evolution_response = await self.client.get(evolution_chain_url)
-            if evolution_response.status_code != 200:
-                return {"error": "Evolution chain data not found"}
-                
-            evolution_data = evolution_response.json()
-            
-            # Parse evolution chain
-            chain = []
-            current = evolution_data['chain']
-            
-            # Add base form
-            chain.append({
-                "name": current['species']['name'],
-                "is_baby": current.get('is_baby', False)
-            })
-            
-            # Add evolutions
-            while current['evolves_to']:
-                current = current['evolves_to'][0]  # Take first evolution path
-                evolution_details = current.get('evolution_details', [{}])[0]
-                
-                chain.append({
-                    "name": current['species']['name'],
-                    "trigger": evolution_details.get('trigger', {}).get('name', 'unknown'),
-                    "min_level": evolution_details.get('min_level'),
-                    "item": evolution_details.get('item', {}).get('name') if evolution_details.get('item') else None,
-                    "held_item": evolution_details.get('held_item', {}).get('name') if evolution_details.get('held_item') else None
-                })
-            
-            result = {
-                "evolution_chain": chain,
-                "total_stages": len(chain),
-                "species_name": species_data['name'],
+            species_name = species_data['name']
+            
+            # Chains are shared by all members, so a sibling's earlier lookup
+            # (or the bulk load) already answers this without another request
+            if species_name not in self.evolution_graph:
+                evolution_response = await self.client.get(species_data['evolution_chain']['url'])
+                if evolution_response.status_code != 200:
+                    return {"error": "Evolution chain data not found"}
+                self.evolution_graph.add_api_chain(evolution_response.json())
+            
+            result = self.evolution_graph.describe(species_name) or {"evolution_chain": [], "total_stages": 0}
+            result.update({
+                "species_name": species_name,
                 "genus": species_data.get('genera', [{}])[0].get('genus', 'Unknown Pokemon'),
                 "habitat": species_data.get('habitat', {}).get('name') if species_data.get('habitat') else None
-            }
+            })
             
             # Cache the result
             self._evolution_cache[species_url] = result
@@ -157,8 +162,27 @@ class PokemonClient:
             print(f"Error fetching evolution chain: {e}", file=sys.stderr)
             return {"error": f"Failed to fetch evolution data: {str(e)}"}
     
+    def cache_stats(self) -> Dict:
+        return {**self._pokemon_cache.stats(), "evolution_entries": len(self._evolution_cache)}
+    
+    def invalidate(self, names: Optional[List[str]] = None) -> int:
+        """Drop cached Pokemon (under every name and ID they were looked up by), or all of them"""
+        if names is None:
+            self._evolution_cache.clear()
+            return self._pokemon_cache.invalidate()
+        wanted = {str(name).lower() for name in names}
+        keys = []
+        for key in list(self._pokemon_cache.keys()):
+            pokemon = self._pokemon_cache.peek(key).value
+            if key in wanted or pokemon.name in wanted or str(pokemon.id) in wanted:
+                keys.append(key)
+                self._evolution_cache.pop(pokemon.species_url, None)
+        return self._pokemon_cache.invalidate(keys)
+    
+    def evict_to(self, max_bytes: int) -> Dict:
+        return self._pokemon_cache.evict_to(max_bytes)
+    
     async def close(self):
-        """Close the HTTP client and clear caches"""
-        await self.client.aclose()
+        """Clear caches; the shared HTTP client is closed by close_http_client()"""
         self._pokemon_cache.clear()
         self._evolution_cache.clear()
\ No newline at end of file
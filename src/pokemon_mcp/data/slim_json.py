@@ -0,0 +1,209 @@
+# src/pokemon_mcp/data/slim_json.py
+import json
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from .cache import FetchResult
+
+try:
+    import ijson
+except ImportError:  # Fall back to a full parse followed by slimming
+    ijson = None
+
+_DEPTH = {"start_map": 1, "start_array": 1, "end_map": -1, "end_array": -1}
+
+class PathWalker:
+    """Routes basic ijson events for a set of wanted paths and skips everything else
+
+    Paths are tuples of keys, with "item" standing for any array element. A
+    subtree that cannot contain a wanted path is skipped by counting depth
+    only, so large sections such as per-version move details cost almost
+    nothing beyond tokenizing.
+    """
+
+    def __init__(self, paths: Iterable[Tuple[str, ...]], on_value: Callable):
+        paths = set(paths)
+        self.paths = paths
+        self.prefixes = {path[:i] for path in paths for i in range(len(path) + 1)}
+        self.on_value = on_value
+        self._stack = []  # (path, is_array) for each open container
+        self._key = None
+        self._skip = 0
+
+    def feed(self, events):
+        prefixes, paths, on_value, stack = self.prefixes, self.paths, self.on_value, self._stack
+        skip, key = self._skip, self._key
+        depth_of = _DEPTH.get
+        for event, value in events:
+            if skip:
+                skip += depth_of(event, 0)
+                continue
+            if event == "map_key":
+                key = value
+                continue
+            delta = depth_of(event, 0)
+            if delta < 0:
+                stack.pop()
+                continue
+            if not stack:
+                path = ()
+            else:
+                parent, is_array = stack[-1]
+                path = parent + ("item",) if is_array else parent + (key,)
+            if path not in prefixes:
+                skip = delta
+            elif delta:
+                stack.append((path, event == "start_array"))
+            elif path in paths:
+                on_value(path, value)
+        self._skip, self._key = skip, key
+
+class PokemonSlimmer:
+    """Collects the fields of a /pokemon payload that the server uses
+
+    The full payload is dominated by per-version move details, sprite
+    variants and game indices. Of the move details only the learn method
+    and level of the latest version group are kept, for the learnset.
+    """
+
+    PATHS = {
+        ("id",): "id", ("name",): "name", ("height",): "height", ("weight",): "weight",
+        ("base_experience",): "base_experience",
+        ("types", "item", "type", "name"): "types",
+        ("stats", "item", "base_stat"): "base_stat",
+        ("stats", "item", "stat", "name"): "stat_name",
+        ("abilities", "item", "ability", "name"): "abilities",
+        ("moves", "item", "move", "name"): "moves",
+        ("moves", "item", "version_group_details", "item", "level_learned_at"): "level",
+        ("moves", "item", "version_group_details", "item", "move_learn_method", "name"): "method",
+        ("sprites", "front_default"): "sprite_url",
+        ("species", "url"): "species_url",
+    }
+
+    def __init__(self):
+        self.result = {
+            "id": 0, "name": "", "types": [], "stats": {}, "abilities": [], "moves": [], "learn_details": [],
+            "height": 0, "weight": 0, "base_experience": 0, "sprite_url": "", "species_url": "",
+        }
+        self._base_stat = None
+        self._level = 0
+
+    def on_value(self, path: Tuple[str, ...], value):
+        field = self.PATHS[path]
+        if field == "base_stat":
+            self._base_stat = value
+        elif field == "stat_name":
+            self.result["stats"][value] = self._base_stat
+        elif field == "level":
+            self._level = value
+        elif field == "method":
+            # Later version groups overwrite earlier ones
+            self.result["learn_details"][-1] = [value, self._level]
+        elif field in ("types", "abilities", "moves"):
+            self.result[field].append(value)
+            if field == "moves":
+                self.result["learn_details"].append([None, 0])
+        elif value is not None:
+            self.result[field] = value
+
+    @staticmethod
+    def from_document(data: Dict) -> Dict:
+        return {
+            "id": data["id"],
+            "name": data["name"],
+            "types": [t["type"]["name"] for t in data["types"]],
+            "stats": {stat["stat"]["name"]: stat["base_stat"] for stat in data["stats"]},
+            "abilities": [a["ability"]["name"] for a in data["abilities"]],
+            "moves": [m["move"]["name"] for m in data["moves"]],
+            "learn_details": [_latest_detail(m.get("version_group_details")) for m in data["moves"]],
+            "height": data["height"],
+            "weight": data["weight"],
+            "base_experience": data.get("base_experience") or 0,
+            "sprite_url": data["sprites"]["front_default"] or "",
+            "species_url": data["species"]["url"],
+        }
+
+def _latest_detail(details) -> List:
+    if not details:
+        return [None, 0]
+    return [details[-1]["move_learn_method"]["name"], details[-1]["level_learned_at"]]
+
+class MoveSlimmer:
+    """Collects the fields of a /move payload, keeping one English description"""
+
+    PATHS = {
+        ("name",): "name", ("power",): "power", ("accuracy",): "accuracy", ("pp",): "pp",
+        ("priority",): "priority", ("effect_chance",): "effect_chance",
+        ("type", "name"): "type",
+        ("damage_class", "name"): "damage_class",
+        ("effect_entries", "item", "effect"): "effect",
+        ("flavor_text_entries", "item", "flavor_text"): "text",
+        ("flavor_text_entries", "item", "language", "name"): "language",
+    }
+
+    def __init__(self):
+        self.result = {
+            "name": "", "type": "", "damage_class": "", "power": None, "accuracy": None, "pp": None,
+            "priority": 0, "effect_chance": None, "effect": "", "flavor_text": None,
+        }
+        self._text = None
+
+    def on_value(self, path: Tuple[str, ...], value):
+        field = self.PATHS[path]
+        if field == "text":
+            self._text = value
+        elif field == "language":
+            if value == "en" and self.result["flavor_text"] is None:
+                self.result["flavor_text"] = self._text
+        elif field == "effect":
+            if not self.result["effect"]:
+                self.result["effect"] = value
+        else:
+            self.result[field] = value
+
+    @staticmethod
+    def from_document(data: Dict) -> Dict:
+        flavor_text = next((entry["flavor_text"] for entry in data.get("flavor_text_entries", [])
+                            if entry["language"]["name"] == "en"), None)
+        effect_entries = data.get("effect_entries") or [{}]
+        return {
+            "name": data["name"],
+            "type": data["type"]["name"],
+            "damage_class": data["damage_class"]["name"],
+            "power": data.get("power"),
+            "accuracy": data.get("accuracy"),
+            "pp": data.get("pp"),
+            "priority": data.get("priority", 0),
+            "effect_chance": data.get("effect_chance"),
+            "effect": effect_entries[0].get("effect", ""),
+            "flavor_text": flavor_text,
+        }
+
+async def fetch_slim(client, url: str, slimmer_class,
+                     headers: Optional[Dict[str, str]] = None) -> FetchResult:
+    """GET url and return (status, slimmed payload, etag, last_modified)
+
+    Pass conditional headers to revalidate; a 304 comes back with no payload.
+    With ijson installed the body is tokenized as chunks arrive and only the
+    wanted fields are kept; otherwise the body is parsed in one go and
+    slimmed straight away so the full document is dropped early.
+    """
+    async with client.stream("GET", url, headers=headers) as response:
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if response.status_code != 200:
+            return response.status_code, None, etag, last_modified
+
+        if ijson is None:
+            data = slimmer_class.from_document(json.loads(await response.aread()))
+            return 200, data, etag, last_modified
+
+        slimmer = slimmer_class()
+        walker = PathWalker(slimmer_class.PATHS, slimmer.on_value)
+        events = ijson.sendable_list()
+        parser = ijson.basic_parse_coro(events)
+        async for chunk in response.aiter_bytes():
+            parser.send(chunk)
+            walker.feed(events)
+            del events[:]
+        parser.close()
+        walker.feed(events)
+        return 200, slimmer.result, etag, last_modified
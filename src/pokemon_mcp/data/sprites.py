@@ -0,0 +1,173 @@
+# src/pokemon_mcp/data/sprites.py
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import os
+import sys
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from .http import get_http_client
+
+INDEX_VERSION = 1
+INDEX_SAVE_DELAY = 1.0  # Seconds to gather new index entries into one write
+
+# Leading bytes of the image formats sprites come in
+_SIGNATURES = ((b"\x89PNG", "image/png"), (b"GIF8", "image/gif"), (b"\xff\xd8", "image/jpeg"), (b"RIFF", "image/webp"))
+
+def image_mime_type(data: bytes) -> Optional[str]:
+    for signature, mime_type in _SIGNATURES:
+        if data.startswith(signature):
+            return mime_type
+    return None
+
+def _downscale(data: bytes, size: int) -> bytes:
+    """Shrink an image to fit size x size with Pillow, keeping hard pixel-art edges"""
+    from PIL import Image
+    with Image.open(io.BytesIO(data)) as image:
+        if max(image.size) <= size:
+            return data
+        image.thumbnail((size, size), Image.NEAREST)
+        out = io.BytesIO()
+        image.save(out, format="PNG", optimize=True)
+        return out.getvalue()
+
+class SpriteCache:
+    """Sprites fetched once, stored by content hash, served as base64 thumbnails
+
+    Images live on disk under the SHA-256 of their bytes, so sprites shared
+    by several forms are stored once, and an index maps each URL to its
+    hash. Thumbnails (downscaled with Pillow when it is installed) are kept
+    on disk too, and the most recent base64 bodies stay in memory within a
+    byte budget. Disk reads and writes run in threads, and the index is
+    rewritten at most once per INDEX_SAVE_DELAY however many sprites arrive.
+    """
+
+    def __init__(self, directory: str, memory_bytes: int = 8 * 1024 * 1024, size: int = 96):
+        self.directory = directory
+        self.memory_bytes = memory_bytes
+        self.size = size
+        self._index: Optional[Dict[str, str]] = None  # url -> digest of the original image
+        self._memory: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()  # url -> (base64, mime type)
+        self._memory_used = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._index_dirty = False
+        self._index_saver: Optional[asyncio.Future] = None
+        try:
+            import PIL  # noqa: F401
+            self.can_downscale = True
+        except ImportError:
+            self.can_downscale = False
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name[:2], name)
+
+    def _load_index(self) -> Dict[str, str]:
+        if self._index is None:
+            self._index = {}
+            try:
+                with open(os.path.join(self.directory, "index.json"), encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION:
+                    self._index = data["urls"]
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Ignoring unreadable sprite index: {e}", file=sys.stderr)
+        return self._index
+
+    def _save_index(self, urls: Dict[str, str]):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, "index.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "urls": urls}, f, separators=(",", ":"))
+        os.replace(path + ".tmp", path)
+
+    def _index_changed(self):
+        self._index_dirty = True
+        if self._index_saver is None or self._index_saver.done():
+            self._index_saver = asyncio.ensure_future(self._save_index_later())
+
+    async def _save_index_later(self):
+        """Write the index once per burst of downloads; a single writer, so saves never overlap"""
+        while self._index_dirty:
+            await asyncio.sleep(INDEX_SAVE_DELAY)
+            self._index_dirty = False
+            try:
+                await asyncio.to_thread(self._save_index, dict(self._index))
+            except OSError as e:
+                print(f"Could not save the sprite index: {e}", file=sys.stderr)
+
+    def _write(self, name: str, data: bytes):
+        path = self._path(name)
+        if not os.path.exists(path):  # Same hash, same bytes: already stored
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+
+    def _read(self, name: str) -> Optional[bytes]:
+        try:
+            with open(self._path(name), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _remember(self, url: str, encoded: str, mime_type: str):
+        self._memory[url] = (encoded, mime_type)
+        self._memory_used += len(encoded)
+        while self._memory_used > self.memory_bytes and len(self._memory) > 1:
+            _, (evicted, _) = self._memory.popitem(last=False)
+            self._memory_used -= len(evicted)
+
+    async def get(self, url: str) -> Optional[Tuple[str, str]]:
+        """(base64 thumbnail, mime type) of the image at url, or None if it cannot be fetched"""
+        if not url:
+            return None
+        cached = self._memory.get(url)
+        if cached is not None:
+            self._memory.move_to_end(url)
+            return cached
+        # Concurrent requests for one sprite share a single download
+        future = self._inflight.get(url)
+        if future is None:
+            future = self._inflight[url] = asyncio.ensure_future(self._load(url))
+            future.add_done_callback(lambda _: self._inflight.pop(url, None))
+        return await asyncio.shield(future)
+
+    async def _load(self, url: str) -> Optional[Tuple[str, str]]:
+        index = self._load_index()
+        digest = index.get(url)
+        data = await asyncio.to_thread(self._read, digest) if digest else None
+        if data is None:
+            try:
+                response = await get_http_client().get(url)
+                response.raise_for_status()
+            except Exception as e:
+                print(f"Error fetching sprite {url}: {e}", file=sys.stderr)
+                return None
+            data = response.content
+            if image_mime_type(data) is None:
+                print(f"Sprite {url} is not an image", file=sys.stderr)
+                return None
+            digest = hashlib.sha256(data).hexdigest()
+            await asyncio.to_thread(self._write, digest, data)
+            index[url] = digest
+            self._index_changed()
+
+        thumbnail = data
+        if self.can_downscale:
+            name = f"{digest}-{self.size}"
+            thumbnail = await asyncio.to_thread(self._read, name)
+            if thumbnail is None:
+                try:
+                    thumbnail = await asyncio.to_thread(_downscale, data, self.size)
+                except Exception as e:
+                    print(f"Could not downscale sprite {url}: {e}", file=sys.stderr)
+                    thumbnail = data
+                await asyncio.to_thread(self._write, name, thumbnail)
+
+        result = base64.b64encode(thumbnail).decode("ascii"), image_mime_type(thumbnail) or "image/png"
+        self._remember(url, *result)
+        return result
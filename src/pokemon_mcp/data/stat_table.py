@@ -0,0 +1,139 @@
+# src/pokemon_mcp/data/stat_table.py
+import operator
+from typing import Dict, List, Optional
+import numpy as np
+from .pokedex import PokedexIndex, STAT_NAMES, NO_TYPE, parse_filter
+from ..battle.mechanics import TYPE_NAMES, TYPE_IDS
+
+NUMERIC_FIELDS = STAT_NAMES + ("total", "height", "weight", "id")
+
+_OPERATORS = {
+    ">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le,
+    "=": operator.eq, "==": operator.eq, "!=": operator.ne,
+}
+
+class StatTable:
+    """Columnar view of the whole Pokedex for vectorized filters, rankings and aggregates
+
+    The stat columns follow the PokemonStats field order and share memory with
+    the PokedexIndex arrays, so building the table does not copy any data.
+    """
+
+    def __init__(self, index: PokedexIndex):
+        self.index = index
+        self.names = np.array(index.names, dtype=object)
+        self.ids = np.frombuffer(index.ids, dtype=np.uint32)
+        self.stats = np.frombuffer(index.stats, dtype=np.uint16).reshape(-1, len(STAT_NAMES))
+        self.type1 = np.frombuffer(index.type1, dtype=np.uint8)
+        self.type2 = np.frombuffer(index.type2, dtype=np.uint8)
+        self.totals = np.frombuffer(index.totals, dtype=np.uint16)
+        self.heights = np.frombuffer(index.heights, dtype=np.uint32)
+        self.weights = np.frombuffer(index.weights, dtype=np.uint32)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def column(self, field: str) -> np.ndarray:
+        """Numeric column by field name"""
+        if field in STAT_NAMES:
+            return self.stats[:, STAT_NAMES.index(field)]
+        if field == "total":
+            return self.totals
+        if field == "height":
+            return self.heights
+        if field == "weight":
+            return self.weights
+        if field == "id":
+            return self.ids
+        raise ValueError(f"Unknown stat '{field}'. Valid stats: {', '.join(NUMERIC_FIELDS)}")
+
+    def mask(self, types: Optional[List[str]] = None, filters: Optional[List[str]] = None) -> np.ndarray:
+        """Boolean row mask for the given types (all required) and attribute filters"""
+        selected = np.ones(len(self.names), dtype=bool)
+        for type_name in types or []:
+            type_id = TYPE_IDS.get(type_name.lower())
+            if type_id is None:
+                raise ValueError(f"Unknown type '{type_name}'")
+            selected &= (self.type1 == type_id) | (self.type2 == type_id)
+        for expression in filters or []:
+            field, op, value = parse_filter(expression)
+            selected &= _OPERATORS[op](self.column(field), value)
+        return selected
+
+    def rank(self, stat: str, n: int = 10, ascending: bool = False,
+             types: Optional[List[str]] = None, filters: Optional[List[str]] = None) -> List[Dict]:
+        """Top (or bottom) n rows by a stat among the selected rows"""
+        rows = np.flatnonzero(self.mask(types, filters))
+        values = self.column(stat)[rows].astype(np.int64)
+        if not ascending:
+            values = -values
+        n = min(n, len(rows))
+        if n <= 0:
+            return []
+        # argpartition keeps this O(N) before the small final sort; every row tied with the
+        # n-th value stays in, so ties are broken by ID rather than by partition order
+        if n < len(rows):
+            cutoff = values[np.argpartition(values, n - 1)[n - 1]]
+            best = np.flatnonzero(values <= cutoff)
+        else:
+            best = np.arange(len(rows))
+        best = best[np.lexsort((self.ids[rows[best]], values[best]))][:n]
+        return [self._row(int(i), stat, rank) for rank, i in enumerate(rows[best], start=1)]
+
+    def percentile(self, name_or_id: str, stat: str, types: Optional[List[str]] = None,
+                   filters: Optional[List[str]] = None) -> Dict:
+        """Where one Pokemon's stat falls within the selected rows"""
+        position = self.index.position(name_or_id)
+        if position is None:
+            raise ValueError(f"Pokemon '{name_or_id}' is not in the Pokedex index")
+        values = self.column(stat)[self.mask(types, filters)]
+        value = int(self.column(stat)[position])
+        below = int(np.count_nonzero(values < value))
+        equal = int(np.count_nonzero(values == value))
+        return {
+            "name": self.names[position],
+            "stat": stat,
+            "value": value,
+            "percentile": round(100.0 * (below + 0.5 * equal) / len(values), 1) if len(values) else None,
+            "rank": int(np.count_nonzero(values > value)) + 1,
+            "out_of": int(len(values)),
+        }
+
+    def aggregate(self, stat: str, group_by: Optional[str] = None, types: Optional[List[str]] = None,
+                  filters: Optional[List[str]] = None) -> Dict:
+        """Count, mean, median, spread and percentiles of a stat, optionally per type"""
+        selected = self.mask(types, filters)
+        values = self.column(stat)
+        if group_by is None:
+            return {"all": _summary(values[selected])}
+        if group_by != "type":
+            raise ValueError("group_by must be 'type' or omitted")
+
+        groups = {}
+        for type_id, type_name in enumerate(TYPE_NAMES):
+            in_type = selected & ((self.type1 == type_id) | (self.type2 == type_id))
+            if in_type.any():
+                groups[type_name] = _summary(values[in_type])
+        return groups
+
+    def _row(self, i: int, stat: str, rank: int) -> Dict:
+        return {
+            "rank": rank,
+            "name": self.names[i],
+            "id": int(self.ids[i]),
+            "types": [TYPE_NAMES[t] for t in (self.type1[i], self.type2[i]) if t != NO_TYPE],
+            stat: int(self.column(stat)[i]),
+        }
+
+def _summary(values: np.ndarray) -> Dict:
+    if not len(values):
+        return {"count": 0}
+    p25, p50, p75, p90 = np.percentile(values, [25, 50, 75, 90])
+    return {
+        "count": int(len(values)),
+        "mean": round(float(values.mean()), 1),
+        "std": round(float(values.std()), 1),
+        "min": int(values.min()),
+        "max": int(values.max()),
+        "p25": float(p25), "median": float(p50), "p75": float(p75), "p90": float(p90),
+    }
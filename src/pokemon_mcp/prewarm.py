@@ -0,0 +1,71 @@
+# src/pokemon_mcp/prewarm.py
+import asyncio
+import sys
+import time
+from typing import Dict, List, Optional
+from .data.pokemon_client import PokemonClient
+from .battle.engine import BattlePokemon
+
+# Most requested species, in rough order of popularity
+POPULAR_SPECIES = [
+    "pikachu", "charizard", "mewtwo", "eevee", "lucario", "gengar", "greninja",
+    "bulbasaur", "charmander", "squirtle", "blastoise", "venusaur", "snorlax",
+    "dragonite", "garchomp", "gyarados", "umbreon", "rayquaza", "mew", "jigglypuff",
+    "meowth", "psyduck", "arcanine", "lapras", "tyranitar", "blaziken", "sylveon",
+    "mimikyu", "alakazam", "machamp", "ditto", "infernape", "metagross", "salamence",
+    "scizor", "togekiss", "gardevoir", "zapdos", "articuno", "moltres", "lugia",
+    "ho-oh", "vaporeon", "jolteon", "flareon", "espeon", "haxorus", "hydreigon",
+    "volcarona", "dragapult",
+]
+
+async def prewarm(pokemon_client: PokemonClient,
+                  species: Optional[List[str]] = None, top_n: int = 25,
+                  concurrency: int = 8, timeout: float = 15.0) -> Dict:
+    """Load popular species, their evolution chains and battle movesets into the caches
+
+    Movesets are whatever BattlePokemon.initialize_moves picks: from the move
+    table when it is loaded (nothing to fetch), otherwise the moves it would
+    fetch from the API.
+
+    Fetches run with at most `concurrency` species in flight and the whole
+    phase is abandoned once `timeout` seconds have passed, so a slow or
+    unreachable API never delays startup beyond the budget.
+    """
+    names = (species or POPULAR_SPECIES)[:top_n]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    summary = {"requested": len(names), "pokemon": 0, "evolution_chains": 0, "moves": 0}
+
+    async def warm_one(name: str):
+        async with semaphore:
+            pokemon = await pokemon_client.get_pokemon(name)
+            if not pokemon:
+                return
+            summary["pokemon"] += 1
+
+            member = BattlePokemon(pokemon)
+            evolution, _ = await asyncio.gather(
+                pokemon_client.get_evolution_chain(pokemon.species_url),
+                member.initialize_moves()
+            )
+            if "error" not in evolution:
+                summary["evolution_chains"] += 1
+            summary["moves"] += len(member.moves)
+
+    start = time.perf_counter()
+    tasks = [asyncio.ensure_future(warm_one(name)) for name in names]
+    done, pending = await asyncio.wait(tasks, timeout=timeout) if tasks else (set(), set())
+
+    for task in done:
+        if task.exception():
+            print(f"Warm-up fetch failed: {task.exception()}", file=sys.stderr)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    summary["timed_out"] = len(pending)
+    summary["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+    print(f"Warm-up loaded {summary['pokemon']}/{summary['requested']} Pokemon, "
+          f"{summary['evolution_chains']} evolution chains and {summary['moves']} moves "
+          f"in {summary['elapsed_seconds']}s", file=sys.stderr, flush=True)
+    return summary
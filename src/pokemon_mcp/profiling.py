@@ -0,0 +1,306 @@
+# src/pokemon_mcp/profiling.py
+import contextvars
+import functools
+import glob
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+MODES = ("cprofile", "sample")
+
+_sequence = itertools.count(1)  # Keeps file names unique across restarts of profiling
+
+# Session of the profiled call running in this context; scheduler.run_cpu follows it into worker threads
+_current: "contextvars.ContextVar[Optional[ProfileSession]]" = contextvars.ContextVar("profile_session", default=None)
+
+# Threads with an enabled cProfile.Profile. A thread can only have one: a second one replaces
+# the first on 3.11 and raises ValueError from 3.12, so overlapping sessions skip such threads
+_cprofiled = set()
+_cprofiled_lock = threading.Lock()
+
+class ProfileSession:
+    """Profile of one sampled call, across the event loop thread and the worker threads it uses
+
+    In "cprofile" mode every thread taking part gets its own cProfile.Profile
+    and the results are merged into one .pstats file. In "sample" mode a
+    background thread records the stacks of those threads every interval
+    and writes them in collapsed-stack format (.folded) for flamegraph tools.
+
+    Only one cProfile session can be live per thread, so a thread that is
+    already being profiled by another session is left out of this one.
+    """
+
+    def __init__(self, profiler: "Profiler", label: str):
+        self.profiler = profiler
+        self.label = label
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._profiles: Dict[int, Any] = {}  # thread id -> cProfile.Profile
+        self._threads: Dict[int, str] = {}  # thread id -> name, while it runs work of this call
+        self._stacks: Counter = Counter()
+        self._stopped = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        if profiler.mode == "sample":
+            self._sampler = threading.Thread(target=self._sample_loop, name="profile-sampler", daemon=True)
+            self._sampler.start()
+
+    @contextmanager
+    def thread(self):
+        """Profile the current thread while the block runs"""
+        ident = threading.get_ident()
+        with self._lock:
+            nested = ident in self._threads  # Already profiled further up the stack
+            if not nested:
+                self._threads[ident] = threading.current_thread().name
+            profile = None
+            if self._sampler is None and not nested:
+                profile = self._profiles.get(ident)
+                if profile is None:
+                    import cProfile
+                    profile = cProfile.Profile()
+        if nested:
+            yield
+            return
+        if profile is not None:
+            if _claim_cprofile(ident, profile):
+                with self._lock:
+                    self._profiles[ident] = profile
+            else:
+                profile = None
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+                with _cprofiled_lock:
+                    _cprofiled.discard(ident)
+            with self._lock:
+                del self._threads[ident]
+
+    def wrap(self, fn: Callable) -> Callable:
+        """fn profiled in whichever thread runs it"""
+        @functools.wraps(fn)
+        def run(*args):
+            with self.thread():
+                return fn(*args)
+        return run
+
+    def _sample_loop(self):
+        interval = self.profiler.interval
+        own = threading.get_ident()
+        while not self._stopped.wait(interval):
+            frames = sys._current_frames()
+            with self._lock:
+                threads = list(self._threads.items())
+            for ident, name in threads:
+                frame = frames.get(ident)
+                if frame is None or ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(name)
+                self._stacks[";".join(reversed(stack))] += 1
+
+    def close(self) -> Optional[str]:
+        """Stop profiling and write the result file; returns its path"""
+        elapsed = time.perf_counter() - self.started
+        if self._sampler is not None:
+            self._stopped.set()
+            self._sampler.join()
+        return self.profiler._write(self, elapsed)
+
+def _claim_cprofile(ident: int, profile: Any) -> bool:
+    """Enable profile on the current thread unless another cProfile already runs there"""
+    with _cprofiled_lock:
+        if ident in _cprofiled:
+            return False
+        _cprofiled.add(ident)
+    try:
+        profile.enable()
+    except ValueError:  # Another profiling tool holds the thread (3.12+)
+        with _cprofiled_lock:
+            _cprofiled.discard(ident)
+        return False
+    return True
+
+class Profiler:
+    """Opt-in profiling of a sampled fraction of tool calls and battles"""
+
+    def __init__(self, directory: str, sample_rate: float = 0.05, mode: str = "cprofile",
+                 interval: float = 0.005, max_files: int = 200):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode '{mode}'; expected one of {', '.join(MODES)}")
+        self.directory = directory
+        self.sample_rate = min(1.0, max(0.0, sample_rate))
+        self.mode = mode
+        self.interval = interval
+        self.max_files = max_files
+        self.profiled = 0
+        self.recent: List[str] = []
+        self._random = random.Random()  # Own generator: seeded battles must not see our draws
+
+    def sample(self) -> bool:
+        """Whether the next call should be profiled
+
+        Never nests inside a profiled call, and in cprofile mode never starts while
+        another session profiles this thread (concurrent calls on the event loop).
+        """
+        if _current.get() is not None:
+            return False
+        if self.mode == "cprofile" and threading.get_ident() in _cprofiled:
+            return False
+        return self._random.random() < self.sample_rate
+
+    async def run(self, label: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await call() under a new profile session"""
+        session = ProfileSession(self, label)
+        token = _current.set(session)
+        try:
+            with session.thread():
+                return await call()
+        finally:
+            _current.reset(token)
+            session.close()
+
+    def iterate(self, label: str, iterator: Iterator) -> Iterator:
+        """Advance iterator under a new profile session, in whichever thread asks for each item"""
+        session = ProfileSession(self, label)
+        try:
+            while True:
+                with session.thread():
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                yield item
+        finally:
+            session.close()
+
+    def _write(self, session: ProfileSession, elapsed: float) -> Optional[str]:
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(self.directory, f"{stamp}-{os.getpid()}-{next(_sequence):05d}-{session.label}")
+        try:
+            if session._sampler is not None:
+                path = base + ".folded"
+                with open(path, "w", encoding="utf-8") as f:
+                    for stack, count in session._stacks.most_common():
+                        f.write(f"{stack} {count}\n")
+            else:
+                import pstats
+                profiles = list(session._profiles.values())
+                if not profiles:
+                    return None
+                path = base + ".pstats"
+                pstats.Stats(*profiles).dump_stats(path)
+        except OSError as e:
+            print(f"Failed to write profile for {session.label}: {e}", file=sys.stderr)
+            return None
+
+        self.profiled += 1
+        self.recent = (self.recent + [path])[-20:]
+        print(f"Profiled {session.label} ({elapsed * 1000:.1f} ms): {path}", file=sys.stderr)
+        self._prune()
+        return path
+
+    def _prune(self):
+        files = sorted(glob.glob(os.path.join(self.directory, "*.pstats")) +
+                       glob.glob(os.path.join(self.directory, "*.folded")), key=os.path.getmtime)
+        for path in files[:max(0, len(files) - self.max_files)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def status(self) -> Dict:
+        return {
+            "enabled": True,
+            "mode": self.mode,
+            "sample_rate": self.sample_rate,
+            "directory": os.path.abspath(self.directory),
+            "profiled": self.profiled,
+            "recent": self.recent[-10:],
+        }
+
+def hot_spots(directory: str, limit: int = 20) -> Dict:
+    """Functions with the most own time across every profile in directory"""
+    result: Dict[str, Any] = {}
+    files = glob.glob(os.path.join(directory, "*.pstats"))
+    if files:
+        import pstats
+        stats = pstats.Stats(*files)
+        rows = sorted(stats.stats.items(), key=lambda item: -item[1][2])[:limit]
+        result["cprofile"] = {
+            "profiles": len(files),
+            "total_seconds": round(stats.total_tt, 4),
+            "functions": [{
+                "function": f"{name} ({os.path.basename(filename)}:{line})",
+                "calls": calls,
+                "own_seconds": round(own, 4),
+                "cumulative_seconds": round(cumulative, 4),
+            } for (filename, line, name), (_, calls, own, cumulative, _) in rows]
+        }
+    files = glob.glob(os.path.join(directory, "*.folded"))
+    if files:
+        leaves: Counter = Counter()
+        for path in files:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    stack, _, count = line.rstrip("\n").rpartition(" ")
+                    leaves[stack.rsplit(";", 1)[-1]] += int(count)
+        total = sum(leaves.values()) or 1
+        result["sampled"] = {
+            "profiles": len(files),
+            "samples": sum(leaves.values()),
+            "functions": [{"function": name, "samples": count, "share": round(count / total, 4)}
+                          for name, count in leaves.most_common(limit)]
+        }
+    return result
+
+# Installed profiler; None means profiling is off and the hooks cost a single check
+_profiler: Optional[Profiler] = None
+_original_run_turns = None
+
+def get_profiler() -> Optional[Profiler]:
+    return _profiler
+
+def current_session() -> Optional[ProfileSession]:
+    return _current.get()
+
+def enable_profiling(directory: str, sample_rate: float = 0.05, mode: str = "cprofile",
+                     interval: float = 0.005) -> Profiler:
+    """Start profiling sampled calls, also hooking BattleEngine.run_turns, which every 1v1 battle goes through"""
+    global _profiler, _original_run_turns
+    _profiler = Profiler(directory, sample_rate, mode, interval)
+    if _original_run_turns is None:
+        from .battle.engine import BattleEngine
+        original = _original_run_turns = BattleEngine.run_turns
+
+        @functools.wraps(original)
+        def run_turns(engine, state):
+            # Sampled where the battle starts, so a battle inside a profiled call is not profiled twice
+            profiler = _profiler
+            if profiler is not None and profiler.sample():
+                return profiler.iterate("engine.run_turns", original(engine, state))
+            return original(engine, state)
+
+        BattleEngine.run_turns = run_turns
+    return _profiler
+
+def disable_profiling():
+    """Stop profiling and restore the unwrapped hooks"""
+    global _profiler, _original_run_turns
+    _profiler = None
+    if _original_run_turns is not None:
+        from .battle.engine import BattleEngine
+        BattleEngine.run_turns = _original_run_turns
+        _original_run_turns = None
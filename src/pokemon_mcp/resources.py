@@ -0,0 +1,121 @@
+# src/pokemon_mcp/resources.py
+import json
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from urllib.parse import unquote
+
+if TYPE_CHECKING:
+    from .battle.moves import Move, MoveClient
+    from .data.pokemon_client import Pokemon, PokemonClient
+
+# (uri template, name, description) of the per-item resources
+TEMPLATES = [
+    ("pokemon://pokemon/{name}", "Pokemon",
+     "Stats, types, abilities and full learnset of one Pokemon, by name or National Dex number"),
+    ("pokemon://move/{name}", "Move", "Battle data of one move"),
+    ("pokemon://evolution/{species}", "Evolution chain", "Complete evolution tree around one species"),
+]
+
+def _dumps(data: Dict) -> str:
+    return json.dumps(data, separators=(",", ":"))
+
+class BodyCache:
+    """Serialized resource bodies, reused until the data they were built from is replaced
+
+    Each body is stored with the object it was serialized from: a client
+    cache entry or an evolution chain. A refreshed cache entry is a new
+    object with a higher version, so a stale body is never served.
+    """
+
+    def __init__(self, max_size: int = 2000):
+        self.max_size = max_size
+        self._bodies: "OrderedDict[str, Tuple[Any, str]]" = OrderedDict()
+
+    def get(self, uri: str, source: Any) -> Optional[str]:
+        cached = self._bodies.get(uri)
+        if cached is None or cached[0] is not source:
+            return None
+        self._bodies.move_to_end(uri)
+        return cached[1]
+
+    def set(self, uri: str, source: Any, body: str) -> str:
+        self._bodies[uri] = (source, body)
+        self._bodies.move_to_end(uri)
+        while len(self._bodies) > self.max_size:
+            self._bodies.popitem(last=False)
+        return body
+
+    def clear(self):
+        self._bodies.clear()
+
+def pokemon_body(pokemon: "Pokemon", version: int) -> str:
+    stats = pokemon.stats
+    return _dumps({
+        "id": pokemon.id,
+        "name": pokemon.name,
+        "version": version,
+        "types": pokemon.types,
+        "stats": {
+            "hp": stats.hp, "attack": stats.attack, "defense": stats.defense,
+            "special_attack": stats.special_attack, "special_defense": stats.special_defense, "speed": stats.speed,
+            "total": stats.hp + stats.attack + stats.defense + stats.special_attack + stats.special_defense + stats.speed
+        },
+        "abilities": pokemon.abilities,
+        "height_m": pokemon.height / 10,
+        "weight_kg": pokemon.weight / 10,
+        "base_experience": pokemon.base_experience,
+        "sprite_url": pokemon.sprite_url,
+        "learnset": pokemon.learnset.details() if pokemon.learnset else [{"name": name} for name in pokemon.moves],
+        "evolution": f"pokemon://evolution/{pokemon.name}",
+    })
+
+def move_body(move: "Move", version: int) -> str:
+    return _dumps({
+        "name": move.name,
+        "version": version,
+        "type": move.type,
+        "category": move.category.value,
+        "power": move.power,
+        "accuracy": move.accuracy,
+        "pp": move.pp,
+        "priority": move.priority,
+        "status_effect": move.status_effect.value if move.status_effect else None,
+        "status_chance": move.status_chance,
+        "description": move.description,
+    })
+
+async def read_template(uri: str, bodies: BodyCache, pokemon_client: "PokemonClient",
+                        move_client: "MoveClient") -> Optional[Tuple[str, Optional[int]]]:
+    """(body, version) of a templated resource; None when the URI matches no template"""
+    kind, _, key = uri[len("pokemon://"):].partition("/") if uri.startswith("pokemon://") else ("", "", "")
+    key = unquote(key).strip().lower()
+    if not key or kind not in ("pokemon", "move", "evolution"):
+        return None
+
+    if kind == "pokemon":
+        entry = await pokemon_client.get_pokemon_entry(key)
+        if entry is None:
+            raise ValueError(f"Pokemon '{key}' not found")
+        body = bodies.get(uri, entry) or bodies.set(uri, entry, pokemon_body(entry.value, entry.version))
+        return body, entry.version
+
+    if kind == "move":
+        entry = await move_client.get_move_entry(key.replace(" ", "-"))
+        if entry is None:
+            raise ValueError(f"Move '{key}' not found")
+        body = bodies.get(uri, entry) or bodies.set(uri, entry, move_body(entry.value, entry.version))
+        return body, entry.version
+
+    graph = pokemon_client.evolution_graph
+    chain = graph.get(key)
+    if chain is None:
+        # Not loaded yet: a Pokemon of that name (default or other form) leads to its species' chain
+        pokemon = await pokemon_client.get_pokemon(key)
+        if pokemon is not None:
+            evolution = await pokemon_client.get_evolution_chain(pokemon.species_url)
+            key = evolution.get("species_name", key)
+        chain = graph.get(key)
+        if chain is None:
+            raise ValueError(f"No evolution chain known for '{key}'")
+    body = bodies.get(uri, chain) or bodies.set(uri, chain, _dumps(graph.describe(key)))
+    return body, None
@@ -0,0 +1,160 @@
+# src/pokemon_mcp/scheduler.py
+import asyncio
+import contextvars
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+from .profiling import current_session
+
+# Executor work submitted by the scheduled call running in this context
+_cpu_work: "contextvars.ContextVar[Optional[List[Future]]]" = contextvars.ContextVar("cpu_work", default=None)
+
+class ToolOverloaded(Exception):
+    """Raised when a tool's queue is full and the call is shed"""
+
+class ToolTimeout(Exception):
+    """Raised when a call misses its deadline, counting time spent queued"""
+
+@dataclass
+class ToolLimits:
+    concurrency: int = 8  # Calls of the tool running at once
+    queue_size: int = 32  # Calls allowed to wait for a slot before new ones are shed
+    timeout: float = 30.0  # Deadline in seconds, from arrival to result
+
+class _Lane:
+    def __init__(self, limits: ToolLimits):
+        self.limits = limits
+        self.semaphore = asyncio.Semaphore(max(1, limits.concurrency))
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.shed = 0
+        self.timed_out = 0
+
+class ToolScheduler:
+    """Admission control for tool calls
+
+    Each tool gets its own concurrency limit, bounded wait queue and deadline,
+    so a burst of slow calls to one tool cannot starve the others. Calls that
+    miss their deadline are cancelled, and CPU-bound work is moved off the
+    event loop with run_cpu / iterate_cpu.
+
+    Deadlines are advisory for that CPU work: a thread cannot be interrupted,
+    so a call past its deadline raises ToolTimeout at once, but work not yet
+    started is dropped and a running thread keeps the call's slot until it
+    finishes. Overrunning calls therefore still count against the tool's
+    concurrency instead of piling up in the executor.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, ToolLimits]] = None,
+                 default: Optional[ToolLimits] = None, cpu_workers: int = 2):
+        self.limits = dict(limits or {})
+        self.default = default or ToolLimits()
+        self.cpu_workers = cpu_workers
+        self._lanes: Dict[str, _Lane] = {}
+        self._executor: Optional[Executor] = None
+
+    def _lane(self, tool: str) -> _Lane:
+        lane = self._lanes.get(tool)
+        if lane is None:
+            lane = self._lanes[tool] = _Lane(self.limits.get(tool, self.default))
+        return lane
+
+    async def run(self, tool: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run call() under the tool's limits; raises ToolOverloaded or ToolTimeout"""
+        lane = self._lane(tool)
+        limits = lane.limits
+        deadline = time.monotonic() + limits.timeout
+        if not lane.semaphore.locked():
+            await lane.semaphore.acquire()  # A slot is free, so this does not suspend
+        else:
+            if lane.waiting >= limits.queue_size:
+                lane.shed += 1
+                raise ToolOverloaded(f"{tool} is at capacity ({limits.concurrency} running, "
+                                     f"{lane.waiting} queued); try again shortly")
+            lane.waiting += 1
+            try:
+                await asyncio.wait_for(lane.semaphore.acquire(), limits.timeout)
+            except asyncio.TimeoutError:
+                lane.timed_out += 1
+                raise ToolTimeout(f"{tool} timed out after {limits.timeout:g}s waiting for a free slot")
+            finally:
+                lane.waiting -= 1
+
+        lane.running += 1
+        work: List[Future] = []
+        token = _cpu_work.set(work)
+        try:
+            # wait_for cancels the call when the deadline passes
+            return await asyncio.wait_for(call(), max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            lane.timed_out += 1
+            raise ToolTimeout(f"{tool} timed out after {limits.timeout:g}s")
+        finally:
+            _cpu_work.reset(token)
+            self._release_after(lane, [future for future in work if not future.cancel() and not future.done()])
+
+    def _release_after(self, lane: _Lane, running: List[Future]):
+        """Free the lane's slot once the executor threads still running for the call are done"""
+        def release():
+            lane.running -= 1
+            lane.completed += 1
+            lane.semaphore.release()
+
+        if not running:
+            release()
+            return
+        loop = asyncio.get_running_loop()
+        remaining = [len(running)]
+
+        def finished(_):
+            remaining[0] -= 1
+            if not remaining[0]:
+                loop.call_soon_threadsafe(release)
+
+        for future in running:
+            future.add_done_callback(finished)
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=max(1, self.cpu_workers),
+                                                thread_name_prefix="pokemon-cpu")
+        return self._executor
+
+    async def run_cpu(self, fn: Callable, *args) -> Any:
+        """Run a CPU-bound function in the executor so the event loop keeps serving other sessions"""
+        session = current_session()
+        if session is not None:
+            fn = session.wrap(fn)
+        return await self._submit(fn, *args)
+
+    async def iterate_cpu(self, iterator: Iterator) -> AsyncIterator:
+        """Advance a CPU-bound iterator in the executor, yielding each item on the event loop"""
+        done = object()
+        session = current_session()
+        step = next if session is None else session.wrap(next)
+        while True:
+            item = await self._submit(step, iterator, done)
+            if item is done:
+                return
+            yield item
+
+    def _submit(self, fn: Callable, *args) -> Awaitable:
+        future = self.executor.submit(fn, *args)
+        work = _cpu_work.get()
+        if work is not None:
+            work[:] = [pending for pending in work if not pending.done()]  # Long iterations submit many steps
+            work.append(future)
+        return asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {tool: {"running": lane.running, "waiting": lane.waiting, "completed": lane.completed,
+                       "shed": lane.shed, "timed_out": lane.timed_out}
+                for tool, lane in self._lanes.items()}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
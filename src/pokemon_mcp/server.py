@@ -1,21 +1,264 @@
 import asyncio
-from mcp.server import Server, NotificationOptions
-from mcp.server.models import InitializationOptions
-from mcp.types import (
-    Resource, 
-    Tool, 
-    TextContent, 
-    ImageContent, 
-    EmbeddedResource
-)
-from mcp.server.stdio import stdio_server
-from .data.pokemon_client import PokemonClient
-from .battle.engine import BattleEngine
 import json
+from typing import TYPE_CHECKING, Dict, List, Optional
+from mcp.server import Server
+from mcp.types import ImageContent, Resource, ResourceTemplate, Tool, TextContent
+from .config import ServerConfig
+from .profiling import get_profiler
 
-# Initialize our services
-pokemon_client = PokemonClient()
-battle_engine = BattleEngine()
+if TYPE_CHECKING:
+    from .data.pokemon_client import PokemonClient
+    from .data.pokedex import PokedexIndex
+    from .data.stat_table import StatTable
+    from .battle.engine import BattleEngine
+    from .scheduler import ToolScheduler
+    from .battle.pool import SimulationPool
+    from .battle.engine import BattlePokemon
+    from .data.battle_store import BattleStore
+    from .data.pokemon_client import Pokemon
+    from .battle.moves import Move
+    from .resources import BodyCache
+    from .data.sprites import SpriteCache
+    from mcp.server.lowlevel.helper_types import ReadResourceContents
+
+# Services are created on first use so spawning a stdio session stays fast
+config = ServerConfig.from_env()
+_pokemon_client: Optional["PokemonClient"] = None
+_battle_engine: Optional["BattleEngine"] = None
+_pokedex: Optional["PokedexIndex"] = None
+_pokedex_lock: Optional[asyncio.Lock] = None
+_stat_table: Optional["StatTable"] = None
+_scheduler: Optional["ToolScheduler"] = None
+_simulation_pool: Optional["SimulationPool"] = None
+_battle_store: Optional["BattleStore"] = None
+_resource_bodies: Optional["BodyCache"] = None
+_static_bodies: Dict[str, str] = {}
+_sprite_cache: Optional["SpriteCache"] = None
+_bulk_loads: Dict[str, asyncio.Future] = {}
+
+# Tools whose calls run battle simulations and share the battle limits
+BATTLE_TOOLS = ("simulate_battle", "simulate_team_battle", "simulate_series", "optimize_team")
+MAX_SERIES_BATTLES = 10000
+MAX_OPTIMIZER_CANDIDATES = 100
+
+def get_pokemon_client() -> "PokemonClient":
+    """Return the shared PokemonClient, creating it on first use"""
+    global _pokemon_client
+    if _pokemon_client is None:
+        if config.data_backend == "graphql":
+            from .data.graphql_client import GraphQLPokemonClient
+            _pokemon_client = GraphQLPokemonClient(config)
+        else:
+            from .data.pokemon_client import PokemonClient
+            _pokemon_client = PokemonClient(config)
+    return _pokemon_client
+
+def get_battle_engine() -> "BattleEngine":
+    """Return the shared BattleEngine, creating it on first use"""
+    global _battle_engine
+    if _battle_engine is None:
+        from .battle.engine import BattleEngine
+        _battle_engine = BattleEngine(max_turns=config.max_battle_turns, policy=config.battle_policy,
+                                      epsilon=config.policy_epsilon)
+    return _battle_engine
+
+def get_scheduler() -> "ToolScheduler":
+    """Return the tool scheduler, with battle tools limited separately from lookups"""
+    global _scheduler
+    if _scheduler is None:
+        from .scheduler import ToolLimits, ToolScheduler
+        battle_limits = ToolLimits(config.battle_concurrency, config.tool_queue_size, config.battle_timeout)
+        _scheduler = ToolScheduler(
+            limits={tool: battle_limits for tool in BATTLE_TOOLS},
+            default=ToolLimits(config.tool_concurrency, config.tool_queue_size, config.tool_timeout),
+            cpu_workers=config.cpu_workers
+        )
+    return _scheduler
+
+def get_simulation_pool() -> "SimulationPool":
+    """Return the process pool for batch simulations, starting its workers on first use"""
+    global _simulation_pool
+    if _simulation_pool is None:
+        from .battle.pool import SimulationPool
+        _simulation_pool = SimulationPool(
+            workers=config.simulation_workers,
+            chunk_size=config.simulation_chunk_size,
+            max_turns=config.max_battle_turns,
+            policy=config.battle_policy,
+            epsilon=config.policy_epsilon
+        )
+        _simulation_pool.start()
+    return _simulation_pool
+
+def get_battle_store() -> Optional["BattleStore"]:
+    """Return the battle history store, or None when recording is disabled"""
+    global _battle_store
+    if _battle_store is None and config.battle_store_enabled:
+        import os
+        from .data.battle_store import BattleStore
+        _battle_store = BattleStore(config.battle_store_path or os.path.join(config.cache_directory, "battles.sqlite3"))
+    return _battle_store
+
+def _store_members(members: List["BattlePokemon"]) -> list:
+    return [(member.name, member.pokemon.types, member.max_hp) for member in members]
+
+def record_battle(kind: str, team1: List["BattlePokemon"], team2: List["BattlePokemon"], winner: str,
+                  turns: int, hp_left: List[int], seed: Optional[int] = None):
+    """Queue a finished battle for the history store; never blocks"""
+    store = get_battle_store()
+    if store is not None:
+        store.record(kind, get_battle_engine().policy_name, _store_members(team1), _store_members(team2),
+                     winner, turns, hp_left, seed)
+
+def record_series(kind: str, team1: List["BattlePokemon"], team2: List["BattlePokemon"], result, seed: Optional[int]):
+    store = get_battle_store()
+    if store is not None:
+        store.record_series(kind, get_battle_engine().policy_name, _store_members(team1), _store_members(team2),
+                            result.outcomes(len(team1), len(team2)), seed)
+
+def profile_directory() -> str:
+    import os
+    return config.profile_directory or os.path.join(config.cache_directory, "profiles")
+
+def start_profiling(sample_rate: Optional[float] = None, mode: Optional[str] = None):
+    """Profile a sampled fraction of tool calls and battles; raises ValueError for an unknown mode"""
+    from .profiling import enable_profiling
+    return enable_profiling(
+        profile_directory(),
+        config.profile_sample_rate if sample_rate is None else sample_rate,
+        mode or config.profile_mode,
+        config.profile_interval
+    )
+
+async def fetch_pokemon(names: List[str]) -> List["Pokemon"]:
+    """Fetch Pokemon by name or ID; raises ValueError naming any unknown ones"""
+    client = get_pokemon_client()
+    found = await asyncio.gather(*(client.get_pokemon(str(name)) for name in names))
+    missing = [str(name) for name, pokemon in zip(names, found) if not pokemon]
+    if missing:
+        raise ValueError(f"Pokemon not found: {', '.join(missing)}")
+    return list(found)
+
+async def prepare_members(names: List[str]) -> List["BattlePokemon"]:
+    """Fetch Pokemon by name and load their battle moves; raises ValueError naming any unknown ones"""
+    from .battle.engine import BattlePokemon
+    members = [BattlePokemon(pokemon) for pokemon in await fetch_pokemon(names)]
+    await asyncio.gather(*(member.initialize_moves() for member in members))
+    return members
+
+async def resolve_moves(names: List[str]) -> List["Move"]:
+    """Moves by name, from the move table when loaded; raises ValueError naming any unknown ones"""
+    from .battle.moves import get_move_client
+    from .data.move_table import loaded_move_table
+    table = loaded_move_table()
+    keys = [str(name).lower().replace(" ", "-") for name in names]
+    moves = [table.move(key) if table is not None else None for key in keys]
+    entries = await asyncio.gather(*(get_move_client().get_move_entry(key)
+                                     for key, move in zip(keys, moves) if move is None))
+    fetched = iter(entries)
+    moves = [move if move is not None else getattr(next(fetched), "value", None) for move in moves]
+    missing = [name for name, move in zip(names, moves) if move is None]
+    if missing:
+        raise ValueError(f"Unknown moves: {', '.join(missing)}")
+    return moves
+
+def get_sprite_cache() -> "SpriteCache":
+    """Return the sprite cache, stored under the cache directory"""
+    global _sprite_cache
+    if _sprite_cache is None:
+        import os
+        from .data.sprites import SpriteCache
+        _sprite_cache = SpriteCache(os.path.join(config.cache_directory, "sprites"),
+                                    config.sprite_memory_bytes, config.sprite_size)
+    return _sprite_cache
+
+async def get_pokedex() -> "PokedexIndex":
+    """Return the Pokedex index, loading or building it once on first use"""
+    global _pokedex, _pokedex_lock
+    if _pokedex is not None:
+        return _pokedex
+    if _pokedex_lock is None:
+        _pokedex_lock = asyncio.Lock()
+    async with _pokedex_lock:
+        if _pokedex is None:
+            from .data.pokedex import load_pokedex
+            _pokedex = await load_pokedex(get_pokemon_client(), config.cache_directory,
+                                          config.bulk_load_concurrency)
+    return _pokedex
+
+async def get_stat_table() -> "StatTable":
+    """Return the columnar stat table built over the Pokedex index"""
+    global _stat_table
+    if _stat_table is None:
+        from .data.stat_table import StatTable
+        _stat_table = StatTable(await get_pokedex())
+    return _stat_table
+
+async def load_evolution_data():
+    """Bulk-load every evolution chain into the client's shared evolution graph"""
+    from .data.evolution import load_evolution_graph
+    await load_evolution_graph(get_pokemon_client(), config.cache_directory, config.bulk_load_concurrency)
+
+async def load_move_data():
+    """Bulk-load the local move table used to pick each Pokemon's battle moveset"""
+    from .battle.moves import get_move_client
+    from .data.move_table import load_move_table
+    await load_move_table(get_move_client(), config.cache_directory, config.bulk_load_concurrency)
+
+def start_bulk_load(kind: str) -> asyncio.Future:
+    """Load the move table ("moves") or evolution graph ("evolution") in the background, once
+
+    Each loads from its snapshot, or is built from the API the first time it
+    is needed; until it is ready, callers fall back to per-item requests.
+    A failed load is retried by the next call.
+    """
+    future = _bulk_loads.get(kind)
+    if future is None or (future.done() and (future.cancelled() or future.exception())):
+        loader = {"moves": load_move_data, "evolution": load_evolution_data}[kind]
+        future = _bulk_loads[kind] = asyncio.ensure_future(loader())
+        future.add_done_callback(_report_background_error)
+    return future
+
+async def warm_up():
+    """Open the API connections, then fill the caches with the top species, within PREWARM_TIMEOUT"""
+    import sys
+    import time
+    from .data.http import prewarm_connections
+    from .prewarm import prewarm
+    started = time.monotonic()
+    try:
+        await asyncio.wait_for(prewarm_connections(config), config.prewarm_timeout)
+    except asyncio.TimeoutError:
+        print("Connection warm-up timed out", file=sys.stderr)
+    await prewarm(
+        get_pokemon_client(),
+        species=config.prewarm_species,
+        top_n=config.prewarm_top_n,
+        concurrency=config.prewarm_concurrency,
+        timeout=max(0.0, config.prewarm_timeout - (time.monotonic() - started))
+    )
+
+def _progress_reporter():
+    """Progress callback for the current tool call, or None if the client sent no progress token"""
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return None
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return None
+    
+    async def report(progress: float, total: float, message: str):
+        await ctx.session.send_progress_notification(
+            token, progress, total=total, message=message, related_request_id=str(ctx.request_id)
+        )
+    return report
+
+def _report_background_error(task: asyncio.Future):
+    """Log failures of fire-and-forget startup tasks"""
+    import sys
+    if not task.cancelled() and task.exception():
+        print(f"Background task failed: {task.exception()}", file=sys.stderr)
 
 # Create the MCP server
 server = Server("pokemon-battle-server")
@@ -38,11 +281,19 @@ async def list_resources() -> list[Resource]:
         )
     ]
 
-@server.read_resource()
-async def read_resource(uri: str) -> str:
-    """Read Pokemon resource data"""
-    if uri == "pokemon://data":
-        return json.dumps({
+@server.list_resource_templates()
+async def list_resource_templates() -> list[ResourceTemplate]:
+    """Per-Pokemon, per-move and per-species resources"""
+    from .resources import TEMPLATES
+    return [ResourceTemplate(uriTemplate=template, name=name, description=description, mimeType="application/json")
+            for template, name, description in TEMPLATES]
+
+def _static_resource(uri: str) -> Optional[str]:
+    """Bodies of the fixed resources, serialized once"""
+    from .resources import TEMPLATES
+    body = _static_bodies.get(uri)
+    if body is None and uri == "pokemon://data":
+        body = json.dumps({
             "description": "Pokemon Data Resource",
             "features": [
                 "Base stats (HP, Attack, Defense, Special Attack, Special Defense, Speed)",
@@ -62,13 +313,13 @@ async def read_resource(uri: str) -> str:
                     "get_pokemon('charizard')"
                 ]
             },
+            "resources": [template for template, _, _ in TEMPLATES],
             "data_source": "PokeAPI (https://pokeapi.co)",
             "total_pokemon": "1000+ Pokemon available"
         }, indent=2)
-    
-    elif uri == "pokemon://types":
+    elif body is None and uri == "pokemon://types":
         from .battle.mechanics import TYPE_EFFECTIVENESS
-        return json.dumps({
+        body = json.dumps({
             "description": "Type Effectiveness Chart",
             "type_chart": TYPE_EFFECTIVENESS,
             "effectiveness_values": {
@@ -79,9 +330,32 @@ async def read_resource(uri: str) -> str:
             },
             "usage": "Used automatically in battle simulations for damage calculations"
         }, indent=2)
+    if body is not None:
+        _static_bodies[uri] = body
+    return body
+
+@server.read_resource()
+async def read_resource(uri) -> list["ReadResourceContents"]:
+    """Read Pokemon resource data; templated bodies are served pre-serialized from the client caches"""
+    from mcp.server.lowlevel.helper_types import ReadResourceContents
+    uri = str(uri)  # The SDK passes a pydantic AnyUrl
+    if uri.startswith("pokemon://evolution/"):
+        start_bulk_load("evolution")
+    body = _static_resource(uri)
+    if body is not None:
+        return [ReadResourceContents(content=body, mime_type="application/json")]
     
-    else:
+    global _resource_bodies
+    from .battle.moves import get_move_client
+    from .resources import BodyCache, read_template
+    if _resource_bodies is None:
+        _resource_bodies = BodyCache(config.memory_cache_size * 2)
+    result = await read_template(uri, _resource_bodies, get_pokemon_client(), get_move_client())
+    if result is None:
         raise ValueError(f"Unknown resource: {uri}")
+    body, version = result
+    return [ReadResourceContents(content=body, mime_type="application/json",
+                                 meta={"version": version} if version is not None else None)]
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
@@ -96,6 +370,10 @@ async def list_tools() -> list[Tool]:
                     "name_or_id": {
                         "type": "string",
                         "description": "Pokemon name (e.g., 'pikachu') or ID number (e.g., '25')"
+                    },
+                    "include_sprite": {
+                        "type": "boolean",
+                        "description": "Attach the sprite as an image (default: on when the server runs with SPRITE_MODE=image)"
                     }
                 },
                 "required": ["name_or_id"]
@@ -118,12 +396,354 @@ async def list_tools() -> list[Tool]:
                 },
                 "required": ["pokemon1", "pokemon2"]
             }
+        ),
+        Tool(
+            name="simulate_team_battle",
+            description="Simulate a team battle between two parties of up to six Pokemon each; a fainted Pokemon is replaced by the next one in its party until one side has nobody left",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "team1": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "minItems": 1,
+                        "maxItems": 6,
+                        "description": "Names or IDs of the first party, in sending-out order"
+                    },
+                    "team2": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "minItems": 1,
+                        "maxItems": 6,
+                        "description": "Names or IDs of the second party, in sending-out order"
+                    },
+                    "include_log": {
+                        "type": "boolean",
+                        "description": "Include the turn-by-turn log (default true)"
+                    }
+                },
+                "required": ["team1", "team2"]
+            }
+        ),
+        Tool(
+            name="analyze_team",
+            description="Type coverage of a team: types it has no super effective attack against, weaknesses several members share, attacking types nobody resists and a resistance score",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "team": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Pokemon names or IDs",
+                        "minItems": 1,
+                        "maxItems": 6
+                    }
+                },
+                "required": ["team"]
+            }
+        ),
+        Tool(
+            name="damage_matrix",
+            description="Damage of every attacker move against every defender in one call: min, max and expected damage, and the chance to knock out in one or two hits",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "attackers": {
+                        "type": "array",
+                        "items": {
+                            "anyOf": [
+                                {"type": "string"},
+                                {
+                                    "type": "object",
+                                    "properties": {
+                                        "name": {"type": "string"},
+                                        "moves": {"type": "array", "items": {"type": "string"}, "maxItems": 4}
+                                    },
+                                    "required": ["name"]
+                                }
+                            ]
+                        },
+                        "description": "Pokemon names, or {name, moves} to choose the moveset (default: the moveset used in battles)",
+                        "minItems": 1,
+                        "maxItems": 12
+                    },
+                    "defenders": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Pokemon names or IDs to attack",
+                        "minItems": 1,
+                        "maxItems": 200
+                    }
+                },
+                "required": ["attackers", "defenders"]
+            }
+        ),
+        Tool(
+            name="optimize_team",
+            description="Find the team of up to six candidates that best counters a set of opponents, by beam search over expected-damage matchups, then check the best teams with simulated battles",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "candidates": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Pokemon names or IDs to build the team from",
+                        "minItems": 1,
+                        "maxItems": MAX_OPTIMIZER_CANDIDATES
+                    },
+                    "opponents": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Pokemon names or IDs to counter; simulated as parties of six in this order",
+                        "minItems": 1,
+                        "maxItems": 24
+                    },
+                    "team_size": {"type": "integer", "description": "Team size (default 6)", "minimum": 1, "maximum": 6},
+                    "time_budget": {"type": "number", "description": "Seconds the search may take (default 5, at most 20)"},
+                    "beam_width": {"type": "integer", "description": "Teams kept per search step (default 16)", "minimum": 1, "maximum": 256},
+                    "top": {"type": "integer", "description": "Teams to return (default 3)", "minimum": 1, "maximum": 10},
+                    "battles": {"type": "integer", "description": "Simulated battles per returned team and opponent party (default 100, 0 to skip)"},
+                    "seed": {"type": "integer", "description": "Random seed for reproducible simulations"}
+                },
+                "required": ["candidates", "opponents"]
+            }
+        ),
+        Tool(
+            name="simulate_series",
+            description="Run many battles in parallel worker processes and report win rates: 'batch' repeats one matchup (1v1 or teams), 'tournament' plays every team against every other team",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "mode": {
+                        "type": "string",
+                        "enum": ["batch", "tournament"],
+                        "description": "'batch' needs team1 and team2, 'tournament' needs teams"
+                    },
+                    "team1": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "maxItems": 6,
+                        "description": "First party for batch mode (a single name for a 1v1)"
+                    },
+                    "team2": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "maxItems": 6,
+                        "description": "Second party for batch mode"
+                    },
+                    "teams": {
+                        "type": "object",
+                        "additionalProperties": {"type": "array", "items": {"type": "string"}, "maxItems": 6},
+                        "description": "Tournament entrants: team name to list of Pokemon"
+                    },
+                    "battles": {
+                        "type": "integer",
+                        "description": f"Battles per matchup (default 100, at most {MAX_SERIES_BATTLES})"
+                    },
+                    "seed": {
+                        "type": "integer",
+                        "description": "Random seed for reproducible results"
+                    },
+                    "use_history": {
+                        "type": "boolean",
+                        "description": "Answer a batch from recorded battles of the same matchup when there are enough (default true; ignored with a seed)"
+                    }
+                },
+                "required": ["mode"]
+            }
+        ),
+        Tool(
+            name="battle_history",
+            description="Aggregate statistics over every battle simulated so far: win rate and HP left for a species or type (optionally ranked per species), or the recorded results of one matchup",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "species": {
+                        "type": "string",
+                        "description": "Only count appearances of this species"
+                    },
+                    "type": {
+                        "type": "string",
+                        "description": "Only count appearances of Pokemon with this type"
+                    },
+                    "group_by": {
+                        "type": "string",
+                        "enum": ["species"],
+                        "description": "Rank species by win rate instead of returning one total"
+                    },
+                    "min_battles": {
+                        "type": "integer",
+                        "description": "Minimum appearances for a species to be ranked (default 10)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of ranked species (default 20)"
+                    },
+                    "team1": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "With team2: summarize this exact matchup instead"
+                    },
+                    "team2": {
+                        "type": "array",
+                        "items": {"type": "string"}
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="profiling",
+            description="Admin: turn profiling of a sampled fraction of tool calls on or off, and list the hottest functions in the profiles collected so far",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "action": {
+                        "type": "string",
+                        "enum": ["status", "start", "stop", "hot_spots"],
+                        "description": "What to do (default status)"
+                    },
+                    "sample_rate": {
+                        "type": "number",
+                        "description": "With start: fraction of calls to profile, 0 to 1"
+                    },
+                    "mode": {
+                        "type": "string",
+                        "enum": ["cprofile", "sample"],
+                        "description": "With start: cProfile (.pstats) or stack sampling (.folded collapsed stacks)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "With hot_spots: number of functions to list (default 20)"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="cache_admin",
+            description="Admin: inspect and control the Pokemon and move caches: entry counts, estimated sizes, hit ratios and ages; drop entries, evict down to a byte budget, load names ahead of use or build the bulk Pokedex index, evolution graph and move table",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "action": {
+                        "type": "string",
+                        "enum": ["stats", "invalidate", "evict", "warm", "build"],
+                        "description": "What to do (default stats)"
+                    },
+                    "cache": {
+                        "type": "string",
+                        "enum": ["pokemon", "moves", "all"],
+                        "description": "Which cache (default all)"
+                    },
+                    "names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "With invalidate: entries to drop (default all). With warm: Pokemon (with their evolution chains and first moves) or, for the moves cache, move names to load"
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "description": "With evict: estimated size each selected cache is cut down to, least recently used entries first"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="search_pokemon",
+            description="Search the full Pokedex (all species and forms) by name prefix or fuzzy name, and filter by type or by stat, e.g. fire types with speed > 100",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Name or name prefix to look for (e.g., 'char' or 'pikachoo')"
+                    },
+                    "mode": {
+                        "type": "string",
+                        "enum": ["auto", "prefix", "fuzzy"],
+                        "description": "How to match the query; 'auto' tries prefix first, then fuzzy"
+                    },
+                    "types": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Types every result must have (e.g., ['fire', 'flying'])"
+                    },
+                    "filters": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Attribute filters such as 'speed > 100', 'total >= 600' or 'weight < 100'. Fields: hp, attack, defense, special_attack, special_defense, speed, total, height, weight, id"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of results (default 20)"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="query_stats",
+            description="Answer analytic stat questions across the whole Pokedex in one call: top/bottom rankings (e.g. top 10 special attackers, fastest water type), a Pokemon's percentile for a stat, or aggregate statistics overall or per type",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "operation": {
+                        "type": "string",
+                        "enum": ["top", "bottom", "percentile", "aggregate"],
+                        "description": "'top'/'bottom' rank by the stat, 'percentile' locates one Pokemon, 'aggregate' summarizes the stat"
+                    },
+                    "stat": {
+                        "type": "string",
+                        "description": "hp, attack, defense, special_attack, special_defense, speed, total, height or weight"
+                    },
+                    "n": {
+                        "type": "integer",
+                        "description": "Number of ranked results for top/bottom (default 10)"
+                    },
+                    "pokemon": {
+                        "type": "string",
+                        "description": "Pokemon name or ID for the percentile operation"
+                    },
+                    "group_by": {
+                        "type": "string",
+                        "enum": ["type"],
+                        "description": "Group aggregate results by type"
+                    },
+                    "types": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only consider Pokemon having all of these types"
+                    },
+                    "filters": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Attribute filters such as 'speed > 100' or 'total >= 500'"
+                    }
+                },
+                "required": ["operation", "stat"]
+            }
         )
     ]
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Handle tool calls"""
+    """Handle tool calls under the scheduler's per-tool limits and deadlines"""
+    from .scheduler import ToolOverloaded, ToolTimeout
+    profiler = get_profiler()
+    if profiler is not None and name != "profiling" and profiler.sample():
+        call = lambda: profiler.run(name, lambda: _dispatch_tool(name, arguments))
+    else:
+        call = lambda: _dispatch_tool(name, arguments)
+    try:
+        return await get_scheduler().run(name, call)
+    except (ToolOverloaded, ToolTimeout) as e:
+        return [TextContent(type="text", text=f"Error: {e}")]
+
+async def _dispatch_tool(name: str, arguments: dict) -> list[TextContent]:
+    """Run one tool call"""
+    
+    pokemon_client = get_pokemon_client()
+    if name in BATTLE_TOOLS or name == "damage_matrix":
+        start_bulk_load("moves")
+    elif name == "get_pokemon":
+        start_bulk_load("evolution")
     
     if name == "get_pokemon":
         name_or_id = arguments.get("name_or_id")
@@ -134,8 +754,12 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         if not pokemon:
             return [TextContent(type="text", text=f"Pokemon '{name_or_id}' not found. Please check the spelling or try a different Pokemon name/ID.")]
         
-        # Get evolution data
-        evolution_data = await pokemon_client.get_evolution_chain(pokemon.species_url)
+        # Get evolution data, and the sprite thumbnail when images are wanted
+        include_sprite = arguments.get("include_sprite", config.sprite_mode == "image")
+        evolution_data, sprite = await asyncio.gather(
+            pokemon_client.get_evolution_chain(pokemon.species_url),
+            get_sprite_cache().get(pokemon.sprite_url) if include_sprite else asyncio.sleep(0)
+        )
         
         # Format comprehensive Pokemon data
         pokemon_data = {
@@ -161,12 +785,17 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             "abilities": pokemon.abilities,
             "moves": {
                 "sample_moves": pokemon.moves[:15],  # Show more moves
-                "total_available": len(pokemon.moves)
+                "total_available": len(pokemon.learnset) if pokemon.learnset else len(pokemon.moves),
+                "by_learn_method": pokemon.learnset.by_method() if pokemon.learnset else {}
             },
             "evolution": evolution_data
         }
         
-        return [TextContent(type="text", text=json.dumps(pokemon_data, indent=2))]
+        content = [TextContent(type="text", text=json.dumps(pokemon_data, indent=2))]
+        if sprite is not None:
+            data, mime_type = sprite
+            content.append(ImageContent(type="image", data=data, mimeType=mime_type))
+        return content
     
     elif name == "simulate_battle":
         pokemon1_name = arguments.get("pokemon1")
@@ -184,8 +813,28 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         if not pokemon2:
             return [TextContent(type="text", text=f"Pokemon '{pokemon2_name}' not found. Please check the spelling or try a different Pokemon.")]
         
-        # Simulate the battle (NOW PROPERLY ASYNC)
-        result = await battle_engine.simulate_battle(pokemon1, pokemon2)
+        # Stream the battle turn by turn, forwarding each turn as a progress
+        # notification when the client asked for progress updates
+        progress = _progress_reporter()
+        logs = []
+        engine = get_battle_engine()
+        from .battle.engine import BattleResult, BattleState
+        state = BattleState(*await engine.prepare(pokemon1, pokemon2), config.max_battle_turns)
+        # Turns are played in the CPU executor so other sessions stay responsive
+        async for event in get_scheduler().iterate_cpu(engine.run_turns(state)):
+            logs.extend(event.logs)
+            if progress:
+                await progress(event.turn, event.max_turns, "\n".join(log.message for log in event.logs))
+        
+        result = BattleResult(winner=state.winner, loser=state.loser, total_turns=state.turn, logs=logs)
+        p1, p2 = state.p1, state.p2
+        if result.winner == "Draw":
+            side = "Draw"
+        elif p1.is_fainted != p2.is_fainted:
+            side = "team2" if p1.is_fainted else "team1"
+        else:
+            side = "team1" if p1.current_hp > p2.current_hp else "team2"
+        record_battle("1v1", [p1], [p2], side, result.total_turns, [p1.current_hp, p2.current_hp])
         
         # Format comprehensive battle result
         battle_report = {
@@ -234,28 +883,356 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         
         return [TextContent(type="text", text=json.dumps(battle_report, indent=2))]
     
+    elif name == "simulate_team_battle":
+        team_names = [arguments.get("team1") or [], arguments.get("team2") or []]
+        if not all(1 <= len(names) <= 6 for names in team_names):
+            return [TextContent(type="text", text="Error: team1 and team2 must each list between 1 and 6 Pokemon")]
+        
+        # Fetch every member concurrently
+        members = await asyncio.gather(*(pokemon_client.get_pokemon(n) for n in team_names[0] + team_names[1]))
+        missing = [n for n, pokemon in zip(team_names[0] + team_names[1], members) if not pokemon]
+        if missing:
+            return [TextContent(type="text", text=f"Pokemon not found: {', '.join(missing)}. Please check the spelling or try a different Pokemon.")]
+        teams = [list(members[:len(team_names[0])]), list(members[len(team_names[0]):])]
+        
+        include_log = arguments.get("include_log", True)
+        battle = await get_battle_engine().prepare_team(teams[0], teams[1])
+        result = await get_scheduler().run_cpu(battle.run, None, include_log)
+        record_battle("team", [m for m in battle.members[:6] if m], [m for m in battle.members[6:] if m],
+                      result.winner, result.total_turns,
+                      [member["hp"] for side in ("team1", "team2") for member in result.remaining[side]])
+        
+        battle_report = {
+            "battle_summary": {
+                "winner": result.winner,
+                "loser": result.loser,
+                "total_turns": result.total_turns,
+                "knockouts": result.knockouts,
+                "battle_type": "Team Battle Simulation"
+            },
+            "teams": {
+                side: [{"name": p.name, "types": p.types} for p in team]
+                for side, team in zip(("team1", "team2"), teams)
+            },
+            "remaining": result.remaining
+        }
+        if include_log:
+            battle_report["detailed_log"] = [{"turn": log.turn, "message": log.message} for log in result.logs]
+        
+        return [TextContent(type="text", text=json.dumps(battle_report, indent=2))]
+    
+    elif name == "analyze_team":
+        from .battle.coverage import analyze_team
+        names = arguments.get("team") or []
+        if not 1 <= len(names) <= 6:
+            return [TextContent(type="text", text="Error: team must have between 1 and 6 Pokemon")]
+        try:
+            team = await fetch_pokemon(names)
+        except ValueError as e:
+            return [TextContent(type="text", text=f"Error: {e}")]
+        result = analyze_team([(pokemon.name, pokemon.types) for pokemon in team])
+        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    
+    elif name == "damage_matrix":
+        from .battle.engine import BattlePokemon
+        from .battle.matrix import damage_matrix
+        attackers = [entry if isinstance(entry, dict) else {"name": entry} for entry in arguments.get("attackers") or []]
+        defender_names = arguments.get("defenders") or []
+        if not attackers or not defender_names:
+            return [TextContent(type="text", text="Error: attackers and defenders are required")]
+        if len(attackers) > 12 or len(defender_names) > 200:
+            return [TextContent(type="text", text="Error: at most 12 attackers and 200 defenders")]
+        
+        try:
+            species, defenders = await asyncio.gather(
+                fetch_pokemon([entry.get("name", "") for entry in attackers]), fetch_pokemon(defender_names))
+            members = [BattlePokemon(pokemon) for pokemon in species]
+            for member, entry in zip(members, attackers):
+                if entry.get("moves"):
+                    member.moves = await resolve_moves(entry["moves"][:4])
+                    member.pp = [move.pp for move in member.moves]
+                else:
+                    await member.initialize_moves()
+        except ValueError as e:
+            return [TextContent(type="text", text=f"Error: {e}")]
+        
+        result = await get_scheduler().run_cpu(damage_matrix, members, defenders)
+        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    
+    elif name == "optimize_team":
+        from .battle.optimizer import optimize_team
+        candidate_names = list(dict.fromkeys(str(n).lower() for n in arguments.get("candidates") or []))
+        opponent_names = arguments.get("opponents") or []
+        if not candidate_names or not 1 <= len(opponent_names) <= 24 or len(candidate_names) > MAX_OPTIMIZER_CANDIDATES:
+            return [TextContent(type="text", text=f"Error: give 1 to {MAX_OPTIMIZER_CANDIDATES} candidates and 1 to 24 opponents")]
+        team_size = int(arguments.get("team_size", 6))
+        if not 1 <= team_size <= 6:
+            return [TextContent(type="text", text="Error: team_size must be between 1 and 6")]
+        try:
+            candidates, opponents = await asyncio.gather(prepare_members(candidate_names), prepare_members(opponent_names))
+        except ValueError as e:
+            return [TextContent(type="text", text=f"Error: {e}")]
+        by_name = {member.name: member for member in candidates}  # IDs and names of one species collapse
+        candidates = list(by_name.values())
+        
+        result = await get_scheduler().run_cpu(
+            optimize_team, candidates, opponents,
+            team_size,
+            max(1, min(int(arguments.get("beam_width", 16)), 256)),
+            max(0.1, min(float(arguments.get("time_budget", 5)), 20.0)),
+            max(1, min(int(arguments.get("top", 3)), 10)))
+        
+        # Check the estimates: each returned team plays every party of up to six opponents on the worker pool
+        battles = max(0, min(int(arguments.get("battles", 100)), MAX_SERIES_BATTLES))
+        if battles:
+            parties = [opponents[i:i + 6] for i in range(0, len(opponents), 6)]
+            pool = get_simulation_pool()
+            seed = arguments.get("seed")
+            for entry in result["teams"]:
+                team = [by_name[name] for name in entry["team"]]
+                series = await asyncio.gather(*(pool.run_series(team, party, battles, seed) for party in parties))
+                wins = sum(s.summary()["wins"]["team1"] for s in series)
+                entry["simulated_win_rate"] = round(wins / (battles * len(parties)), 4)
+        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    
+    elif name == "simulate_series":
+        mode = arguments.get("mode")
+        battles = max(1, min(int(arguments.get("battles", 100)), MAX_SERIES_BATTLES))
+        seed = arguments.get("seed")
+        
+        if mode == "batch":
+            team_names = [arguments.get("team1") or [], arguments.get("team2") or []]
+            if not all(1 <= len(names) <= 6 for names in team_names):
+                return [TextContent(type="text", text="Error: team1 and team2 must each list between 1 and 6 Pokemon")]
+            try:
+                team1, team2 = await asyncio.gather(*(prepare_members(names) for names in team_names))
+            except ValueError as e:
+                return [TextContent(type="text", text=f"Error: {e}")]
+            names1, names2 = [m.name for m in team1], [m.name for m in team2]
+            
+            # Popular matchups are answered from recorded history instead of simulating again
+            store = get_battle_store()
+            if store is not None and seed is None and arguments.get("use_history", True):
+                history = await get_scheduler().run_cpu(
+                    store.matchup_summary, get_battle_engine().policy_name, names1, names2)
+                if history["battles"] >= battles:
+                    return [TextContent(type="text", text=json.dumps(
+                        {"mode": mode, "source": "history", "team1": names1, "team2": names2, **history}, indent=2))]
+            
+            result = await get_simulation_pool().run_series(team1, team2, battles, seed)
+            record_series("series", team1, team2, result, seed)
+            report = {"mode": mode, "source": "simulation", "team1": names1, "team2": names2, **result.summary()}
+        
+        elif mode == "tournament":
+            entrants = arguments.get("teams") or {}
+            if not 2 <= len(entrants) <= 16 or not all(1 <= len(names) <= 6 for names in entrants.values()):
+                return [TextContent(type="text", text="Error: teams must have 2 to 16 entries of 1 to 6 Pokemon each")]
+            try:
+                prepared = await asyncio.gather(*(prepare_members(names) for names in entrants.values()))
+            except ValueError as e:
+                return [TextContent(type="text", text=f"Error: {e}")]
+            teams = dict(zip(entrants, prepared))
+            standings = await get_simulation_pool().tournament(
+                teams, battles, seed, on_series=lambda a, b, result: record_series("series", teams[a], teams[b], result, seed))
+            report = {"mode": mode, "battles_per_matchup": battles, **standings}
+        
+        else:
+            return [TextContent(type="text", text="Error: mode must be 'batch' or 'tournament'")]
+        
+        return [TextContent(type="text", text=json.dumps(report, indent=2))]
+    
+    elif name == "battle_history":
+        store = get_battle_store()
+        if store is None:
+            return [TextContent(type="text", text="Error: battle history is disabled (BATTLE_STORE_ENABLED=false)")]
+        store.start()
+        scheduler = get_scheduler()
+        try:
+            if arguments.get("team1") and arguments.get("team2"):
+                result = {"matchup": await scheduler.run_cpu(store.matchup_summary, get_battle_engine().policy_name,
+                                                             arguments["team1"], arguments["team2"])}
+            else:
+                result = await scheduler.run_cpu(
+                    store.member_stats, arguments.get("species"), arguments.get("type"), arguments.get("group_by"),
+                    int(arguments.get("min_battles", 10)), int(arguments.get("limit", 20)))
+        except ValueError as e:
+            return [TextContent(type="text", text=f"Error: {e}")]
+        
+        return [TextContent(type="text", text=json.dumps({
+            "species": arguments.get("species"),
+            "type": arguments.get("type"),
+            **result
+        }, indent=2))]
+    
+    elif name == "cache_admin":
+        from .battle.moves import get_move_client
+        action = arguments.get("action", "stats")
+        which = arguments.get("cache", "all")
+        if which not in ("pokemon", "moves", "all"):
+            return [TextContent(type="text", text="Error: cache must be 'pokemon', 'moves' or 'all'")]
+        clients = {"pokemon": pokemon_client, "moves": get_move_client()}
+        selected = {key: client for key, client in clients.items() if which in (key, "all")}
+        names = arguments.get("names")
+        
+        if action == "stats":
+            result = {key: client.cache_stats() for key, client in selected.items()}
+        elif action == "invalidate":
+            result = {"invalidated": {key: client.invalidate(names) for key, client in selected.items()}}
+            if _resource_bodies is not None:
+                _resource_bodies.clear()  # Release bodies still holding the dropped entries
+        elif action == "evict":
+            if arguments.get("max_bytes") is None:
+                return [TextContent(type="text", text="Error: evict needs max_bytes")]
+            max_bytes = max(0, int(arguments["max_bytes"]))
+            result = {key: client.evict_to(max_bytes) for key, client in selected.items()}
+        elif action == "warm":
+            if not names:
+                return [TextContent(type="text", text="Error: warm needs names")]
+            if which == "moves":
+                moves = await asyncio.gather(*(clients["moves"].get_move_entry(n.lower().replace(" ", "-")) for n in names))
+                result = {"requested": len(names), "moves": sum(entry is not None for entry in moves)}
+            else:
+                from .prewarm import prewarm
+                result = await prewarm(pokemon_client, species=[str(n).lower() for n in names],
+                                       top_n=len(names), concurrency=config.prewarm_concurrency,
+                                       timeout=config.prewarm_timeout)
+        elif action == "build":
+            # Load or build the bulk data now instead of on first use; snapshots make later launches cheap
+            result = {}
+            if which in ("pokemon", "all"):
+                await start_bulk_load("evolution")
+                result["pokedex"] = len(await get_pokedex())
+                result["evolution_species"] = len(pokemon_client.evolution_graph)
+            if which in ("moves", "all"):
+                from .data.move_table import loaded_move_table
+                await start_bulk_load("moves")
+                result["moves"] = len(loaded_move_table())
+        else:
+            return [TextContent(type="text", text="Error: action must be stats, invalidate, evict, warm or build")]
+        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    
+    elif name == "profiling":
+        from .profiling import disable_profiling, hot_spots
+        action = arguments.get("action", "status")
+        if action == "start":
+            try:
+                start_profiling(arguments.get("sample_rate"), arguments.get("mode"))
+            except ValueError as e:
+                return [TextContent(type="text", text=f"Error: {e}")]
+        elif action == "stop":
+            disable_profiling()
+        elif action == "hot_spots":
+            result = await get_scheduler().run_cpu(hot_spots, profile_directory(), int(arguments.get("limit", 20)))
+            if not result:
+                return [TextContent(type="text", text="No profiles collected yet")]
+            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        elif action != "status":
+            return [TextContent(type="text", text=f"Error: unknown action '{action}'")]
+        
+        profiler = get_profiler()
+        status = profiler.status() if profiler is not None else {"enabled": False}
+        return [TextContent(type="text", text=json.dumps(status, indent=2))]
+    
+    elif name == "search_pokemon":
+        pokedex = await get_pokedex()
+        try:
+            results = pokedex.search(
+                query=arguments.get("query"),
+                mode=arguments.get("mode", "auto"),
+                types=arguments.get("types"),
+                filters=arguments.get("filters"),
+                limit=int(arguments.get("limit", 20))
+            )
+        except ValueError as e:
+            return [TextContent(type="text", text=f"Error: {e}")]
+        
+        return [TextContent(type="text", text=json.dumps({
+            "total_indexed": len(pokedex),
+            "count": len(results),
+            "results": results
+        }, indent=2))]
+    
+    elif name == "query_stats":
+        table = await get_stat_table()
+        operation = arguments.get("operation")
+        stat = (arguments.get("stat") or "").lower().replace("-", "_")
+        types = arguments.get("types")
+        filters = arguments.get("filters")
+        
+        try:
+            if operation in ("top", "bottom"):
+                result = {"results": table.rank(stat, int(arguments.get("n", 10)),
+                                                ascending=operation == "bottom",
+                                                types=types, filters=filters)}
+            elif operation == "percentile":
+                if not arguments.get("pokemon"):
+                    return [TextContent(type="text", text="Error: pokemon parameter is required for percentile")]
+                result = table.percentile(arguments["pokemon"], stat, types=types, filters=filters)
+            elif operation == "aggregate":
+                result = {"groups": table.aggregate(stat, arguments.get("group_by"), types=types, filters=filters)}
+            else:
+                return [TextContent(type="text", text="Error: operation must be one of top, bottom, percentile, aggregate")]
+        except ValueError as e:
+            return [TextContent(type="text", text=f"Error: {e}")]
+        
+        return [TextContent(type="text", text=json.dumps({
+            "operation": operation,
+            "stat": stat,
+            "population": len(table),
+            **result
+        }, indent=2))]
+    
     else:
-        return [TextContent(type="text", text=f"Unknown tool: {name}. Available tools: get_pokemon, simulate_battle")]
+        available = ", ".join(tool.name for tool in await list_tools())
+        return [TextContent(type="text", text=f"Unknown tool: {name}. Available tools: {available}")]
+
+async def shutdown():
+    """Release what the server holds open once the client disconnects"""
+    from .data.http import close_http_client
+    if _battle_store is not None:
+        # Write out the battles still queued before the process exits
+        await asyncio.to_thread(_battle_store.flush)
+        await asyncio.to_thread(_battle_store.close)
+    if _simulation_pool is not None:
+        _simulation_pool.shutdown()
+    if _scheduler is not None:
+        _scheduler.shutdown()
+    await close_http_client()
 
 async def main():
     """Main server entry point"""
     import sys
-    async with stdio_server() as (read_stream, write_stream):
-        # Print to stderr so it doesn't interfere with MCP JSON-RPC communication
-        print("🎮 Pokemon Battle MCP Server ready for connections", file=sys.stderr, flush=True)
-        print("📡 Listening on stdio for MCP client connections...", file=sys.stderr, flush=True)
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="pokemon-battle-server",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={}
+    from mcp.server import NotificationOptions
+    from mcp.server.models import InitializationOptions
+    from mcp.server.stdio import stdio_server
+    
+    if config.profiling_enabled:
+        start_profiling()
+    
+    # Every client session spawns its own server, so serve at once: the warm-up runs in the
+    # background, and the bulk Pokedex, evolution and move data wait for first use or cache_admin
+    if config.prewarm_enabled:
+        asyncio.ensure_future(warm_up()).add_done_callback(_report_background_error)
+    
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            # Print to stderr so it doesn't interfere with MCP JSON-RPC communication
+            print("🎮 Pokemon Battle MCP Server ready for connections", file=sys.stderr, flush=True)
+            print("📡 Listening on stdio for MCP client connections...", file=sys.stderr, flush=True)
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="pokemon-battle-server",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={}
+                    )
                 )
             )
-        )
+    finally:
+        await shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,332 @@
+"""
+Local stand-in for PokéAPI, for load tests and offline development
+
+Serves a small fixed Pokedex over the REST paths the server uses
+(/api/v2/pokemon, pokemon-species, evolution-chain, move, type), the
+GraphQL endpoint (/graphql) and sprite images, with a configurable delay
+per request to mimic the real API's latency.
+
+    python stub_pokeapi.py --port 8765 --latency 0.05 --jitter 0.02
+    POKEAPI_BASE_URL=http://127.0.0.1:8765/api/v2 GRAPHQL_URL=http://127.0.0.1:8765/graphql python run_server.py
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# name: (id, types, [hp, attack, defense, special-attack, special-defense, speed], chain id, evolves from)
+SPECIES = {
+    "bulbasaur": (1, ["grass", "poison"], [45, 49, 49, 65, 65, 45], 1, None),
+    "ivysaur": (2, ["grass", "poison"], [60, 62, 63, 80, 80, 60], 1, "bulbasaur"),
+    "venusaur": (3, ["grass", "poison"], [80, 82, 83, 100, 100, 80], 1, "ivysaur"),
+    "charmander": (4, ["fire"], [39, 52, 43, 60, 50, 65], 2, None),
+    "charmeleon": (5, ["fire"], [58, 64, 58, 80, 65, 80], 2, "charmander"),
+    "charizard": (6, ["fire", "flying"], [78, 84, 78, 109, 85, 100], 2, "charmeleon"),
+    "squirtle": (7, ["water"], [44, 48, 65, 50, 64, 43], 3, None),
+    "wartortle": (8, ["water"], [59, 63, 80, 65, 80, 58], 3, "squirtle"),
+    "blastoise": (9, ["water"], [79, 83, 100, 85, 105, 78], 3, "wartortle"),
+    "pikachu": (25, ["electric"], [35, 55, 40, 50, 50, 90], 10, "pichu"),
+    "raichu": (26, ["electric"], [60, 90, 55, 90, 80, 110], 10, "pikachu"),
+    "gengar": (94, ["ghost", "poison"], [60, 65, 60, 130, 75, 110], 40, None),
+    "eevee": (133, ["normal"], [55, 55, 50, 45, 65, 55], 67, None),
+    "vaporeon": (134, ["water"], [130, 65, 60, 110, 95, 65], 67, "eevee"),
+    "jolteon": (135, ["electric"], [65, 65, 60, 110, 95, 130], 67, "eevee"),
+    "flareon": (136, ["fire"], [65, 130, 60, 95, 110, 65], 67, "eevee"),
+    "snorlax": (143, ["normal"], [160, 110, 65, 65, 110, 30], 72, None),
+    "dragonite": (149, ["dragon", "flying"], [91, 134, 95, 100, 100, 80], 77, None),
+    "mewtwo": (150, ["psychic"], [106, 110, 90, 154, 90, 130], 78, None),
+    "pichu": (172, ["electric"], [20, 40, 15, 35, 35, 60], 10, None),
+    "garchomp": (445, ["dragon", "ground"], [108, 130, 95, 80, 85, 102], 222, None),
+    "lucario": (448, ["fighting", "steel"], [70, 110, 70, 115, 70, 90], 232, None),
+}
+BY_ID = {entry[0]: name for name, entry in SPECIES.items()}
+
+# name: (type, damage class, power, accuracy, pp, status effect, effect chance)
+MOVES = {
+    "tackle": ("normal", "physical", 40, 100, 35, None, 0),
+    "scratch": ("normal", "physical", 40, 100, 35, None, 0),
+    "growl": ("normal", "status", None, 100, 40, None, 0),
+    "body-slam": ("normal", "physical", 85, 100, 15, "paralyze", 30),
+    "hyper-beam": ("normal", "special", 150, 90, 5, None, 0),
+    "ember": ("fire", "special", 40, 100, 25, "burn", 10),
+    "flamethrower": ("fire", "special", 90, 100, 15, "burn", 10),
+    "fire-blast": ("fire", "special", 110, 85, 5, "burn", 10),
+    "water-gun": ("water", "special", 40, 100, 25, None, 0),
+    "surf": ("water", "special", 90, 100, 15, None, 0),
+    "hydro-pump": ("water", "special", 110, 80, 5, None, 0),
+    "vine-whip": ("grass", "physical", 45, 100, 25, None, 0),
+    "razor-leaf": ("grass", "physical", 55, 95, 25, None, 0),
+    "solar-beam": ("grass", "special", 120, 100, 10, None, 0),
+    "sludge-bomb": ("poison", "special", 90, 100, 10, "poison", 30),
+    "thunder-shock": ("electric", "special", 40, 100, 30, "paralyze", 10),
+    "thunderbolt": ("electric", "special", 90, 100, 15, "paralyze", 10),
+    "thunder": ("electric", "special", 110, 70, 10, "paralyze", 30),
+    "shadow-ball": ("ghost", "special", 80, 100, 15, None, 0),
+    "hypnosis": ("psychic", "status", None, 60, 20, "sleep", 0),
+    "psychic": ("psychic", "special", 90, 100, 10, None, 0),
+    "earthquake": ("ground", "physical", 100, 100, 10, None, 0),
+    "dragon-claw": ("dragon", "physical", 80, 100, 15, None, 0),
+    "outrage": ("dragon", "physical", 120, 100, 10, None, 0),
+    "wing-attack": ("flying", "physical", 60, 100, 35, None, 0),
+    "aura-sphere": ("fighting", "special", 80, None, 20, None, 0),
+    "close-combat": ("fighting", "physical", 120, 100, 5, None, 0),
+    "flash-cannon": ("steel", "special", 80, 100, 10, None, 0),
+    "ice-beam": ("ice", "special", 90, 100, 10, "freeze", 10),
+}
+TYPE_MOVES = {
+    "normal": ["body-slam", "hyper-beam"],
+    "fire": ["ember", "flamethrower", "fire-blast"],
+    "water": ["water-gun", "surf", "hydro-pump"],
+    "grass": ["vine-whip", "razor-leaf", "solar-beam"],
+    "poison": ["sludge-bomb"],
+    "electric": ["thunder-shock", "thunderbolt", "thunder"],
+    "ghost": ["shadow-ball", "hypnosis"],
+    "psychic": ["psychic"],
+    "ground": ["earthquake"],
+    "dragon": ["dragon-claw", "outrage"],
+    "flying": ["wing-attack"],
+    "fighting": ["aura-sphere", "close-combat"],
+    "steel": ["flash-cannon"],
+}
+STAT_NAMES = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
+
+class Stub:
+    """Response bodies of the fake API, with URLs pointing back at it"""
+
+    def __init__(self, base_url: str):
+        self.root = base_url.rstrip("/")
+        self.api = self.root + "/api/v2"
+
+    def learnset(self, types):
+        names = ["tackle", "growl", "scratch"]
+        for name in types:
+            names += TYPE_MOVES.get(name, [])
+        names += ["ice-beam", "earthquake"]
+        return [(name, 1 if i < 3 else 5 * i, "level-up" if i < 6 else "machine")
+                for i, name in enumerate(dict.fromkeys(names))]
+
+    def pokemon(self, name):
+        pid, types, stats, _, _ = SPECIES[name]
+        return {
+            "id": pid, "name": name, "height": 7, "weight": 69, "base_experience": 64,
+            "types": [{"slot": i + 1, "type": {"name": t, "url": f"{self.api}/type/{t}/"}} for i, t in enumerate(types)],
+            "stats": [{"base_stat": value, "effort": 0, "stat": {"name": stat}} for value, stat in zip(stats, STAT_NAMES)],
+            "abilities": [{"ability": {"name": "overgrow"}, "is_hidden": False}],
+            "moves": [{"move": {"name": move, "url": f"{self.api}/move/{move}/"},
+                       "version_group_details": [{"level_learned_at": level, "move_learn_method": {"name": method},
+                                                  "version_group": {"name": "scarlet-violet"}}]}
+                      for move, level, method in self.learnset(types)],
+            "sprites": {"front_default": f"{self.root}/sprites/{pid}.png"},
+            "species": {"name": name, "url": f"{self.api}/pokemon-species/{pid}/"},
+        }
+
+    def species(self, name):
+        pid, _, _, chain, parent = SPECIES[name]
+        return {
+            "id": pid, "name": name,
+            "genera": [{"genus": "Stub Pokemon", "language": {"name": "en"}}],
+            "habitat": {"name": "grassland"},
+            "evolution_chain": {"url": f"{self.api}/evolution-chain/{chain}/"},
+            "evolves_from_species": {"name": parent} if parent else None,
+        }
+
+    def chain_link(self, name):
+        parent = SPECIES[name][4]
+        return {
+            "species": {"name": name, "url": f"{self.api}/pokemon-species/{SPECIES[name][0]}/"},
+            "is_baby": name == "pichu",
+            "evolution_details": [] if parent is None else [
+                {"trigger": {"name": "level-up"}, "min_level": 16, "item": None, "held_item": None}],
+            "evolves_to": [self.chain_link(child) for child, entry in SPECIES.items() if entry[4] == name],
+        }
+
+    def chain(self, chain_id):
+        roots = [name for name, entry in SPECIES.items() if entry[3] == chain_id and entry[4] is None]
+        return {"id": chain_id, "chain": self.chain_link(roots[0])} if roots else None
+
+    def move(self, name):
+        move_type, category, power, accuracy, pp, effect, chance = MOVES[name]
+        return {
+            "id": list(MOVES).index(name) + 1, "name": name, "type": {"name": move_type},
+            "damage_class": {"name": category}, "power": power, "accuracy": accuracy, "pp": pp, "priority": 0,
+            "effect_chance": chance or None,
+            "effect_entries": [{"effect": f"Has a chance to {effect} the target." if effect else "Inflicts regular damage.",
+                                "language": {"name": "en"}}],
+            "flavor_text_entries": [{"flavor_text": f"A stub {name} move.", "language": {"name": "en"}}],
+        }
+
+    def listing(self, kind):
+        if kind == "pokemon":
+            results = [{"name": name, "url": f"{self.api}/pokemon/{entry[0]}/"} for name, entry in SPECIES.items()]
+        elif kind == "move":
+            results = [{"name": name, "url": f"{self.api}/move/{name}/"} for name in MOVES]
+        elif kind == "evolution-chain":
+            results = [{"url": f"{self.api}/evolution-chain/{i}/"} for i in sorted({e[3] for e in SPECIES.values()})]
+        elif kind == "type":
+            results = [{"name": t, "url": f"{self.api}/type/{t}/"} for t in sorted({t for e in SPECIES.values() for t in e[1]})]
+        else:
+            return None
+        return {"count": len(results), "next": None, "results": results}
+
+    def lookup(self, kind, key):
+        if kind in ("pokemon", "pokemon-species"):
+            name = BY_ID.get(int(key)) if key.isdigit() else key
+            if name not in SPECIES:
+                return None
+            return self.pokemon(name) if kind == "pokemon" else self.species(name)
+        if kind == "move":
+            return self.move(key) if key in MOVES else None
+        if kind == "evolution-chain":
+            return self.chain(int(key)) if key.isdigit() else None
+        if kind == "type":
+            return {"name": key, "pokemon": [{"pokemon": {"name": name, "url": f"{self.api}/pokemon/{entry[0]}/"}}
+                                             for name, entry in SPECIES.items() if key in entry[1]]}
+        return None
+
+    # GraphQL rows, in the shape of PokéAPI's Hasura schema
+    def graphql_move(self, name):
+        move_type, category, power, accuracy, pp, effect, chance = MOVES[name]
+        return {
+            "name": name, "power": power, "accuracy": accuracy, "pp": pp, "priority": 0,
+            "move_effect_chance": chance or None,
+            "pokemon_v2_type": {"name": move_type},
+            "pokemon_v2_movedamageclass": {"name": category},
+            "pokemon_v2_moveeffect": {"pokemon_v2_moveeffecteffecttexts": [
+                {"effect": f"Has a chance to {effect} the target." if effect else "Inflicts regular damage."}]},
+            "pokemon_v2_moveflavortexts": [{"flavor_text": f"A stub {name} move."}],
+        }
+
+    def graphql_species(self, name):
+        pid, _, _, chain, _ = SPECIES[name]
+        members = [member for member, entry in SPECIES.items() if entry[3] == chain]
+        return {
+            "id": pid, "name": name,
+            "pokemon_v2_pokemonspeciesgeneras": [{"genus": "Stub Pokemon"}],
+            "pokemon_v2_pokemonhabitat": {"name": "grassland"},
+            "pokemon_v2_evolutionchain": {"id": chain, "pokemon_v2_pokemonspecies": [{
+                "name": member, "id": SPECIES[member][0], "is_baby": member == "pichu",
+                "evolves_from_species_id": SPECIES[SPECIES[member][4]][0] if SPECIES[member][4] else None,
+                "pokemon_v2_pokemonevolutions": [{
+                    "min_level": 16, "pokemon_v2_evolutiontrigger": {"name": "level-up"},
+                    "pokemon_v2_item": None, "pokemonV2ItemByHeldItemId": None}] if SPECIES[member][4] else [],
+            } for member in members]},
+        }
+
+    def graphql_pokemon(self, name):
+        pid, types, stats, _, _ = SPECIES[name]
+        return {
+            "id": pid, "name": name, "height": 7, "weight": 69, "base_experience": 64,
+            "pokemon_v2_pokemontypes": [{"pokemon_v2_type": {"name": t}} for t in types],
+            "pokemon_v2_pokemonstats": [{"base_stat": value, "pokemon_v2_stat": {"name": stat}}
+                                        for value, stat in zip(stats, STAT_NAMES)],
+            "pokemon_v2_pokemonabilities": [{"pokemon_v2_ability": {"name": "overgrow"}}],
+            "pokemon_v2_pokemonsprites": [{"sprites": json.dumps({"front_default": f"{self.root}/sprites/{pid}.png"})}],
+            "pokemon_v2_pokemonmoves": [{"level": level, "pokemon_v2_movelearnmethod": {"name": method},
+                                         "pokemon_v2_move": self.graphql_move(move)}
+                                        for move, level, method in self.learnset(types)],
+            "pokemon_v2_pokemonspecy": self.graphql_species(name),
+        }
+
+    def graphql(self, query, variables):
+        if "pokemon: pokemon_v2_pokemon(" in query:
+            names = [n for n in variables.get("names") or [] if n in SPECIES]
+            names += [BY_ID[i] for i in variables.get("ids") or [] if i in BY_ID]
+            return {"pokemon": [self.graphql_pokemon(name) for name in dict.fromkeys(names)]}
+        if "species: pokemon_v2_pokemonspecies(" in query:
+            return {"species": [self.graphql_species(BY_ID[i]) for i in variables.get("ids") or [] if i in BY_ID]}
+        if "moves: pokemon_v2_move(" in query:
+            return {"moves": [self.graphql_move(n) for n in variables.get("names") or [] if n in MOVES]}
+        return None
+
+def make_handler(stub: Stub, latency: float, jitter: float):
+    counts = {"rest": 0, "graphql": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+        def log_message(self, *args):
+            pass
+
+        def delay(self, kind: str):
+            with lock:
+                counts[kind] += 1
+            if latency or jitter:
+                time.sleep(max(0.0, latency + random.uniform(-jitter, jitter)))
+
+        def send(self, code: int, body: bytes, content_type: str = "application/json", headers=None):
+            self.send_response(code)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path == "/stats":
+                with lock:
+                    return self.send(200, json.dumps(counts).encode())
+            self.delay("rest")
+            if path.startswith("/sprites/"):
+                return self.send(200, b"\x89PNG\r\n\x1a\n" + path.encode() * 8, "image/png")
+            match = re.match(r"/api/v2/([a-z-]+)/?([^/]*)/?$", path)
+            data = None
+            if match:
+                kind, key = match.groups()
+                data = stub.lookup(kind, key.lower()) if key else stub.listing(kind)
+            if data is None:
+                return self.send(404, b"Not Found", "text/plain")
+            body = json.dumps(data).encode()
+            etag = '"%08x"' % zlib.crc32(body)
+            if self.headers.get("If-None-Match") == etag:
+                return self.send(304, b"", headers={"ETag": etag})
+            self.send(200, body, headers={"ETag": etag, "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self.path.split("?")[0] != "/graphql":
+                return self.send(404, b"Not Found", "text/plain")
+            self.delay("graphql")
+            try:
+                request = json.loads(body)
+                data = stub.graphql(request["query"], request.get("variables") or {})
+            except (ValueError, KeyError):
+                return self.send(400, b'{"errors": [{"message": "bad request"}]}')
+            result = {"data": data} if data is not None else {"errors": [{"message": "unsupported query"}]}
+            self.send(200, json.dumps(result).encode())
+
+    return Handler
+
+def serve(host: str = "127.0.0.1", port: int = 8765, latency: float = 0.0, jitter: float = 0.0) -> ThreadingHTTPServer:
+    """Create the stub server; the caller runs serve_forever(). Port 0 picks a free port."""
+    server = ThreadingHTTPServer((host, port), None)
+    server.RequestHandlerClass = make_handler(Stub(f"http://{host}:{server.server_address[1]}"), latency, jitter)
+    server.daemon_threads = True
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Local PokéAPI stub with configurable latency")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds around the latency")
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, args.latency, args.jitter)
+    host, port = server.server_address[:2]
+    print(f"PokéAPI stub on http://{host}:{port}/api/v2 (GraphQL: /graphql, counters: /stats), "
+          f"latency {args.latency}s ± {args.jitter}s", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -83,14 +83,54 @@ def test_imports():
         import traceback
         traceback.print_exc()
 
+def test_import_time():
+    """Check that importing the server stays within the startup budget"""
+    print("\nTesting import time...")
+    import os
+    import subprocess
+    
+    budget_ms = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pokemon_mcp.server"],
+        cwd=str(src_path), capture_output=True, text=True
+    )
+    
+    # Each line is "import time: self | cumulative | module"; keep the cumulative column
+    timings = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            timings.append((int(parts[1]), parts[2].strip()))
+    
+    total_ms = next((us for us, module in reversed(timings) if module == "pokemon_mcp.server"), 0) / 1000
+    if result.returncode == 0 and total_ms <= budget_ms:
+        print(f"✅ pokemon_mcp.server imports in {total_ms:.0f}ms (budget {budget_ms:.0f}ms)")
+    else:
+        print(f"❌ pokemon_mcp.server imports in {total_ms:.0f}ms (budget {budget_ms:.0f}ms)")
+        print(result.stderr[-500:] if result.returncode else "")
+    
+    own = sorted((t for t in timings if t[1].lstrip().startswith("pokemon_mcp")), reverse=True)
+    for us, module in own[:5]:
+        print(f"   {us / 1000:7.1f}ms  {module}")
+    
+    assert result.returncode == 0, f"importing pokemon_mcp.server failed: {result.stderr[-500:]}"
+    assert total_ms <= budget_ms, f"pokemon_mcp.server imports in {total_ms:.0f}ms, over the {budget_ms:.0f}ms budget"
+
 async def main():
     """Run all tests"""
     print("=== Pokemon MCP Server Component Tests ===\n")
     
     test_imports()
+    try:
+        test_import_time()
+    except AssertionError as e:
+        print(f"❌ {e}")
     await test_pokemon_client()
     await test_battle_engine()
     
+    from pokemon_mcp.data.http import close_http_client
+    await close_http_client()
+    
     print("\n=== Tests completed ===")
 
 if __name__ == "__main__":
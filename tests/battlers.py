@@ -0,0 +1,29 @@
+"""Offline battlers for the battle tests: fixed stats and moves, no API calls"""
+from pokemon_mcp.battle.engine import BattlePokemon
+from pokemon_mcp.battle.moves import Move, MoveCategory, StatusEffect
+from pokemon_mcp.data.pokemon_client import Pokemon, PokemonStats
+
+THUNDERBOLT = Move("thunderbolt", "electric", MoveCategory.SPECIAL, 90, 100, 15, StatusEffect.PARALYSIS, 0.1)
+TACKLE = Move("tackle", "normal", MoveCategory.PHYSICAL, 40, 100, 35)
+EMBER = Move("ember", "fire", MoveCategory.SPECIAL, 40, 100, 25, StatusEffect.BURN, 0.1)
+WATER_GUN = Move("water-gun", "water", MoveCategory.SPECIAL, 40, 100, 25)
+VINE_WHIP = Move("vine-whip", "grass", MoveCategory.PHYSICAL, 45, 100, 25)
+SLEEP_POWDER = Move("sleep-powder", "grass", MoveCategory.STATUS, 0, 75, 15, StatusEffect.SLEEP)
+
+SPECIES = {
+    "pikachu": (25, ["electric"], (35, 55, 40, 50, 50, 90), [THUNDERBOLT, TACKLE]),
+    "charmander": (4, ["fire"], (39, 52, 43, 60, 50, 65), [EMBER, TACKLE]),
+    "squirtle": (7, ["water"], (44, 48, 65, 50, 64, 43), [WATER_GUN, TACKLE]),
+    "bulbasaur": (1, ["grass", "poison"], (45, 49, 49, 65, 65, 45), [VINE_WHIP, SLEEP_POWDER, TACKLE]),
+    "eevee": (133, ["normal"], (55, 55, 50, 45, 65, 55), [TACKLE]),
+}
+
+def member(name: str) -> BattlePokemon:
+    pid, types, stats, moves = SPECIES[name]
+    battler = BattlePokemon(Pokemon(pid, name, list(types), PokemonStats(*stats), [], [m.name for m in moves]))
+    battler.moves = list(moves)
+    battler.pp = [move.pp for move in moves]
+    return battler
+
+def team(*names: str):
+    return [member(name) for name in names]
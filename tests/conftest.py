@@ -0,0 +1,18 @@
+import sys
+import threading
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+@pytest.fixture
+def stub_api():
+    """stub_pokeapi.py on a free port, as (base URL of the REST API, module)"""
+    import stub_pokeapi
+    server = stub_pokeapi.serve(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/v2", stub_pokeapi
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,54 @@
+import pytest
+from pokemon_mcp.data.battle_store import BattleStore
+
+PIKACHU = ("pikachu", ["electric"], 95)
+SQUIRTLE = ("squirtle", ["water"], 104)
+BULBASAUR = ("bulbasaur", ["grass", "poison"], 105)
+
+@pytest.fixture
+def store(tmp_path):
+    store = BattleStore(str(tmp_path / "history" / "battles.sqlite3"), flush_interval=0.05)
+    yield store
+    store.close()
+
+def test_matchup_history(store):
+    store.record("1v1", "heuristic", [PIKACHU], [SQUIRTLE], "team1", 4, [20, 0])
+    store.record_series("1v1", "heuristic", [PIKACHU], [SQUIRTLE],
+                        [(1, 6, (0, 30)), (0, 5, (10, 0)), (2, 50, (5, 5))], seed=3)
+    store.record("1v1", "greedy", [PIKACHU], [SQUIRTLE], "team2", 3, [0, 50])
+    assert store.flush()
+    summary = store.matchup_summary("heuristic", ["Pikachu"], ["Squirtle"])
+    assert summary["battles"] == 4
+    assert summary["wins"] == {"team1": 2, "team2": 1, "Draw": 1}
+    assert summary["win_rate"]["team1"] == 0.5 and summary["average_turns"] == 16.25
+    # Order matters: the reverse matchup has no history
+    assert store.matchup_summary("heuristic", ["squirtle"], ["pikachu"])["battles"] == 0
+
+def test_member_stats(store):
+    store.record("team", "heuristic", [PIKACHU, BULBASAUR], [SQUIRTLE], "team1", 9, [0, 50, 0])
+    store.record("team", "heuristic", [SQUIRTLE], [BULBASAUR], "team2", 7, [0, 105])
+    assert store.flush()
+    bulbasaur = store.member_stats(species="Bulbasaur")["all"]
+    assert bulbasaur["appearances"] == 2 and bulbasaur["wins"] == 2 and bulbasaur["fainted"] == 0
+    assert bulbasaur["average_hp_left"] == round((50 / 105 + 1) / 2, 4)
+    assert store.member_stats(type_name="poison")["all"]["appearances"] == 2
+    groups = store.member_stats(group_by="species")["groups"]
+    assert [g["species"] for g in groups] == ["bulbasaur", "pikachu", "squirtle"]
+    assert groups[2]["win_rate"] == 0.0 and groups[2]["fainted"] == 2
+    assert store.member_stats(group_by="species", min_battles=2)["groups"][0]["species"] == "bulbasaur"
+    with pytest.raises(ValueError):
+        store.member_stats(group_by="type")
+
+def test_history_survives_a_restart(tmp_path):
+    path = str(tmp_path / "battles.sqlite3")
+    first = BattleStore(path, flush_interval=0.05)
+    first.record("1v1", "heuristic", [PIKACHU], [SQUIRTLE], "Draw", 50, [1, 1])
+    first.close()  # Writes what is still queued
+    second = BattleStore(path, flush_interval=0.05)
+    try:
+        second.record("1v1", "heuristic", [PIKACHU], [SQUIRTLE], "team1", 2, [95, 0])
+        assert second.flush()
+        assert second.matchup_summary("heuristic", ["pikachu"], ["squirtle"])["wins"] == \
+               {"team1": 1, "team2": 0, "Draw": 1}
+    finally:
+        second.close()
@@ -0,0 +1,67 @@
+import asyncio
+import json
+from urllib.request import urlopen
+from pokemon_mcp.config import ServerConfig
+from pokemon_mcp.data.cache import TTLCache
+from pokemon_mcp.data.http import close_http_client
+from pokemon_mcp.data.pokemon_client import PokemonClient
+
+def rest_requests(base_url: str) -> int:
+    with urlopen(base_url.replace("/api/v2", "/stats")) as response:
+        return json.load(response)["rest"]
+
+def test_stale_while_revalidate(stub_api):
+    base_url, stub = stub_api
+
+    async def scenario():
+        client = PokemonClient(ServerConfig(pokeapi_base_url=base_url, cache_duration=60))
+        cache = client._pokemon_cache
+        try:
+            # Fresh: the second lookup is served from memory
+            first = await client.get_pokemon("pikachu")
+            requests = rest_requests(base_url)
+            assert await client.get_pokemon("pikachu") is first
+            assert rest_requests(base_url) == requests
+            entry = cache.peek("pikachu")
+            assert entry.etag and entry.version == 1
+
+            # Stale, unchanged upstream: served at once, then a 304 renews the entry in place
+            entry.fetched_at -= 120
+            assert await client.get_pokemon("pikachu") is first
+            await cache._revalidating["pikachu"]
+            assert cache.peek("pikachu") is entry and entry.version == 1
+            assert not cache.is_stale(entry)
+            assert rest_requests(base_url) == requests + 1
+
+            # Stale, changed upstream: the stale copy is served, then a 200 installs a new version
+            stub.SPECIES["pikachu"] = stub.SPECIES["pikachu"][:2] + ([40, 55, 40, 50, 50, 90],) + stub.SPECIES["pikachu"][3:]
+            entry.fetched_at -= 120
+            assert await client.get_pokemon("pikachu") is first
+            await cache._revalidating["pikachu"]
+            refreshed = cache.peek("pikachu")
+            assert refreshed.version == 2 and refreshed.value.stats.hp == 40
+            assert (await client.get_pokemon("pikachu")).stats.hp == 40
+        finally:
+            stub.SPECIES["pikachu"] = (25, ["electric"], [35, 55, 40, 50, 50, 90], 10, "pichu")
+            await close_http_client()
+
+    asyncio.run(scenario())
+
+def test_unchanged_200_keeps_version():
+    async def scenario():
+        cache = TTLCache(ttl=60)
+        entry = cache.set("surf", {"power": 90}, etag='"a"')
+        entry.fetched_at -= 120
+
+        async def fetch(headers):
+            return 200, {"power": 90}, '"b"', None  # New validator, same content
+
+        cache.revalidate("surf", fetch)
+        await cache._revalidating["surf"]
+        assert cache.peek("surf") is entry
+        assert entry.version == 1 and entry.etag == '"b"' and not cache.is_stale(entry)
+
+        assert cache.set("surf", {"power": 95}).version == 2
+        assert cache.set("surf", {"power": 95}).version == 2
+
+    asyncio.run(scenario())
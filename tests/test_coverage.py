@@ -0,0 +1,42 @@
+import random
+from pokemon_mcp.battle.coverage import analyze_team, defense, type_mask, type_names
+from pokemon_mcp.battle.mechanics import TYPE_NAMES, get_type_effectiveness
+
+def test_type_mask_round_trip():
+    assert type_names(type_mask(["water", "ground", "unknown"])) == [t for t in TYPE_NAMES if t in ("water", "ground")]
+    assert type_mask([]) == 0
+
+def test_defense_matches_type_chart():
+    random.seed(11)
+    combos = [[t] for t in TYPE_NAMES] + [random.sample(TYPE_NAMES, 2) for _ in range(100)]
+    for types in combos:
+        d = defense(types)
+        for attacking in TYPE_NAMES:
+            multiplier = get_type_effectiveness(attacking, types)
+            assert (attacking in type_names(d.immune)) == (multiplier == 0), (types, attacking)
+            assert (attacking in type_names(d.weak)) == (multiplier >= 2), (types, attacking)
+            assert (attacking in type_names(d.double_weak)) == (multiplier == 4), (types, attacking)
+            assert (attacking in type_names(d.resist)) == (0 < multiplier < 1), (types, attacking)
+            assert (attacking in type_names(d.double_resist)) == (multiplier == 0.25), (types, attacking)
+
+def test_analyze_team():
+    team = [("charizard", ["fire", "flying"]), ("blastoise", ["water"]), ("venusaur", ["grass", "poison"])]
+    result = analyze_team(team)
+    assert result["members"][0]["immune_to"] == ["ground"]
+    assert "rock" in result["members"][0]["weak_to"]
+    # Same-type offense: fire, flying, water, grass and poison
+    for hit in ("grass", "bug", "steel", "ice", "fire", "rock", "ground", "fighting", "water", "fairy"):
+        assert hit in result["super_effective_against"]
+    assert set(result["coverage_holes"]) == set(TYPE_NAMES) - set(result["super_effective_against"])
+    assert result["shared_weaknesses"] == {"electric": 2}
+    assert result["resistance_score"] == sum(result["net_resistance"].values())
+
+def test_net_resistance_matches_type_chart():
+    random.seed(5)
+    points = {4: -2, 2: -1, 1: 0, 0.5: 1, 0.25: 2, 0: 2}
+    for _ in range(20):
+        team = [(str(i), random.sample(TYPE_NAMES, random.randint(1, 2))) for i in range(6)]
+        result = analyze_team(team)
+        for attacking in TYPE_NAMES:
+            expected = sum(points[get_type_effectiveness(attacking, types)] for _, types in team)
+            assert result["net_resistance"][attacking] == expected
@@ -0,0 +1,54 @@
+import asyncio
+import json
+from urllib.request import urlopen
+from pokemon_mcp.config import ServerConfig
+from pokemon_mcp.data.evolution import EvolutionGraph, load_evolution_graph, load_snapshot
+from pokemon_mcp.data.http import close_http_client
+from pokemon_mcp.data.pokemon_client import PokemonClient
+from stub_pokeapi import Stub
+
+def rest_requests(base_url: str) -> int:
+    with urlopen(base_url.replace("/api/v2", "/stats")) as response:
+        return json.load(response)["rest"]
+
+def test_branching_chain():
+    graph = EvolutionGraph()
+    chain = graph.add_api_chain(Stub("http://127.0.0.1:1").chain(67))
+    assert graph.get("Jolteon") is chain and len(graph) == 4
+    assert chain.root == "eevee" and chain.is_branching and chain.depth() == 2
+    assert graph.evolves_into("eevee") == ["vaporeon", "jolteon", "flareon"]
+    assert graph.evolves_from("flareon") == "eevee" and graph.species_name(135) == "jolteon"
+    described = graph.describe("vaporeon")
+    assert described["pre_evolutions"] == ["eevee"] and described["total_stages"] == 2
+    assert [node["name"] for node in described["evolution_tree"]["evolves_to"]] == ["vaporeon", "jolteon", "flareon"]
+
+def test_bulk_load_skips_failed_chains(stub_api, tmp_path, monkeypatch):
+    base_url, stub = stub_api
+    original = stub.Stub.chain
+    monkeypatch.setattr(stub.Stub, "chain", lambda self, chain_id: None if chain_id == 2 else original(self, chain_id))
+
+    async def scenario():
+        client = PokemonClient(ServerConfig(pokeapi_base_url=base_url))
+        try:
+            graph = await load_evolution_graph(client, str(tmp_path))
+            assert "pikachu" in graph and "charizard" not in graph
+            assert graph.describe("raichu")["pre_evolutions"] == ["pikachu", "pichu"]
+
+            # The chain is resolved from the graph by species ID, without a species request
+            requests = rest_requests(base_url)
+            pikachu = await client.get_pokemon("pikachu")
+            requests += 1
+            result = await client.get_evolution_chain(pikachu.species_url)
+            assert result["species_name"] == "pikachu" and result["evolves_into"] == ["raichu"]
+            assert rest_requests(base_url) == requests
+
+            # A species missing from the graph falls back to the API
+            charmander = await client.get_pokemon("charmander")
+            assert (await client.get_evolution_chain(charmander.species_url))["error"]
+        finally:
+            await close_http_client()
+
+    asyncio.run(scenario())
+    reloaded = EvolutionGraph()
+    assert load_snapshot(reloaded, str(tmp_path))
+    assert reloaded.species_name(172) == "pichu" and reloaded.get("raichu").to_record()[0] == 10
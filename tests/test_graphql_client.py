@@ -0,0 +1,69 @@
+import asyncio
+import json
+from urllib.request import urlopen
+from pokemon_mcp.battle.moves import MoveClient
+from pokemon_mcp.config import ServerConfig
+from pokemon_mcp.data.graphql_client import Batcher, GraphQLMoveClient, GraphQLPokemonClient
+from pokemon_mcp.data.http import close_http_client
+from pokemon_mcp.data.pokemon_client import PokemonClient
+
+def requests(base_url: str) -> dict:
+    with urlopen(base_url.replace("/api/v2", "/stats")) as response:
+        return json.load(response)
+
+def test_batcher_combines_lookups():
+    batches = []
+
+    async def fetch(keys):
+        batches.append(sorted(keys))
+        if "boom" in keys:
+            raise RuntimeError("upstream failed")
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    async def scenario():
+        batcher = Batcher(fetch, window=0.01, max_size=3)
+        first = await asyncio.gather(*(batcher.load(key) for key in ("a", "b", "a", "missing")))
+        second = await asyncio.gather(batcher.load("c"), batcher.load("boom"), return_exceptions=True)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == ["A", "B", "A", None]
+    # The third distinct key fills the batch; the rest wait for the window
+    assert batches == [["a", "b", "missing"], ["boom", "c"]]
+    assert all(isinstance(result, RuntimeError) for result in second)
+
+def test_graphql_matches_rest(stub_api):
+    base_url, stub = stub_api
+    graphql_url = base_url.replace("/api/v2", "/graphql")
+    names = ["pikachu", "charizard", "143", "eevee"]
+
+    async def scenario():
+        config = ServerConfig(pokeapi_base_url=base_url, graphql_url=graphql_url, graphql_batch_window=0.02)
+        moves = GraphQLMoveClient(config)
+        graphql = GraphQLPokemonClient(config, move_client=moves)
+        rest = PokemonClient(config)
+        try:
+            before = requests(base_url)["graphql"]
+            fetched = await asyncio.gather(*(graphql.get_pokemon(name) for name in names))
+            assert requests(base_url)["graphql"] == before + 1  # One batched query
+            expected = [await rest.get_pokemon(name) for name in names]
+            for got, want in zip(fetched, expected):
+                assert (got.id, got.name, got.types, got.stats, got.abilities) == \
+                       (want.id, want.name, want.types, want.stats, want.abilities)
+                assert got.species_url == want.species_url and got.learnset == want.learnset
+
+            # The evolution chain and moves came with the Pokemon
+            before = requests(base_url)
+            evolution = await graphql.get_evolution_chain(fetched[3].species_url)
+            assert evolution["species_name"] == "eevee" and len(evolution["evolves_into"]) == 3
+            assert evolution["genus"] == "Stub Pokemon" and evolution["habitat"] == "grassland"
+            thunderbolt = await moves.get_move("thunderbolt")
+            assert requests(base_url) == before
+            rest_thunderbolt = await MoveClient(config).get_move("thunderbolt")
+            assert (thunderbolt.power, thunderbolt.accuracy, thunderbolt.status_effect) == \
+                   (rest_thunderbolt.power, rest_thunderbolt.accuracy, rest_thunderbolt.status_effect)
+            assert await graphql.get_pokemon("missingno") is None
+        finally:
+            await close_http_client()
+
+    asyncio.run(scenario())
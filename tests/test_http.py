@@ -0,0 +1,50 @@
+import asyncio
+from pokemon_mcp.config import ServerConfig
+from pokemon_mcp.data import http
+from pokemon_mcp.data.http import close_http_client, get_http_client, prewarm_connections
+
+def test_one_shared_client():
+    async def scenario():
+        first = get_http_client(ServerConfig())
+        assert get_http_client() is first
+        await close_http_client()
+        second = get_http_client(ServerConfig())
+        await close_http_client()
+        await close_http_client()  # Closing twice is harmless
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first is not second and first.is_closed and second.is_closed
+
+def test_prewarm_fills_the_pool(stub_api, monkeypatch):
+    base_url, stub = stub_api
+    monkeypatch.setattr(http, "_http2", False)  # Pool HTTP/1.1 connections even where h2 is installed
+    config = ServerConfig(pokeapi_base_url=base_url, http_prewarm_connections=3, http_max_keepalive=10)
+
+    async def scenario():
+        try:
+            summary = await prewarm_connections(config)
+            pool = get_http_client()._transport._pool
+            idle = len(pool.connections)
+            # Requests made afterwards reuse the warm connections
+            await asyncio.gather(*(get_http_client().get(f"{base_url}/pokemon/{i}") for i in (1, 4, 7)))
+            return summary, idle, len(pool.connections)
+        finally:
+            await close_http_client()
+
+    summary, idle, after = asyncio.run(scenario())
+    assert summary["hosts"] == 1 and summary["connections"] == 3
+    assert idle == 3 and after == 3
+
+def test_unreachable_host_does_not_raise(monkeypatch):
+    monkeypatch.setattr(http, "_http2", False)
+    config = ServerConfig(pokeapi_base_url="http://127.0.0.1:9/api/v2", http_prewarm_connections=2,
+                          request_timeout=2.0)
+
+    async def scenario():
+        try:
+            return await prewarm_connections(config)
+        finally:
+            await close_http_client()
+
+    assert asyncio.run(scenario())["connections"] == 2
@@ -0,0 +1,90 @@
+import math
+import numpy as np
+from pokemon_mcp.battle.engine import BattleEngine, BattlePokemon
+from pokemon_mcp.battle.matrix import CRIT_CHANCE, CRIT_MULTIPLIER, ROLLS, damage_arrays, damage_matrix, two_hit_chance
+from pokemon_mcp.battle.moves import Move, MoveCategory
+from pokemon_mcp.data.pokemon_client import Pokemon, PokemonStats
+
+def member(name, types, stats, moves):
+    battler = BattlePokemon(Pokemon(0, name, types, PokemonStats(*stats), [], []))
+    battler.moves = moves
+    battler.pp = [move.pp for move in moves]
+    return battler
+
+THUNDERBOLT = Move("thunderbolt", "electric", MoveCategory.SPECIAL, 90, 100, 15)
+SURF = Move("surf", "water", MoveCategory.SPECIAL, 90, 100, 15)
+QUICK_ATTACK = Move("quick-attack", "normal", MoveCategory.PHYSICAL, 40, 100, 30)
+HYDRO_PUMP = Move("hydro-pump", "water", MoveCategory.SPECIAL, 110, 80, 5)
+EARTHQUAKE = Move("earthquake", "ground", MoveCategory.PHYSICAL, 100, 100, 10)
+GROWL = Move("growl", "normal", MoveCategory.STATUS, 0, 100, 40)
+
+def roster():
+    return [
+        member("pikachu", ["electric"], (35, 55, 40, 50, 50, 90), [THUNDERBOLT, SURF, QUICK_ATTACK, GROWL]),
+        member("blastoise", ["water"], (79, 83, 100, 85, 105, 78), [HYDRO_PUMP, EARTHQUAKE]),
+        member("onix", ["rock", "ground"], (35, 45, 160, 30, 45, 70), [EARTHQUAKE]),
+        member("gyarados", ["water", "flying"], (95, 125, 79, 60, 100, 81), [HYDRO_PUMP, EARTHQUAKE]),
+    ]
+
+def reference_hits(engine, attacker, defender, move):
+    """Every (damage, chance) of one use, from the engine's own base damage"""
+    if move.power == 0:
+        return [(0.0, 1.0)]
+    base, _ = engine.base_damage(attacker, defender, move)
+    outcomes = [(0.0, 1 - move.accuracy / 100)]
+    for multiplier, chance in ((1.0, 1 - CRIT_CHANCE), (CRIT_MULTIPLIER, CRIT_CHANCE)):
+        for roll in ROLLS:
+            damage = max(1, min(math.floor(base * multiplier * roll), defender.max_hp))
+            outcomes.append((damage, move.accuracy / 100 * chance / len(ROLLS)))
+    return outcomes
+
+def test_damage_arrays_match_engine_formula():
+    engine = BattleEngine()
+    members = roster()
+    arrays = damage_arrays(members, [m.pokemon for m in members])
+    row = 0
+    for attacker in members:
+        for move in attacker.moves:
+            for d, defender in enumerate(members):
+                outcomes = reference_hits(engine, attacker, defender, move)
+                hp = defender.max_hp
+                expected = sum(damage * chance for damage, chance in outcomes)
+                ohko = sum(chance for damage, chance in outcomes if damage >= hp)
+                two_hko = sum(c1 * c2 for d1, c1 in outcomes for d2, c2 in outcomes if d1 + d2 >= hp)
+                assert math.isclose(arrays.expected[row, d], expected, rel_tol=1e-9, abs_tol=1e-9)
+                assert math.isclose(arrays.ohko[row, d], ohko, abs_tol=1e-9)
+                assert math.isclose(arrays.two_hko[row, d], two_hko, abs_tol=1e-9)
+            row += 1
+    assert arrays.ohko.max() <= 1 and (arrays.ohko <= arrays.two_hko + 1e-12).all()
+
+def test_immune_defender_takes_minimum_damage():
+    members = roster()
+    arrays = damage_arrays(members[:1], [members[2].pokemon])  # Thunderbolt into a ground type
+    assert arrays.effectiveness[0, 0] == 0
+    assert arrays.minimum[0, 0] == arrays.maximum[0, 0] == 1
+
+def test_two_hit_chance_matches_pair_table():
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        moves, defenders = rng.integers(1, 5, 2)
+        hp = rng.integers(1, 400, defenders).astype(np.float64)
+        outcomes = np.minimum(np.floor(rng.random((moves, defenders, 33)) * hp[None, :, None]), hp[None, :, None])
+        outcomes[..., -1] = 0  # A miss
+        weights = rng.random((moves, 33))
+        weights /= weights.sum(axis=1, keepdims=True)
+        pairs = (outcomes[..., :, None] + outcomes[..., None, :]) >= hp[None, :, None, None]
+        expected = (pairs * (weights[:, :, None] * weights[:, None, :])[:, None]).sum(axis=(-2, -1))
+        assert np.allclose(two_hit_chance(outcomes, weights, hp), expected, atol=1e-12)
+
+def test_damage_matrix_best_answers():
+    members = roster()
+    report = damage_matrix(members[:2], [members[2].pokemon])
+    assert report["defenders"] == ["onix"]
+    pikachu_moves = [entry["move"] for entry in report["attackers"][0]["moves"]]
+    assert pikachu_moves == ["thunderbolt", "surf", "quick-attack", "growl"]
+    surf = report["attackers"][0]["moves"][1]["vs"][0]
+    assert surf["effectiveness"] == 4.0 and surf["min"] <= surf["expected"] <= surf["max"]
+    best = max(((attacker["name"], move["move"], move["vs"][0]["expected"])
+                for attacker in report["attackers"] for move in attacker["moves"]), key=lambda entry: entry[2])
+    answer = report["best_answers"][0]
+    assert (answer["attacker"], answer["move"], answer["expected"]) == best
@@ -0,0 +1,52 @@
+from pokemon_mcp.battle.moves import move_from_slim
+from pokemon_mcp.data.learnset import Learnset
+from pokemon_mcp.data.move_table import MoveTable, load_snapshot, move_record, save_snapshot
+from pokemon_mcp.data.pokemon_client import pokemon_from_slim
+from pokemon_mcp.data.slim_json import MoveSlimmer, PokemonSlimmer
+from stub_pokeapi import MOVES, Stub
+
+STUB = Stub("http://127.0.0.1:1")
+
+def stub_moves():
+    return [move_from_slim(MoveSlimmer.from_document(STUB.move(name))) for name in MOVES]
+
+def stub_pokemon(name):
+    return pokemon_from_slim(PokemonSlimmer.from_document(STUB.pokemon(name)))
+
+def test_learnset():
+    learnset = Learnset(["tackle", "ember", "flamethrower", "fire-blast", "dig"],
+                        [("level-up", 1), ("level-up", 9), ("level-up", 55), ("machine", 0), ("egg", None)])
+    assert learnset.learnable(50) == ["tackle", "ember", "fire-blast", "dig"]
+    assert learnset.learnable(60) == list(learnset.moves)
+    assert learnset.by_method() == {"level-up": 3, "machine": 1, "egg": 1}
+    assert [m["name"] for m in learnset.level_up()] == ["tackle", "ember", "flamethrower"]
+    assert learnset.details()[4] == {"name": "dig", "method": "egg", "level": 0}
+    assert stub_pokemon("pikachu").learnset == stub_pokemon("pikachu").learnset
+
+def test_records_round_trip(tmp_path):
+    moves = stub_moves()
+    records = [move_record(move) for move in moves]
+    table = MoveTable(records)
+    assert table.to_records() == records
+    for move in moves:
+        shared = table.move(move.name)
+        assert table.move(move.name) is shared
+        assert (shared.type, shared.category, shared.power, shared.accuracy, shared.pp, shared.status_effect) == \
+               (move.type, move.category, move.power, move.accuracy, move.pp, move.status_effect)
+    assert table.move("splash") is None and "splash" not in table
+    save_snapshot(str(tmp_path), records)
+    assert load_snapshot(str(tmp_path)) == records
+
+def test_best_moveset_favours_coverage():
+    table = MoveTable([move_record(move) for move in stub_moves()])
+    charizard = stub_pokemon("charizard")
+    moveset = table.best_moveset(charizard)
+    # The strongest STAB move first, then moves that hit what fire cannot before a second fire move
+    assert moveset == ["fire-blast", "earthquake", "ice-beam", "flamethrower"]
+    assert table.best_moveset(charizard) is moveset
+    assert set(moveset) <= set(charizard.learnset.learnable(50))
+    # Slots left once coverage stops improving go to status moves
+    assert "hypnosis" in table.best_moveset(stub_pokemon("gengar"))
+    charizard.learnset = None
+    charizard.name = "charizard-without-learnset"
+    assert table.best_moveset(charizard) == []
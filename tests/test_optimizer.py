@@ -0,0 +1,73 @@
+from itertools import combinations
+import numpy as np
+from pokemon_mcp.battle.engine import BattlePokemon
+from pokemon_mcp.battle.moves import Move, MoveCategory
+from pokemon_mcp.battle.optimizer import BACKUP_WEIGHT, TeamOptimizer, matchup_matrix, optimize_team
+from pokemon_mcp.data.pokemon_client import Pokemon, PokemonStats
+
+def member(name, types, stats, moves):
+    battler = BattlePokemon(Pokemon(0, name, types, PokemonStats(*stats), [], []))
+    battler.moves = moves
+    battler.pp = [move.pp for move in moves]
+    return battler
+
+def team_score(scores, members):
+    ordered = np.sort(scores[list(members)], axis=0)
+    second = ordered[-2] if len(members) > 1 else np.zeros(scores.shape[1])
+    return float(((1 - BACKUP_WEIGHT) * ordered[-1] + BACKUP_WEIGHT * second).mean())
+
+def test_beam_search_finds_the_best_team():
+    rng = np.random.default_rng(4)
+    for _ in range(10):
+        scores = rng.random((9, 5))
+        teams, finished = TeamOptimizer(scores, team_size=3, beam_width=64).search(10.0)
+        best = max(combinations(range(9), 3), key=lambda members: team_score(scores, members))
+        assert finished
+        assert teams[0][0] == sorted(best)
+        assert abs(teams[0][1] - team_score(scores, best)) < 1e-9
+
+def test_team_size_is_clamped():
+    scores = np.random.default_rng(0).random((12, 3))
+    assert TeamOptimizer(scores, team_size=10).team_size == 6
+    assert TeamOptimizer(scores[:4], team_size=6).team_size == 4
+    assert TeamOptimizer(scores, team_size=0).team_size == 1
+    teams, _ = TeamOptimizer(scores, team_size=10).search(10.0)
+    assert all(len(members) == 6 for members, _ in teams)
+
+def test_out_of_time_search_reports_unfinished():
+    scores = np.random.default_rng(1).random((20, 4))
+    teams, finished = TeamOptimizer(scores, team_size=6).search(0.0)
+    assert not finished and teams
+    assert all(len(members) == 6 for members, _ in teams)
+
+SPLASH = Move("splash", "normal", MoveCategory.STATUS, 0, 100, 40)
+TACKLE = Move("tackle", "normal", MoveCategory.PHYSICAL, 40, 100, 35)
+THUNDERBOLT = Move("thunderbolt", "electric", MoveCategory.SPECIAL, 90, 100, 15)
+
+def test_matchup_matrix():
+    magikarp = member("magikarp", ["water"], (20, 10, 55, 15, 20, 80), [SPLASH])
+    rattata = member("rattata", ["normal"], (30, 56, 35, 25, 35, 72), [TACKLE])
+    pikachu = member("pikachu", ["electric"], (35, 55, 40, 50, 50, 90), [THUNDERBOLT])
+    scores = matchup_matrix([magikarp, rattata, pikachu], [magikarp, rattata])
+    assert scores[0, 0] == 0.5  # Neither side can do damage
+    assert scores[0, 1] == 0.0 and scores[1, 0] == 1.0
+    assert scores[2, 0] == 1.0 and 0.5 < scores[2, 1] < 1.0
+
+def test_optimize_team_report():
+    candidates = [member(name, [t], (60, 60, 60, 60, 60, speed), [move])
+                  for name, t, speed, move in (("pikachu", "electric", 90, THUNDERBOLT),
+                                               ("rattata", "normal", 72, TACKLE),
+                                               ("magikarp", "water", 80, SPLASH))]
+    opponents = [member("gyarados", ["water", "flying"], (95, 125, 79, 60, 100, 81), [TACKLE])]
+    result = optimize_team(candidates, opponents, team_size=1, top=2)
+    assert result["finished"]
+    assert result["teams"][0]["team"] == ["pikachu"]
+    assert result["teams"][0]["counters"]["gyarados"]["by"] == "pikachu"
+    assert len(result["teams"]) == 2
+
+def test_optimize_team_without_time_left():
+    candidates = [member(f"mon-{i}", ["normal"], (60, 60 + i, 60, 60, 60, 60 + i), [TACKLE]) for i in range(8)]
+    opponents = [member("gyarados", ["water", "flying"], (95, 125, 79, 60, 100, 81), [TACKLE])]
+    result = optimize_team(candidates, opponents, team_size=3, time_budget=0.0)
+    assert not result["finished"]
+    assert result["teams"] and all(len(entry["team"]) == 3 for entry in result["teams"])
@@ -0,0 +1,54 @@
+import asyncio
+import pytest
+from pokemon_mcp.config import ServerConfig
+from pokemon_mcp.data.http import close_http_client
+from pokemon_mcp.data.pokedex import PokedexIndex, load_pokedex, load_snapshot, parse_filter
+from pokemon_mcp.data.pokemon_client import PokemonClient
+
+RECORDS = [
+    [25, "pikachu", ["electric"], [35, 55, 40, 50, 50, 90], 4, 60],
+    [26, "raichu", ["electric"], [60, 90, 55, 90, 80, 110], 8, 300],
+    [4, "charmander", ["fire"], [39, 52, 43, 60, 50, 65], 6, 85],
+    [6, "charizard", ["fire", "flying"], [78, 84, 78, 109, 85, 100], 17, 905],
+    [5, "charmeleon", ["fire"], [58, 64, 58, 80, 65, 80], 11, 190],
+    [130, "gyarados", ["water", "flying"], [95, 125, 79, 60, 100, 81], 65, 2350],
+]
+
+def names(results):
+    return [entry["name"] for entry in results]
+
+def test_parse_filter():
+    assert parse_filter("Sp-Atk >= 100") == ("special_attack", ">=", 100.0)
+    assert parse_filter("bst=300") == ("total", "=", 300.0)
+    for bad in ("speed ~ 3", "charm > 2", "speed >"):
+        with pytest.raises(ValueError):
+            parse_filter(bad)
+
+def test_search():
+    index = PokedexIndex(RECORDS)
+    assert list(index.ids) == sorted(r[0] for r in RECORDS)
+    assert names(index.search("char")) == ["charizard", "charmander", "charmeleon"]
+    assert names(index.search("pikachoo", mode="fuzzy")) == ["pikachu"]
+    assert names(index.search("pikachoo", mode="prefix")) == []
+    assert names(index.search("pikachoo")) == ["pikachu"]  # auto falls back to fuzzy
+    assert names(index.search(types=["flying"], filters=["speed > 90"])) == ["charizard"]
+    assert names(index.search(filters=["total >= 500"], limit=1)) == ["charizard"]
+    entry = index.entry(index.position("25"))
+    assert entry["stats"]["speed"] == 90 and entry["total"] == 320 and entry["types"] == ["electric"]
+    with pytest.raises(ValueError):
+        index.search(types=["cosmic"])
+
+def test_build_and_snapshot(stub_api, tmp_path):
+    base_url, stub = stub_api
+
+    async def scenario():
+        client = PokemonClient(ServerConfig(pokeapi_base_url=base_url))
+        try:
+            return await load_pokedex(client, str(tmp_path), concurrency=4)
+        finally:
+            await close_http_client()
+
+    index = asyncio.run(scenario())
+    assert len(index) == len(stub.SPECIES)
+    assert index.entry(index.position("garchomp"))["types"] == ["dragon", "ground"]
+    assert PokedexIndex(load_snapshot(str(tmp_path))).to_records() == index.to_records()
@@ -0,0 +1,52 @@
+import asyncio
+from array import array
+from pokemon_mcp.battle import pool as pool_module
+from pokemon_mcp.battle.pool import ROW_SIZE, SimulationPool
+from battlers import team
+
+def test_series_match_in_process_battles():
+    team1, team2 = team("pikachu", "charmander"), team("squirtle", "bulbasaur", "eevee")
+
+    async def scenario():
+        pool = SimulationPool(workers=2, chunk_size=7, max_turns=50)
+        try:
+            first = await pool.run_series(team1, team2, 20, seed=11)
+            again = await pool.run_series(team1, team2, 20, seed=11)
+            return pool, first, again
+        finally:
+            pool.shutdown()
+
+    pool, first, again = asyncio.run(scenario())
+    assert first.rows == again.rows and len(first.rows) == 20 * ROW_SIZE
+    summary = first.summary()
+    assert summary["battles"] == 20 and sum(summary["wins"].values()) == 20
+
+    # The same chunks played here, with the worker functions, give the same rows
+    pool_module._init_worker({"max_turns": 50})
+    entries1 = [pool.entry(m) for m in team1]
+    entries2 = [pool.entry(m) for m in team2]
+    expected = array('i')
+    for i, size in enumerate((7, 7, 6)):
+        expected.extend(pool_module._run_series(entries1, entries2, size, 11 + i, None))
+    assert first.rows == expected
+
+    for winner, turns, hp in first.outcomes(2, 3):
+        assert winner in (0, 1, 2) and turns >= 1 and len(hp) == 5
+
+def test_tournament_standings():
+    teams = {"electric": team("pikachu"), "fire": team("charmander"), "water": team("squirtle")}
+
+    async def scenario():
+        pool = SimulationPool(workers=1)
+        try:
+            return await pool.tournament(teams, n=10, seed=3)
+        finally:
+            pool.shutdown()
+
+    result = asyncio.run(scenario())
+    assert len(result["matches"]) == 3
+    assert {entry["team"] for entry in result["ranking"]} == set(teams)
+    for entry in result["ranking"]:
+        assert entry["wins"] + entry["losses"] + entry["draws"] == 20
+    rates = [entry["win_rate"] for entry in result["ranking"]]
+    assert rates == sorted(rates, reverse=True)
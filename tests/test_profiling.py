@@ -0,0 +1,100 @@
+import asyncio
+import pstats
+import threading
+from pokemon_mcp.profiling import Profiler, current_session, hot_spots
+from pokemon_mcp.scheduler import ToolScheduler
+
+def spin(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+def test_cprofile_covers_the_worker_threads(tmp_path):
+    profiler = Profiler(str(tmp_path), sample_rate=1.0)
+    scheduler = ToolScheduler(cpu_workers=2)
+
+    async def call():
+        assert not profiler.sample()  # Never nests inside a profiled call
+        return await scheduler.run_cpu(spin, 20000)
+
+    try:
+        assert asyncio.run(profiler.run("spin", call)) == spin(20000)
+    finally:
+        scheduler.shutdown()
+    assert profiler.profiled == 1 and profiler.recent[0].endswith("-spin.pstats")
+    functions = {name for _, _, name in pstats.Stats(profiler.recent[0]).stats}
+    assert "spin" in functions
+    report = hot_spots(str(tmp_path))
+    assert report["cprofile"]["profiles"] == 1
+
+def test_overlapping_sessions_share_the_event_loop_thread(tmp_path):
+    profiler = Profiler(str(tmp_path), sample_rate=1.0)
+
+    async def scenario():
+        first_in = asyncio.Event()
+        release = asyncio.Event()
+
+        async def first():
+            first_in.set()
+            await release.wait()
+            return spin(1000)
+
+        async def second():
+            await first_in.wait()
+            assert not profiler.sample()  # The loop thread is already profiled by first()
+            # A session started anyway must not take over the live profiler
+            result = await profiler.run("second", lambda: asyncio.sleep(0, spin(1000)))
+            release.set()
+            return result
+
+        return await asyncio.gather(profiler.run("first", first), second())
+
+    assert asyncio.run(scenario()) == [spin(1000), spin(1000)]
+    assert profiler.profiled == 1 and profiler.recent[0].endswith("-first.pstats")
+    assert profiler.sample()  # Free again once both sessions ended
+
+def test_sample_mode_writes_collapsed_stacks(tmp_path):
+    profiler = Profiler(str(tmp_path), sample_rate=1.0, mode="sample", interval=0.001)
+    done = threading.Event()
+
+    def busy():
+        while not done.is_set():
+            spin(100)
+
+    async def call():
+        worker = threading.Thread(target=current_session().wrap(busy))
+        worker.start()
+        await asyncio.sleep(0.05)
+        done.set()
+        worker.join()
+
+    asyncio.run(profiler.run("busy", call))
+    with open(profiler.recent[0], encoding="utf-8") as f:
+        stacks = f.read()
+    assert profiler.recent[0].endswith(".folded") and "busy (test_profiling.py" in stacks
+    assert hot_spots(str(tmp_path))["sampled"]["samples"] > 0
+
+def test_battles_are_profiled_through_run_turns(tmp_path):
+    from pokemon_mcp.battle.engine import BattleEngine, BattleState
+    from pokemon_mcp.profiling import disable_profiling, enable_profiling
+    from battlers import member
+
+    engine = BattleEngine(policy="heuristic")
+
+    async def prepare(pokemon1, pokemon2):
+        return member("pikachu"), member("squirtle")
+
+    engine.prepare = prepare
+    profiler = enable_profiling(str(tmp_path), sample_rate=1.0)
+    try:
+        # Driven turn by turn like the server's simulate_battle tool
+        state = BattleState(member("pikachu"), member("squirtle"), 50)
+        events = list(engine.run_turns(state))
+        assert events[-1].winner == state.winner and profiler.profiled == 1
+        result = asyncio.run(engine.simulate_battle(None, None))
+        assert result.winner in ("pikachu", "squirtle", "Draw") and result.total_turns >= 1
+        assert profiler.profiled == 2 and profiler.recent[-1].endswith("-engine.run_turns.pstats")
+    finally:
+        disable_profiling()
+    assert not hasattr(BattleEngine.run_turns, "__wrapped__")
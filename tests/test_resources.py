@@ -0,0 +1,53 @@
+import asyncio
+import json
+import pytest
+from pokemon_mcp.battle.moves import MoveClient
+from pokemon_mcp.config import ServerConfig
+from pokemon_mcp.data.http import close_http_client
+from pokemon_mcp.data.pokemon_client import PokemonClient
+from pokemon_mcp.resources import BodyCache, read_template
+
+def test_body_cache_tracks_its_source():
+    bodies = BodyCache(max_size=2)
+    source = object()
+    bodies.set("a", source, "A")
+    assert bodies.get("a", source) == "A"
+    assert bodies.get("a", object()) is None  # Built from data that has since been replaced
+    bodies.set("b", source, "B")
+    bodies.get("a", source)
+    bodies.set("c", source, "C")  # Evicts the least recently used body
+    assert bodies.get("b", source) is None and bodies.get("a", source) == "A"
+
+def test_templates(stub_api):
+    base_url, stub = stub_api
+
+    async def scenario():
+        config = ServerConfig(pokeapi_base_url=base_url)
+        pokemon_client, move_client = PokemonClient(config), MoveClient(config)
+        bodies = BodyCache()
+        read = lambda uri: read_template(uri, bodies, pokemon_client, move_client)
+        try:
+            body, version = await read("pokemon://pokemon/Pikachu")
+            pikachu = json.loads(body)
+            assert pikachu["name"] == "pikachu" and version == 1 and pikachu["stats"]["total"] == 320
+            assert pikachu["evolution"] == "pokemon://evolution/pikachu"
+            assert (await read("pokemon://pokemon/Pikachu"))[0] is body  # Served from the body cache
+            pokemon_client.invalidate(["pikachu"])
+            assert (await read("pokemon://pokemon/Pikachu"))[0] is not body
+
+            move, _ = await read("pokemon://move/Body%20Slam")
+            assert json.loads(move)["status_effect"] == "paralysis"
+
+            evolution, version = await read("pokemon://evolution/raichu")
+            assert version is None and json.loads(evolution)["pre_evolutions"] == ["pikachu", "pichu"]
+
+            assert await read("pokemon://types/fire") is None
+            assert await read("https://pokeapi.co") is None
+            with pytest.raises(ValueError):
+                await read("pokemon://pokemon/missingno")
+            with pytest.raises(ValueError):
+                await read("pokemon://move/splash")
+        finally:
+            await close_http_client()
+
+    asyncio.run(scenario())
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import pytest
+from pokemon_mcp.scheduler import ToolLimits, ToolOverloaded, ToolScheduler, ToolTimeout
+
+def test_queue_is_bounded_and_calls_are_shed():
+    scheduler = ToolScheduler({"battle": ToolLimits(concurrency=1, queue_size=1, timeout=5.0)})
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(scheduler.run("battle", slow))
+        await asyncio.sleep(0)
+        queued = asyncio.ensure_future(scheduler.run("battle", slow))
+        await asyncio.sleep(0)
+        with pytest.raises(ToolOverloaded):
+            await scheduler.run("battle", slow)
+        assert await scheduler.run("lookup", lambda: asyncio.sleep(0, "other lane")) == "other lane"
+        release.set()
+        return await asyncio.gather(first, queued)
+
+    assert asyncio.run(scenario()) == ["done", "done"]
+    stats = scheduler.stats()
+    assert stats["battle"] == {"running": 0, "waiting": 0, "completed": 2, "shed": 1, "timed_out": 0}
+
+def test_overrunning_cpu_work_keeps_its_slot():
+    scheduler = ToolScheduler({"battle": ToolLimits(concurrency=1, queue_size=4, timeout=0.05)}, cpu_workers=1)
+    release = threading.Event()
+    queued_ran = threading.Event()
+
+    async def scenario():
+        async def stuck():
+            await scheduler.run_cpu(release.wait)
+
+        async def second():
+            # Queued behind the stuck thread in the one-thread executor, so it never starts
+            await asyncio.gather(scheduler.run_cpu(release.wait), scheduler.run_cpu(queued_ran.set))
+
+        with pytest.raises(ToolTimeout):
+            await scheduler.run("battle", second)
+        with pytest.raises(ToolTimeout):
+            await scheduler.run("battle", stuck)
+        return scheduler.stats()["battle"]
+
+    try:
+        # The first call's thread still runs, so the second waits for the slot and times out
+        stats = asyncio.run(scenario())
+    finally:
+        release.set()
+        scheduler.shutdown()
+    assert stats["timed_out"] == 2 and stats["running"] == 1
+    assert not queued_ran.is_set()
+
+def test_slot_is_freed_when_the_thread_finishes():
+    scheduler = ToolScheduler({"battle": ToolLimits(concurrency=1, timeout=0.05)}, cpu_workers=1)
+    release = threading.Event()
+
+    async def scenario():
+        with pytest.raises(ToolTimeout):
+            await scheduler.run("battle", lambda: scheduler.run_cpu(release.wait))
+        assert scheduler.stats()["battle"]["running"] == 1
+        release.set()
+        return await scheduler.run("battle", lambda: scheduler.run_cpu(sum, [1, 2, 3]))
+
+    try:
+        assert asyncio.run(scenario()) == 6
+    finally:
+        scheduler.shutdown()
+    assert scheduler.stats()["battle"]["running"] == 0
+
+def test_iterate_cpu_yields_every_item():
+    scheduler = ToolScheduler()
+
+    async def scenario():
+        return [item async for item in scheduler.iterate_cpu(iter(range(5)))]
+
+    try:
+        assert asyncio.run(scenario()) == list(range(5))
+    finally:
+        scheduler.shutdown()
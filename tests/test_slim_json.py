@@ -0,0 +1,63 @@
+import json
+import random
+import pytest
+from pokemon_mcp.data.slim_json import MoveSlimmer, PathWalker, PokemonSlimmer
+from stub_pokeapi import MOVES, SPECIES, Stub
+
+ijson = pytest.importorskip("ijson")
+
+def stream(document, slimmer_class, seed):
+    """Slim a document through ijson and the PathWalker, fed in random-sized chunks"""
+    rng = random.Random(seed)
+    body = json.dumps(document).encode()
+    slimmer = slimmer_class()
+    walker = PathWalker(slimmer_class.PATHS, slimmer.on_value)
+    events = ijson.sendable_list()
+    parser = ijson.basic_parse_coro(events)
+    position = 0
+    while position < len(body):
+        size = rng.randint(1, 64)
+        parser.send(body[position:position + size])
+        position += size
+        walker.feed(events)
+        del events[:]
+    parser.close()
+    walker.feed(events)
+    return slimmer.result
+
+def noisy_pokemon(stub, name, rng):
+    """A stub payload with the bulk the real API adds: extra version groups and ignored sections"""
+    document = stub.pokemon(name)
+    for move in document["moves"]:
+        older = {"level_learned_at": rng.randint(0, 60), "move_learn_method": {"name": "tutor"},
+                 "version_group": {"name": "red-blue"}}
+        move["version_group_details"].insert(0, older)
+    document["game_indices"] = [{"game_index": i, "version": {"name": f"v{i}"}} for i in range(20)]
+    document["sprites"]["other"] = {"home": {"front_default": "x", "nested": [[1, 2], {"a": None}]}}
+    return document
+
+def test_streamed_pokemon_matches_full_parse():
+    stub = Stub("http://127.0.0.1:1")
+    rng = random.Random(2)
+    for seed, name in enumerate(SPECIES):
+        document = noisy_pokemon(stub, name, rng)
+        slim = stream(document, PokemonSlimmer, seed)
+        assert slim == PokemonSlimmer.from_document(document)
+        assert all(method == "level-up" or method == "machine" for method, _ in slim["learn_details"])
+
+def test_streamed_move_keeps_the_first_english_text():
+    stub = Stub("http://127.0.0.1:1")
+    for seed, name in enumerate(MOVES):
+        document = stub.move(name)
+        document["flavor_text_entries"].insert(0, {"flavor_text": "Texte", "language": {"name": "fr"}})
+        document["flavor_text_entries"].append({"flavor_text": "Later text", "language": {"name": "en"}})
+        slim = stream(document, MoveSlimmer, seed)
+        assert slim == MoveSlimmer.from_document(document)
+        assert slim["flavor_text"] == f"A stub {name} move."
+
+def test_path_walker_skips_unwanted_subtrees():
+    seen = []
+    walker = PathWalker({("a", "item", "b")}, lambda path, value: seen.append(value))
+    document = {"x": {"b": 1, "a": [{"b": 0}]}, "a": [{"b": 2, "c": {"b": 9}}, {"c": [1], "b": 3}], "b": 4}
+    walker.feed(ijson.basic_parse(json.dumps(document).encode()))
+    assert seen == [2, 3]
@@ -0,0 +1,56 @@
+import asyncio
+import base64
+import json
+import os
+from urllib.request import urlopen
+from pokemon_mcp.data import sprites
+from pokemon_mcp.data.http import close_http_client
+from pokemon_mcp.data.sprites import SpriteCache, image_mime_type
+
+def rest_requests(root: str) -> int:
+    with urlopen(f"{root}/stats") as response:
+        return json.load(response)["rest"]
+
+def test_image_mime_type():
+    assert image_mime_type(b"\x89PNG\r\n") == "image/png"
+    assert image_mime_type(b"GIF89a") == "image/gif"
+    assert image_mime_type(b"<html>") is None
+
+def test_sprites_are_fetched_once(stub_api, tmp_path, monkeypatch):
+    base_url, stub = stub_api
+    root = base_url.replace("/api/v2", "")
+    monkeypatch.setattr(sprites, "INDEX_SAVE_DELAY", 0.01)
+    url = f"{root}/sprites/25.png"
+
+    async def scenario():
+        cache = SpriteCache(str(tmp_path), memory_bytes=1)
+        cache.can_downscale = False  # The stub's images are only signatures
+        try:
+            before = rest_requests(root)
+            results = await asyncio.gather(*(cache.get(url) for _ in range(5)))
+            assert rest_requests(root) == before + 1  # One shared download
+            encoded, mime_type = results[0]
+            assert mime_type == "image/png" and base64.b64decode(encoded).startswith(b"\x89PNG")
+            assert all(result == results[0] for result in results)
+
+            # The memory budget keeps one body; the other comes back from disk
+            other = await cache.get(f"{root}/sprites/4.png")
+            assert list(cache._memory) == [f"{root}/sprites/4.png"] and other != results[0]
+            assert await cache.get(url) == results[0]
+            assert rest_requests(root) == before + 2
+            await cache._index_saver
+
+            assert await cache.get(f"{root}/api/v2/pokemon/25") is None  # Not an image
+            assert await cache.get("") is None
+
+            # A new process finds the sprites through the saved index
+            reopened = SpriteCache(str(tmp_path))
+            reopened.can_downscale = False
+            assert await reopened.get(url) == results[0]
+            assert rest_requests(root) == before + 3  # Only the non-image was fetched since
+        finally:
+            await close_http_client()
+
+    asyncio.run(scenario())
+    with open(os.path.join(tmp_path, "index.json"), encoding="utf-8") as f:
+        assert len(json.load(f)["urls"]) == 2
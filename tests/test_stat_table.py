@@ -0,0 +1,73 @@
+import random
+import statistics
+import pytest
+from pokemon_mcp.battle.mechanics import TYPE_NAMES
+from pokemon_mcp.data.pokedex import PokedexIndex, STAT_NAMES
+from pokemon_mcp.data.stat_table import StatTable
+
+def make_records(count=300, seed=9):
+    rng = random.Random(seed)
+    return [[i, f"mon-{i}", rng.sample(TYPE_NAMES, rng.randint(1, 2)),
+             [rng.randint(5, 255) for _ in STAT_NAMES], rng.randint(1, 200), rng.randint(1, 9999)]
+            for i in rng.sample(range(1, 2000), count)]
+
+@pytest.fixture(scope="module")
+def records():
+    return make_records()
+
+@pytest.fixture(scope="module")
+def table(records):
+    return StatTable(PokedexIndex(records))
+
+def test_columns_share_the_index(table, records):
+    assert len(table) == len(records)
+    by_id = {r[0]: r for r in records}
+    for i in range(len(table)):
+        record = by_id[int(table.ids[i])]
+        assert table.names[i] == record[1]
+        assert list(table.stats[i]) == record[3]
+        assert table.totals[i] == sum(record[3])
+    with pytest.raises(ValueError):
+        table.column("charm")
+
+def test_mask_matches_python_filters(table, records):
+    expected = sorted(r[1] for r in records if "fire" in r[2] and r[3][5] > 100 and sum(r[3]) <= 900)
+    selected = table.mask(types=["fire"], filters=["speed > 100", "total <= 900"])
+    assert sorted(table.names[selected]) == expected
+    with pytest.raises(ValueError):
+        table.mask(types=["cosmic"])
+
+def test_rank_breaks_ties_by_id(table, records):
+    ranked = table.rank("attack", n=15)
+    expected = sorted(records, key=lambda r: (-r[3][1], r[0]))[:15]
+    assert [row["name"] for row in ranked] == [r[1] for r in expected]
+    assert [row["rank"] for row in ranked] == list(range(1, 16))
+    lowest = table.rank("speed", n=5, ascending=True, types=["water"])
+    water = sorted((r for r in records if "water" in r[2]), key=lambda r: (r[3][5], r[0]))[:5]
+    assert [row["name"] for row in lowest] == [r[1] for r in water]
+    assert table.rank("hp", n=0) == []
+
+def test_percentile(table, records):
+    record = records[0]
+    result = table.percentile(record[1], "hp")
+    values = [r[3][0] for r in records]
+    below = sum(v < record[3][0] for v in values)
+    equal = sum(v == record[3][0] for v in values)
+    assert result["percentile"] == round(100.0 * (below + 0.5 * equal) / len(values), 1)
+    assert result["rank"] == sum(v > record[3][0] for v in values) + 1
+    assert table.percentile(str(record[0]), "hp") == result
+    with pytest.raises(ValueError):
+        table.percentile("missingno", "hp")
+
+def test_aggregate(table, records):
+    summary = table.aggregate("defense")["all"]
+    values = [r[3][2] for r in records]
+    assert summary["count"] == len(values)
+    assert summary["mean"] == round(statistics.fmean(values), 1)
+    assert summary["median"] == statistics.median(values)
+    assert (summary["min"], summary["max"]) == (min(values), max(values))
+    groups = table.aggregate("defense", group_by="type")
+    for type_name, group in groups.items():
+        assert group["count"] == sum(type_name in r[2] for r in records)
+    with pytest.raises(ValueError):
+        table.aggregate("defense", group_by="color")
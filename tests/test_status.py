@@ -0,0 +1,71 @@
+import random
+from pokemon_mcp.battle.moves import Move, MoveCategory, StatusEffect
+from pokemon_mcp.battle.status import (NO_STATUS, BURN, POISON, PARALYSIS, SLEEP, FREEZE, before_move, check_can_move,
+                                       end_of_turn, inflict_chance, is_immune, residual_damage, roll_status,
+                                       status_code)
+
+def test_status_codes_and_immunities():
+    assert status_code(None) == NO_STATUS
+    assert status_code(StatusEffect.SLEEP) == SLEEP
+    assert is_immune(BURN, ["fire", "flying"])
+    assert is_immune(POISON, ["steel"])
+    assert not is_immune(SLEEP, ["electric"])
+    assert not is_immune(NO_STATUS, ["fire"])
+
+def test_inflict_chance():
+    thunder_wave = Move("thunder-wave", "electric", MoveCategory.STATUS, 0, 90, 20, StatusEffect.PARALYSIS)
+    ember = Move("ember", "fire", MoveCategory.SPECIAL, 40, 100, 25, StatusEffect.BURN, 0.1)
+    tackle = Move("tackle", "normal", MoveCategory.PHYSICAL, 40, 100, 35)
+    assert inflict_chance(thunder_wave) == 1.0
+    assert inflict_chance(ember) == 0.1
+    assert inflict_chance(tackle) == 0.0
+
+def test_residual_damage():
+    assert residual_damage(BURN, 160) == 10
+    assert residual_damage(POISON, 160) == 20
+    assert residual_damage(BURN, 10) == 1  # Never less than 1
+    assert residual_damage(PARALYSIS, 160) == 0
+
+def test_check_can_move_rates():
+    random.seed(7)
+    trials = 20000
+    paralyzed = sum(not check_can_move(PARALYSIS, 0)[0] for _ in range(trials)) / trials
+    thawed = sum(check_can_move(FREEZE, 0)[1] == NO_STATUS for _ in range(trials)) / trials
+    assert abs(paralyzed - 0.25) < 0.02
+    assert abs(thawed - 0.2) < 0.02
+    assert check_can_move(SLEEP, 2) == (False, SLEEP, 1)
+    assert check_can_move(SLEEP, 0) == (True, NO_STATUS, 0)
+    assert check_can_move(BURN, 0) == (True, BURN, 0)
+
+def test_before_move_logs():
+    log = []
+    assert before_move("snorlax", SLEEP, 1, log.append) == (False, SLEEP, 0)
+    assert before_move("snorlax", SLEEP, 0, log.append) == (True, NO_STATUS, 0)
+    assert log == ["snorlax is fast asleep!", "snorlax woke up!"]
+    assert before_move("snorlax", SLEEP, 0) == (True, NO_STATUS, 0)  # No log, no error
+
+def test_roll_status():
+    random.seed(3)
+    log = []
+    code, turns = roll_status("pikachu", SLEEP, NO_STATUS, 50, False, 1.0, log.append)
+    assert code == SLEEP and 1 <= turns <= 3
+    assert log == ["pikachu fell asleep!"]
+    assert roll_status("pikachu", BURN, NO_STATUS, 50, False, 1.0) == (BURN, 0)
+
+    # Blocked attempts return before rolling, so they leave the random sequence untouched
+    state = random.getstate()
+    assert roll_status("pikachu", NO_STATUS, NO_STATUS, 50, False, 1.0) is None
+    assert roll_status("pikachu", BURN, POISON, 50, False, 1.0) is None
+    assert roll_status("pikachu", BURN, NO_STATUS, 0, False, 1.0) is None
+    assert roll_status("pikachu", BURN, NO_STATUS, 50, True, 1.0) is None
+    assert random.getstate() == state
+    assert roll_status("pikachu", BURN, NO_STATUS, 50, False, 0.0) is None
+
+def test_end_of_turn():
+    log = []
+    assert end_of_turn("bulbasaur", POISON, 30, 20, log.append) == 10
+    assert end_of_turn("bulbasaur", POISON, 10, 20, log.append) == 0
+    assert end_of_turn("bulbasaur", POISON, 0, 20, log.append) == 0
+    assert end_of_turn("bulbasaur", NO_STATUS, 30, 0, log.append) == 30
+    assert log == ["bulbasaur is hurt by poison! (20 damage)", "bulbasaur is hurt by poison! (20 damage)",
+                   "bulbasaur fainted!"]
@@ -0,0 +1,50 @@
+import random
+import pytest
+from pokemon_mcp.battle.engine import BattleEngine, BattleState
+from pokemon_mcp.battle.team import TeamBattle
+from battlers import member, team
+
+ENGINE = BattleEngine(policy="heuristic")
+
+def test_replays_are_reproducible():
+    battle = TeamBattle(ENGINE, team("pikachu", "bulbasaur", "eevee"), team("charmander", "squirtle"))
+    results = []
+    for log in (True, True, False):
+        random.seed(5)
+        results.append(battle.run(log=log))
+    first, again, quiet = results
+    assert [l.message for l in first.logs] == [l.message for l in again.logs]
+    # Logging does not consume random numbers
+    assert (quiet.winner, quiet.total_turns, quiet.knockouts) == (first.winner, first.total_turns, first.knockouts)
+    assert quiet.logs == [] and first.remaining == quiet.remaining
+
+def test_knockouts_match_the_remaining_parties():
+    battle = TeamBattle(ENGINE, team("pikachu", "charmander"), team("squirtle", "bulbasaur", "eevee"))
+    for seed in range(20):
+        random.seed(seed)
+        result = battle.run(log=False)
+        fainted = {side: sum(m["hp"] == 0 for m in members) for side, members in result.remaining.items()}
+        assert result.knockouts == {"team1": fainted["team2"], "team2": fainted["team1"]}
+        if result.winner != "Draw":
+            assert all(m["hp"] == 0 for m in result.remaining[result.loser]) or result.total_turns == 300
+
+def test_one_on_one_matches_the_engine():
+    for seed in range(10):
+        random.seed(seed)
+        result = TeamBattle(ENGINE, [member("pikachu")], [member("bulbasaur")]).run(50)
+        random.seed(seed)
+        state = BattleState(member("pikachu"), member("bulbasaur"), 50)
+        engine_logs = [l for event in ENGINE.run_turns(state) for l in event.logs]
+        assert [m["hp"] for m in result.remaining["team1"] + result.remaining["team2"]] == \
+               [state.p1.current_hp, state.p2.current_hp]
+        assert result.total_turns == state.turn
+        # Both engines resolve moves with the same messages
+        turns = lambda logs: [(l.turn, l.message) for l in logs if "Turn" not in l.message and "Battle" not in l.message
+                              and not l.message.startswith(("team", "pikachu types", "bulbasaur types"))]
+        assert turns(result.logs) == turns(engine_logs)
+
+def test_team_size_is_checked():
+    with pytest.raises(ValueError):
+        TeamBattle(ENGINE, [], team("eevee"))
+    with pytest.raises(ValueError):
+        TeamBattle(ENGINE, team("eevee"), [member("eevee") for _ in range(7)])
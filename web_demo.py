@@ -5,9 +5,11 @@ A lightweight Flask app to demonstrate Pokemon features
 NOTE: This is NOT how MCP works in production - it's for testing only
 """
 import asyncio
+import json
 import sys
+import threading
 from pathlib import Path
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, Response, render_template_string, request, jsonify
 
 # Add the src directory to the path
 src_path = Path(__file__).parent / "src"
@@ -22,6 +24,15 @@ app = Flask(__name__)
 pokemon_client = PokemonClient()
 battle_engine = BattleEngine()
 
+# One long-lived event loop shared by all requests, so the async HTTP clients
+# keep their connection pools across requests
+loop = asyncio.new_event_loop()
+threading.Thread(target=loop.run_forever, daemon=True).start()
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
@@ -178,40 +189,45 @@ HTML_TEMPLATE = """
                 return;
             }
             
-            result.innerHTML = '<div class="result">⚔️ Simulating battle...</div>';
+            result.innerHTML = `
+                <div class="result success">
+                    <h3 id="battle-status">⚔️ Battle in progress...</h3>
+                    <h4>📜 Battle Log:</h4>
+                    <div class="battle-log" id="battle-log"></div>
+                </div>
+            `;
+            const log = document.getElementById('battle-log');
+            const status = document.getElementById('battle-status');
             
-            try {
-                const response = await fetch('/api/battle', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ pokemon1, pokemon2 })
-                });
-                
-                const data = await response.json();
-                
-                if (data.success) {
-                    const b = data.battle;
-                    result.innerHTML = `
-                        <div class="result success">
-                            <h3>🏆 Winner: ${b.winner.charAt(0).toUpperCase() + b.winner.slice(1)}</h3>
-                            <p>💀 Defeated: ${b.loser.charAt(0).toUpperCase() + b.loser.slice(1)}</p>
-                            <p>🕐 Battle lasted ${b.total_turns} turns</p>
-                            <h4>📜 Battle Log:</h4>
-                            <div class="battle-log">
-                                ${b.logs.map(log => `
-                                    <div class="log-entry ${log.message.includes('Turn') ? 'turn-header' : ''}">
-                                        ${log.message}
-                                    </div>
-                                `).join('')}
-                            </div>
-                        </div>
-                    `;
-                } else {
-                    result.innerHTML = `<div class="result error">❌ ${data.error}</div>`;
+            const appendLogs = (logs) => {
+                for (const entry of logs) {
+                    const div = document.createElement('div');
+                    div.className = 'log-entry' + (entry.message.includes('Turn') ? ' turn-header' : '');
+                    div.textContent = entry.message;
+                    log.appendChild(div);
                 }
-            } catch (error) {
-                result.innerHTML = `<div class="result error">❌ Error: ${error.message}</div>`;
-            }
+                log.scrollTop = log.scrollHeight;
+            };
+            
+            const params = new URLSearchParams({ pokemon1, pokemon2 });
+            const source = new EventSource(`/api/battle/stream?${params}`);
+            
+            source.addEventListener('turn', (e) => appendLogs(JSON.parse(e.data).logs));
+            source.addEventListener('result', (e) => {
+                const b = JSON.parse(e.data);
+                appendLogs(b.logs);
+                status.outerHTML = `
+                    <h3>🏆 Winner: ${b.winner.charAt(0).toUpperCase() + b.winner.slice(1)}</h3>
+                    <p>💀 Defeated: ${b.loser.charAt(0).toUpperCase() + b.loser.slice(1)}</p>
+                    <p>🕐 Battle lasted ${b.total_turns} turns</p>
+                `;
+                source.close();
+            });
+            source.addEventListener('error', (e) => {
+                source.close();
+                const message = e.data ? JSON.parse(e.data).error : 'Connection to the battle stream was lost';
+                result.innerHTML = `<div class="result error">❌ ${message}</div>`;
+            });
         }
     </script>
 </body>
@@ -225,16 +241,14 @@ def index():
 @app.route('/api/pokemon/<name>')
 def get_pokemon_api(name):
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        pokemon = loop.run_until_complete(pokemon_client.get_pokemon(name.lower()))
+        pokemon = run_async(pokemon_client.get_pokemon(name.lower()))
         
         if pokemon:
             # Fetch evolution chain data
             evolution_chain = []
             try:
                 if hasattr(pokemon, 'species_url') and pokemon.species_url:
-                    evolution_data = loop.run_until_complete(pokemon_client.get_evolution_chain(pokemon.species_url))
+                    evolution_data = run_async(pokemon_client.get_evolution_chain(pokemon.species_url))
                     if evolution_data and 'evolution_chain' in evolution_data:
                         evolution_chain = evolution_data['evolution_chain']
             except Exception as e:
@@ -278,12 +292,9 @@ def battle_api():
         if not pokemon1_name or not pokemon2_name:
             return jsonify({'success': False, 'error': 'Both Pokemon names required'})
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
         # Fetch Pokemon
-        pokemon1 = loop.run_until_complete(pokemon_client.get_pokemon(pokemon1_name.lower()))
-        pokemon2 = loop.run_until_complete(pokemon_client.get_pokemon(pokemon2_name.lower()))
+        pokemon1 = run_async(pokemon_client.get_pokemon(pokemon1_name.lower()))
+        pokemon2 = run_async(pokemon_client.get_pokemon(pokemon2_name.lower()))
         
         if not pokemon1:
             return jsonify({'success': False, 'error': f'Pokemon "{pokemon1_name}" not found. Please check spelling.'})
@@ -291,7 +302,7 @@ def battle_api():
             return jsonify({'success': False, 'error': f'Pokemon "{pokemon2_name}" not found. Please check spelling.'})
         
         # Simulate battle (FIXED: Now properly async)
-        result = loop.run_until_complete(battle_engine.simulate_battle(pokemon1, pokemon2))
+        result = run_async(battle_engine.simulate_battle(pokemon1, pokemon2))
         
         return jsonify({
             'success': True,
@@ -306,6 +317,50 @@ def battle_api():
     except Exception as e:
         return jsonify({'success': False, 'error': f'Battle simulation error: {str(e)}'})
 
+@app.route('/api/battle/stream')
+def battle_stream_api():
+    """Stream a battle turn by turn as server-sent events"""
+    pokemon1_name = request.args.get('pokemon1', '')
+    pokemon2_name = request.args.get('pokemon2', '')
+    
+    def sse(event: str, payload: dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+    
+    def generate():
+        if not pokemon1_name or not pokemon2_name:
+            yield sse('error', {'error': 'Both Pokemon names required'})
+            return
+        
+        pokemon1 = run_async(pokemon_client.get_pokemon(pokemon1_name.lower()))
+        pokemon2 = run_async(pokemon_client.get_pokemon(pokemon2_name.lower()))
+        for requested, pokemon in ((pokemon1_name, pokemon1), (pokemon2_name, pokemon2)):
+            if not pokemon:
+                yield sse('error', {'error': f'Pokemon "{requested}" not found. Please check spelling.'})
+                return
+        
+        stream = battle_engine.stream_battle(pokemon1, pokemon2)
+        try:
+            while True:
+                try:
+                    event = run_async(stream.__anext__())
+                except StopAsyncIteration:
+                    break
+                payload = {
+                    'turn': event.turn,
+                    'hp': list(event.hp),
+                    'logs': [{'turn': log.turn, 'message': log.message} for log in event.logs]
+                }
+                if event.is_final:
+                    payload.update(winner=event.winner, loser=event.loser, total_turns=event.turn)
+                    yield sse('result', payload)
+                else:
+                    yield sse('turn', payload)
+        finally:
+            run_async(stream.aclose())
+    
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 if __name__ == '__main__':
     print("🌟 Starting Pokemon MCP Server Web Demo...")
     print("⚠️  IMPORTANT: This is a DEVELOPMENT DEMO only!")
@@ -316,4 +371,4 @@ if __name__ == '__main__':
     print("   • Clean, responsive web interface")
     print("\n🚀 Access the demo at: http://localhost:5000")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file